@@ -0,0 +1,44 @@
+"""Cost of passing type checks on all elements of large containers.
+
+For built-in containers, `All` decides whether all elements pass with
+built-ins running at C speed and only falls back to checking element by
+element to report the first offender. Subclasses of list are not eligible
+and thus still take the per-element path, which serves as the reference.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_all
+
+"""
+from timeit import repeat
+from checkerpy.types.all import AllInt
+
+SIZES = (10, 1_000, 100_000, 1_000_000)
+
+
+class PerElement(list):
+    """List that does not qualify for the fast path."""
+
+
+def best_of(statement, number: int) -> float:
+    """Best time per call in milliseconds."""
+    return min(repeat(statement, number=number, repeat=3)) / number * 1e3
+
+
+def main() -> None:
+    print(f'{"size":>9} {"per element":>12} {"list":>8} {"tuple":>8}'
+          f' {"set":>8} {"dict":>8} {"speedup":>8}')
+    for size in SIZES:
+        number = max(1, 100_000 // size)
+        data = list(range(size))
+        containers = (PerElement(data), data, tuple(data),
+                      set(data), dict.fromkeys(data))
+        times = [best_of(lambda: AllInt(container), number)
+                 for container in containers]
+        print(f'{size:>9} {times[0]:12.4f}',
+              ' '.join(f'{time:8.4f}' for time in times[1:]),
+              f'{times[0] / times[1]:7.1f}x')
+    print('(milliseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
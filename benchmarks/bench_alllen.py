@@ -0,0 +1,55 @@
+"""Cost of checking the lengths of a million rows against many lengths.
+
+Allowed lengths are validated once per call rather than once per row and
+checked in constant time, by arithmetic if given as a range or as minimum
+and/or maximum length and by hashing otherwise. The lengths of all rows of
+built-in containers are collected in a single pass at C level, such that
+only distinct lengths are checked. For reference, validating the lengths
+for every row and scanning them, as `AllLen` did before, is timed as well,
+for up to 100 lengths. Run from the top-level directory of the repository
+with
+
+    python -m benchmarks.bench_alllen
+
+"""
+from timeit import repeat
+from checkerpy.validators.all import AllLen
+
+N_ROWS = 1_000_000
+
+
+def best_of(statement, number: int = 1) -> float:
+    """Best time per call in milliseconds."""
+    return min(repeat(statement, number=number, repeat=3)) / number * 1e3
+
+
+def scanned(rows, alen) -> list:
+    """Validating lengths and scanning them for every row."""
+    for row in rows:
+        if len(row) not in tuple(map(int, alen)):
+            raise ValueError
+    return rows
+
+
+def main() -> None:
+    rows = [(1, 2, 3)] * N_ROWS
+    print(f'{N_ROWS} rows')
+    print(f'{"lengths":>8} {"scan":>10} {"range":>10}'
+          f' {"min/max":>10} {"tuple":>10}')
+    for n_lengths in (10, 100, 10_000):
+        alen = range(1, n_lengths + 1)
+        if n_lengths > 100:
+            scan = float('nan')
+        else:
+            scan = best_of(lambda: scanned(rows, alen))
+        ranged = best_of(lambda: AllLen(rows, alen=alen))
+        limits = best_of(lambda: AllLen(rows, amin_len=1,
+                                        amax_len=n_lengths))
+        hashed = best_of(lambda: AllLen(rows, alen=tuple(alen)))
+        print(f'{n_lengths:>8} {scan:10.1f} {ranged:10.1f}'
+              f' {limits:10.1f} {hashed:10.1f}')
+    print('(milliseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
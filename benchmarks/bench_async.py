@@ -0,0 +1,63 @@
+"""Event-loop stalls caused by checking large arguments of coroutines.
+
+Many concurrent calls to a coroutine function check a large list each,
+while a heartbeat task measures the longest time the event loop could not
+run it. Checked inline, every check blocks the event loop for as long as
+it takes. Offloaded to an executor, the event loop keeps running.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_async
+
+"""
+import asyncio
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+from checkerpy import Offloaded
+from checkerpy.decorators import Bounded
+
+DATA = list(range(50_000))
+CALLS = 8
+
+
+async def heartbeat(stop: asyncio.Event, gaps: list) -> None:
+    last = perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def stalls(function) -> tuple:
+    """Total time and longest stall of the event loop in milliseconds."""
+    stop, gaps = asyncio.Event(), []
+    beat = asyncio.create_task(heartbeat(stop, gaps))
+    start = perf_counter()
+    _ = await asyncio.gather(*(function(DATA) for _ in range(CALLS)))
+    total = perf_counter() - start
+    stop.set()
+    await beat
+    return total * 1e3, max(gaps) * 1e3
+
+
+def main() -> None:
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    @Bounded([(0, ...)])
+    async def inline(x):
+        return x
+
+    @Bounded(Offloaded([(0, ...)], executor))
+    async def offloaded(x):
+        return x
+
+    print(f'{CALLS} concurrent calls checking {len(DATA)} elements each')
+    for name, function in (('inline', inline), ('offloaded', offloaded)):
+        total, stall = asyncio.run(stalls(function))
+        print(f'{name:>10}: {total:7.1f} ms total, {stall:6.1f} ms'
+              ' longest event-loop stall')
+    executor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
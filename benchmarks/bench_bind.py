@@ -0,0 +1,50 @@
+"""Per-call saving of validators bound to their specification once.
+
+Calling a validator with its specification validates and normalizes that
+specification again on every call, before checking the value. A validator
+bound to its specification with `bind` only checks the value. Run from the
+top-level directory of the repository with
+
+    python -m benchmarks.bench_bind
+
+"""
+from timeit import repeat
+from checkerpy.validators.one import JustLen, Has, OneOf, Contains
+from checkerpy.validators.all import LimitedTuple
+
+NUMBER = 50_000
+
+
+def best_of(statement, number: int = NUMBER) -> float:
+    """Best time per call in nanoseconds."""
+    return min(repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def cases() -> list:
+    cases = [(JustLen, {'length': (2, 3)}, [1, 2, 3]),
+             (Has, {'attr': ('append', 'extend', 'pop')}, []),
+             (OneOf, {'items': ('a', 'b', 'c')}, 'c'),
+             (Contains, {'every': (1, 2), 'some': (3, 4)}, [1, 2, 3]),
+             (LimitedTuple, {'limits': ((0, 1), (..., 2), (3, ...))},
+              (1, 2, 3))]
+    try:
+        from numpy import zeros
+        from checkerpy.validators.numpy import JustShape
+    except ImportError:
+        return cases
+    return cases + [(JustShape, {'shape': [(2, 2), (..., 3)]}, zeros((2, 3)))]
+
+
+def main() -> None:
+    print(f'{"validator":>12} {"unbound":>8} {"bound":>8} {"saving":>8}')
+    for validator, spec, value in cases():
+        bound = validator.bind(**spec)
+        unbound = best_of(lambda: validator(value, 'value', **spec))
+        once = best_of(lambda: bound(value, 'value'))
+        print(f'{validator.__name__:>12} {unbound:8.1f} {once:8.1f}'
+              f' {unbound - once:8.1f}')
+    print('(nanoseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
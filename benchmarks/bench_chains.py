@@ -0,0 +1,64 @@
+"""Per-call cost of daisy chains of growing length.
+
+Chains built with ``o()`` are flattened into a single sequence of stages, so
+calling one costs one frame plus one call per stage, instead of one extra
+frame and two try/except blocks per link of a nested chain. The nested
+chain emulates how compositions used to be called. Run from the top-level
+directory of the repository with
+
+    python -m benchmarks.bench_chains
+
+"""
+from timeit import repeat
+from checkerpy.functional import CompositionOf
+from checkerpy.exceptions import CallableError
+
+NUMBER = 100_000
+
+
+class Nested:
+    """Composition of two callables that calls them in nested frames."""
+
+    def __init__(self, first, second) -> None:
+        self.__first = first
+        self.__second = second
+
+    def __call__(self, value, name=None, **kwargs):
+        try:
+            intermediate = self.__second(value, name, **kwargs)
+        except TypeError as error:
+            raise CallableError('Second is not callable!') from error
+        try:
+            final = self.__first(intermediate, name, **kwargs)
+        except TypeError as error:
+            raise CallableError('First is not callable!') from error
+        return final
+
+    def o(self, other):
+        return Nested(self, other)
+
+
+def stage(value, name=None, **kwargs):
+    return value
+
+
+def best_of(statement, number: int = NUMBER) -> float:
+    """Best time per call in microseconds."""
+    return min(repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f'{"stages":>6} {"nested":>8} {"flat":>8} {"speedup":>8}')
+    for n_stages in (2, 5, 10):
+        nested, flat = Nested(stage, stage), CompositionOf(stage, stage)
+        for _ in range(n_stages - 2):
+            nested, flat = nested.o(stage), flat.o(stage)
+        t_nested = best_of(lambda: nested(1, 'x', lo=0))
+        t_flat = best_of(lambda: flat(1, 'x', lo=0))
+        print(f'{n_stages:>6} {t_nested:8.2f} {t_flat:8.2f}'
+              f' {t_nested / t_flat:7.1f}x')
+    print('(microseconds per call)')
+
+
+if __name__ == '__main__':
+    main()
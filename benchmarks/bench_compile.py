@@ -0,0 +1,55 @@
+"""Per-call cost of parsed versus compiled checkers for nested specs.
+
+The decorators turn each argument spec into a (nested) composition of checker
+classes, whereas ``checkerpy.compile`` generates one flat function that only
+hands over to these classes if a check fails. Run from the top-level
+directory of the repository with
+
+    python -m benchmarks.bench_compile
+
+"""
+from timeit import Timer
+from checkerpy import compile
+from checkerpy.decorators.typeparser import TypeParser
+from checkerpy.decorators.boundsparser import BoundsParser
+
+NUMBER = 10_000
+CASES = (
+    ('int', 'type', int, 1),
+    ('[int]', 'type', [int], [1, 2, 3, 4, 5]),
+    ('{str: ...}', 'type', {str: ...}, {'a': 1, 'b': 2}),
+    ('{str: (int, float)}', 'type', {str: (int, float)}, {'a': 1, 'b': 2.}),
+    ('(float, ...)', 'type', (float, ...), (1.0, 2.0, 3.0)),
+    ('((str,), (...,), (int, float))', 'type',
+     ((str,), (...,), (int, float)), ('Joe', None, 42)),
+    ('(0, 10)', 'bounds', (0, 10), 5),
+    ('[(0, 10)]', 'bounds', [(0, 10)], [1, 2, 3, 4, 5]),
+    ("{('a', 'z'): (0, 10)}", 'bounds',
+     {('a', 'z'): (0, 10)}, {'b': 1, 'c': 2}),
+    ('((0, 1), (0, 10), (..., ...))', 'bounds',
+     ((0, 1), (0, 10), (..., ...)), (0.5, 5, 'foo')),
+)
+PARSERS = {'type': TypeParser(), 'bounds': BoundsParser()}
+
+
+def best_of(statement) -> float:
+    """Best time per call in microseconds."""
+    timer = Timer(statement)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main() -> None:
+    print(f'{"spec":>34} {"parsed":>8} {"compiled":>9} {"speedup":>8}')
+    for label, kind, spec, value in CASES:
+        parsed = PARSERS[kind]((spec,))[0]
+        compiled = compile(spec, kind=kind)
+        t_parsed = best_of(lambda: parsed(value, 'x'))
+        t_compiled = best_of(lambda: compiled(value, 'x'))
+        print(f'{label:>34} {t_parsed:8.2f} {t_compiled:9.2f}'
+              f' {t_parsed / t_compiled:7.1f}x')
+    print('(microseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Cost of checking that a large list contains many required items.
+
+Scanning the list for every required item takes time proportional to the
+product of the number of elements and the number of items. `Contains`
+instead converts large lists of hashable elements into a temporary set once
+and looks up each item in constant time. For reference, the former scan
+is timed as well, with required items spread evenly over the list. Run from
+the top-level directory of the repository with
+
+    python -m benchmarks.bench_contains
+
+"""
+from timeit import repeat
+from checkerpy.validators.one import Contains
+
+N_ELEMENTS = 100_000
+
+
+def best_of(statement, number: int = 1) -> float:
+    """Best time per call in milliseconds."""
+    return min(repeat(statement, number=number, repeat=3)) / number * 1e3
+
+
+def scanned(iterable, every) -> bool:
+    """The check of `Contains` before converting to a set."""
+    return all(item in iterable for item in every)
+
+
+def main() -> None:
+    elements = list(range(N_ELEMENTS))
+    print(f'List of {N_ELEMENTS} elements')
+    print(f'{"items":>6} {"scan":>10} {"Contains":>10}')
+    for n_items in (1, 10, 100, 1_000):
+        every = tuple(range(0, N_ELEMENTS, N_ELEMENTS // n_items))
+        scan = best_of(lambda: scanned(elements, every))
+        hashed = best_of(lambda: Contains(elements, every=every))
+        print(f'{n_items:>6} {scan:10.2f} {hashed:10.2f}')
+    print('(milliseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
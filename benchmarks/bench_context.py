@@ -0,0 +1,40 @@
+"""Cost of passing checks on unnamed inputs of growing size.
+
+Error messages are rendered lazily, so the time a passing check takes on an
+unnamed input must not depend on how long its string representation is. Run
+from the top-level directory of the repository with
+
+    python -m benchmarks.bench_context
+
+"""
+from timeit import repeat
+from checkerpy.validators.one import JustLen, OneOf, JustCall, Limited
+from checkerpy.types.all import TypedTuple
+
+SIZES = (10, 1_000, 100_000, 1_000_000)
+NUMBER = 1_000
+
+
+def best_of(statement, number: int = NUMBER) -> float:
+    """Best time per call in microseconds."""
+    return min(repeat(statement, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f'{"size":>9} {"JustLen":>9} {"OneOf":>9}'
+          f' {"JustCall":>9} {"Limited":>9} {"TypedTuple":>11}')
+    for size in SIZES:
+        data = list(range(size))
+        items = (data,)
+        pair = (data, data)
+        print(f'{size:>9}',
+              f'{best_of(lambda: JustLen(data, length=size)):9.2f}',
+              f'{best_of(lambda: OneOf(data, items=items)):9.2f}',
+              f'{best_of(lambda: JustCall(data.append)):9.2f}',
+              f'{best_of(lambda: Limited(data, lo=[])):9.2f}',
+              f'{best_of(lambda: TypedTuple(pair, types=(list, list))):11.2f}')
+    print('(microseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""Per-call overhead of the `Typed` decorator on small functions.
+
+Wrappers are specialized to the signature of the decorated function when it
+is decorated, such that each call only checks the arguments that actually
+have checks, without building any intermediate dictionaries. Decorated
+functions are called with all arguments passed positionally, all passed by
+keyword, and with only the first of several arguments checked.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_decorator
+
+"""
+from timeit import repeat
+from checkerpy.decorators import Typed
+
+NUMBER = 100_000
+
+
+def best_of(statement) -> float:
+    """Best time per call in microseconds."""
+    return min(repeat(statement, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def function_of(n_args: int):
+    """Function that takes `n_args` arguments and returns the first one."""
+    names = ', '.join(f'x{i}' for i in range(n_args))
+    namespace = {}
+    exec(f'def f({names}):\n    return x0', namespace)
+    return namespace['f']
+
+
+def main() -> None:
+    print(f'{"args":>4} {"plain":>7} {"by pos":>7} {"by name":>8}'
+          f' {"1 checked":>10} {"overhead":>9}')
+    for n_args in (1, 3, 8):
+        plain = function_of(n_args)
+        typed = Typed(*(int,) * n_args)(function_of(n_args))
+        first = Typed(int)(function_of(n_args))
+        args = tuple(range(n_args))
+        kwargs = {f'x{i}': i for i in range(n_args)}
+        times = (best_of(lambda: plain(*args)),
+                 best_of(lambda: typed(*args)),
+                 best_of(lambda: typed(**kwargs)),
+                 best_of(lambda: first(*args)))
+        print(f'{n_args:>4} {times[0]:7.3f} {times[1]:7.3f} {times[2]:8.3f}'
+              f' {times[3]:10.3f} {times[1] - times[0]:9.3f}')
+    print('(microseconds per call)')
+
+
+if __name__ == '__main__':
+    main()
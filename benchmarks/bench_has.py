@@ -0,0 +1,59 @@
+"""Cost of checking objects for many attributes and many objects for some.
+
+`LikeMutableSet` checks for 23 attributes and `LikeMutableSequence` for 16.
+Which of them are provided to all instances by the type of an object is
+looked up only once per type, such that merely the rest of them needs to be
+checked on every object. `AllHave` does so once per distinct type of the
+elements of an iterable. For reference, checking all attributes on every
+object with ``hasattr`` is timed as well. Run from the top-level directory
+of the repository with
+
+    python -m benchmarks.bench_has
+
+"""
+from timeit import repeat
+from checkerpy.types.weak import LikeMutableSet, LikeMutableSequence
+from checkerpy.validators.all import AllHave
+
+N_ELEMENTS = 100_000
+
+
+class Point:
+
+    def __init__(self, x: float) -> None:
+        self.x = x
+
+    def __abs__(self) -> float:
+        return abs(self.x)
+
+
+def best_of(statement, number: int = 1) -> float:
+    """Best time per call in microseconds."""
+    return min(repeat(statement, number=number, repeat=3)) / number * 1e6
+
+
+def every_attr(obj, attrs) -> bool:
+    """Checking all attributes on the object itself."""
+    return all(hasattr(obj, attr) for attr in attrs)
+
+
+def main() -> None:
+    print(f'{"checker":>20} {"hasattr":>10} {"checkerpy":>10}')
+    for like, value in ((LikeMutableSet, set()),
+                        (LikeMutableSequence, [])):
+        scan = best_of(lambda: every_attr(value, like.attrs), 10_000)
+        cached = best_of(lambda: like(value), 10_000)
+        print(f'{like.__name__:>20} {scan:10.2f} {cached:10.2f}')
+    print('(microseconds per passing call)')
+    points = [Point(i) for i in range(N_ELEMENTS)]
+    attrs = '__abs__', 'x'
+    scan = best_of(lambda: all(every_attr(p, attrs) for p in points)) / 1e3
+    cached = best_of(lambda: AllHave(points, attrs=attrs)) / 1e3
+    print(f'\nAllHave over {N_ELEMENTS} elements of the same type')
+    print(f'{"hasattr":>10} {"AllHave":>10}')
+    print(f'{scan:10.2f} {cached:10.2f}')
+    print('(milliseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
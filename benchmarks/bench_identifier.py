@@ -0,0 +1,52 @@
+"""Cost of checking that a million mostly repeated names are identifiers.
+
+Checking names one by one with `Identifier` calls it for every element.
+`AllIdentifier` checks all elements of built-in containers at once, in a
+single pass at C level, and, in strict mode, looks for keywords in another.
+With ``cached=True``, names that passed before are merely looked up, which
+pays off for long names. Run from the top-level directory of the
+repository with
+
+    python -m benchmarks.bench_identifier
+
+"""
+from timeit import repeat
+from checkerpy.validators.one import Identifier
+from checkerpy.validators.all import AllIdentifier
+
+N_ELEMENTS = 1_000_000
+N_DISTINCT = 1_000
+
+
+def best_of(statement, number: int = 1) -> float:
+    """Best time per call in milliseconds."""
+    return min(repeat(statement, number=number, repeat=3)) / number * 1e3
+
+
+def one_by_one(names, strict: bool = False) -> list:
+    """Checking every name with `Identifier`."""
+    for name in names:
+        _ = Identifier(name, strict=strict)
+    return names
+
+
+def main() -> None:
+    print(f'{N_ELEMENTS} names, {N_DISTINCT} of them distinct')
+    print(f'{"length":>6} {"strict":>6} {"one by one":>10}'
+          f' {"all":>10} {"cached":>10}')
+    for length in (8, 64):
+        distinct = [f'n{i:0{length - 1}d}' for i in range(N_DISTINCT)]
+        names = distinct * (N_ELEMENTS // N_DISTINCT)
+        for strict in (False, True):
+            single = best_of(lambda: one_by_one(names, strict))
+            once = best_of(lambda: AllIdentifier(names, strict=strict))
+            _ = AllIdentifier(names, strict=strict, cached=True)
+            cached = best_of(lambda: AllIdentifier(names, strict=strict,
+                                                   cached=True))
+            print(f'{length:>6} {strict!s:>6} {single:10.1f}'
+                  f' {once:10.1f} {cached:10.1f}')
+    print('(milliseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Import time and memory of the package and the cost of creating checkers.
+
+Compositions of checkers with each other are only created when they are
+first accessed, so importing the package and instantiating ad-hoc checkers
+like ``All(int)`` should be cheap. The import is measured in fresh
+interpreters, with ``python -X importtime`` and with tracemalloc.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_import
+
+"""
+import sys
+import subprocess
+from timeit import repeat
+
+MODULES = ('checkerpy.types.one', 'checkerpy.types.all',
+           'checkerpy.validators.one', 'checkerpy.validators.all',
+           'checkerpy')
+MEMORY = '''
+import tracemalloc
+tracemalloc.start()
+import checkerpy
+current, peak = tracemalloc.get_traced_memory()
+print(current, peak)
+'''
+
+
+def import_times() -> dict:
+    """Cumulative import times of all modules in milliseconds."""
+    command = (sys.executable, '-X', 'importtime', '-c', 'import checkerpy')
+    stderr = subprocess.run(command, capture_output=True, text=True).stderr
+    times = {}
+    for line in stderr.splitlines()[1:]:
+        _, cumulative, module = (part.strip() for part in line.split('|'))
+        times[module] = int(cumulative) / 1e3
+    return times
+
+
+def memory() -> (float, float):
+    """Current and peak memory allocated during import in megabytes."""
+    command = (sys.executable, '-c', MEMORY)
+    stdout = subprocess.run(command, capture_output=True, text=True).stdout
+    current, peak = map(int, stdout.split())
+    return current / 1e6, peak / 1e6
+
+
+def main() -> None:
+    runs = [import_times() for _ in range(5)]
+    print(f'{"module":>24} {"time/ms":>8}')
+    for module in MODULES:
+        time = min(run[module] for run in runs)
+        print(f'{module:>24} {time:8.1f}')
+    current, peak = memory()
+    print(f'Memory allocated on import: {current:.2f} MB (peak {peak:.2f} MB)')
+    from checkerpy.types.all import All
+    from checkerpy.validators.one import Limited
+    number = 1_000
+    all_int = min(repeat(lambda: All(int), number=number, repeat=5))
+    limited = min(repeat(lambda: Limited.JustInt(1, lo=0), number=number,
+                         repeat=5))
+    print(f'All(int): {all_int / number * 1e6:.1f} us per instantiation')
+    print(f'Limited.JustInt: {limited / number * 1e6:.1f} us per call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""Decoration time and memory of a module with 1,000 decorated functions.
+
+Identical type and limits specifications are parsed only once and all
+decorators using them share the resulting checkers. The reference disables
+this by swapping in caches of size zero. The synthetic module decorates
+each of its functions with one of a handful of typical specifications.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_interning
+
+"""
+import gc
+import tracemalloc
+from time import perf_counter
+from checkerpy.decorators.typeparser import TypeParser
+from checkerpy.decorators.boundsparser import BoundsParser
+from checkerpy.decorators.speccache import SpecCache
+
+N_FUNCTIONS = 1_000
+DECORATORS = ('@Typed([int], {str: float})',
+              '@Typed((int, float), y=(str, ...))',
+              '@Bounded((0, ...), [(0, 1)])',
+              '@Typed({int}, ((int,), (str,)))',
+              '@Bounded({(0, 10): ...}, y=(0.0, 1.0))')
+SOURCE = ''.join(f'{DECORATORS[i % len(DECORATORS)]}\n'
+                 f'def f{i}(x, y):\n'
+                 f'    return x, y\n\n\n'
+                 for i in range(N_FUNCTIONS))
+CODE = compile('from checkerpy.decorators import Typed, Bounded\n' + SOURCE,
+               'synthetic', 'exec')
+
+
+def load(maxsize: int) -> (float, float):
+    """Milliseconds to execute the module and MB of memory it holds on to."""
+    TypeParser._interned = SpecCache(maxsize)
+    BoundsParser._interned = SpecCache(maxsize)
+    gc.collect()
+    start = perf_counter()
+    exec(CODE, {})
+    milliseconds = (perf_counter() - start) * 1e3
+    TypeParser._interned = SpecCache(maxsize)
+    BoundsParser._interned = SpecCache(maxsize)
+    gc.collect()
+    tracemalloc.start()
+    module = {}
+    exec(CODE, module)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return milliseconds, size / 2**20
+
+
+def main() -> None:
+    exec(CODE, {})
+    reference = min(load(0) for _ in range(5))
+    interned = min(load(1024) for _ in range(5))
+    print(f'{"":>12} {"ms":>8} {"MB":>6}')
+    print(f'{"reference":>12} {reference[0]:8.1f} {reference[1]:6.2f}')
+    print(f'{"interned":>12} {interned[0]:8.1f} {interned[1]:6.2f}')
+    print(f'{"savings":>12} {1 - interned[0] / reference[0]:8.0%}'
+          f' {1 - interned[1] / reference[1]:6.0%}')
+    print(f'(module with {N_FUNCTIONS} decorated functions)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Cost of checking values against bounds normalized once in an Interval.
+
+Compares calling `Limited` with its bounds on every call to calling an
+`Interval` created once, both for single values and, per element, for lists
+of numbers and strings, where `check_many` reduces the list with `min` and
+`max` instead of comparing every element to the bounds. Run from the
+top-level directory of the repository with
+
+    python -m benchmarks.bench_interval
+
+"""
+from timeit import repeat
+from checkerpy.validators.one import Limited, Interval
+from checkerpy.validators.all import AllLimited
+
+NUMBER = 100_000
+N_ITEMS = 100_000
+NUMBERS = [i / N_ITEMS for i in range(N_ITEMS)]
+STRINGS = [f'{i:06d}' for i in range(N_ITEMS)]
+
+
+def best_of(statement, number: int) -> float:
+    """Best time per call in nanoseconds."""
+    return min(repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def per_element(values, lo, hi) -> None:
+    for value in values:
+        _ = Limited(value, lo=lo, hi=hi)
+
+
+def main() -> None:
+    unit = Interval(0, 1)
+    limited = best_of(lambda: Limited(0.5, lo=0, hi=1), NUMBER)
+    interval = best_of(lambda: unit(0.5), NUMBER)
+    print('Single value (ns per call)')
+    print(f'{"Limited":>22}: {limited:8.1f}')
+    print(f'{"Interval":>22}: {interval:8.1f}')
+    print(f'Lists of {N_ITEMS} items (ns per item)')
+    for label, values, lo, hi in (('numbers', NUMBERS, 0, 1),
+                                  ('strings', STRINGS, '0', '2')):
+        interval = Interval(lo, hi)
+        times = {
+            f'Limited per {label}': best_of(
+                lambda: per_element(values, lo, hi), 1),
+            f'AllLimited {label}': best_of(
+                lambda: AllLimited(values, alo=lo, ahi=hi), 5),
+            f'check_many {label}': best_of(
+                lambda: interval.check_many(values), 5)}
+        for name, time in times.items():
+            print(f'{name:>22}: {time / N_ITEMS:8.1f}')
+
+
+if __name__ == '__main__':
+    main()
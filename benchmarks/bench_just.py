@@ -0,0 +1,54 @@
+"""Cost of type checks for a growing number of allowed types.
+
+Compares the former linear scan over a tuple of types with the frozenset
+lookup of the exact mode of `Just` and with the verdict cache of its
+subclass-aware mode. Values are of the last allowed type (the worst case for
+a linear scan) or, for the subclass-aware mode, of a subclass thereof. Run
+from the top-level directory of the repository with
+
+    python -m benchmarks.bench_just
+
+"""
+from timeit import repeat
+from checkerpy.types.one import Just
+
+NUMBER = 100_000
+TYPES = (bool, bytes, bytearray, complex, dict, float, frozenset,
+         list, memoryview, range, set, slice, str, tuple, int)
+
+
+def best_of(statement, number: int = NUMBER) -> float:
+    """Best time per call in nanoseconds."""
+    return min(repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+class Scanned:
+    """The type check of `Just` before switching to a frozenset."""
+
+    def __init__(self, *types: type) -> None:
+        self.__types = types
+
+    def __call__(self, value, name=None, **kwargs):
+        if type(value) not in self.__types:
+            raise TypeError(f'Wrong type of {name}!')
+        return value
+
+
+def main() -> None:
+    print(f'{"types":>5} {"tuple scan":>11} {"exact":>7} {"subclasses":>11}')
+    for n_types in (1, 5, 15):
+        types = TYPES[-n_types:]
+        value = types[-1]()
+        subclass = type('Subclass', (types[-1],), {})()
+        scan = Scanned(*types)
+        exact = Just(*types)
+        derived = Just(*types, subclasses=True)
+        print(f'{n_types:>5}',
+              f'{best_of(lambda: scan(value)):11.1f}',
+              f'{best_of(lambda: exact(value)):7.1f}',
+              f'{best_of(lambda: derived(subclass)):11.1f}')
+    print('(nanoseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Cost of repeatedly checking the same large immutable value.
+
+A tuple of constants passed to a decorated function over and over again is
+fully checked on every call, unless the check is wrapped in ``Memoized``.
+Then, only the first call pays for the full check, while all subsequent
+calls merely look up the identity of the tuple. Mutable values, like lists,
+are still checked every time.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_memoized
+
+"""
+from timeit import repeat
+from checkerpy.decorators import Typed
+from checkerpy import Memoized
+
+N_ITEMS = 100_000
+TABLE = tuple(range(N_ITEMS))
+LIST = list(TABLE)
+
+
+def best_of(statement, number: int = 20) -> float:
+    """Best time per call in microseconds."""
+    best = min(repeat(statement, number=number, repeat=5))
+    return best / number * 1e6
+
+
+@Typed((int, ...))
+def typed(table):
+    return table
+
+
+@Typed(Memoized((int, ...)))
+def memoized(table):
+    return table
+
+
+@Typed(Memoized([int]))
+def memoized_list(table):
+    return table
+
+
+def main() -> None:
+    times = {'Typed': best_of(lambda: typed(TABLE)),
+             'Memoized': best_of(lambda: memoized(TABLE)),
+             'Memoized list': best_of(lambda: memoized_list(LIST))}
+    print(f'Repeated calls with {N_ITEMS} items')
+    for name, time in times.items():
+        print(f'{name:>14}: {time:9.2f} us per call')
+
+
+if __name__ == '__main__':
+    main()
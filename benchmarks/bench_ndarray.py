@@ -0,0 +1,37 @@
+"""Checking limits of all elements of large numpy arrays.
+
+Numeric arrays are checked against limits with a single reduction instead
+of comparing their elements one by one. The reference iterates over the
+same elements in a list, which is what checking arrays used to cost.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_ndarray
+
+"""
+from timeit import repeat
+import numpy as np
+from checkerpy.validators.all import AllLimited
+
+ARRAY = np.random.default_rng(42).random(1_000_000)
+WITH_NAN = ARRAY.copy()
+WITH_NAN[0] = np.nan
+LIST = ARRAY.tolist()
+
+
+def best_of(statement, number: int = 10) -> float:
+    """Best time per call in milliseconds."""
+    return min(repeat(statement, number=number, repeat=5)) / number * 1e3
+
+
+def main() -> None:
+    print(f'AllLimited on {ARRAY.size} elements')
+    times = {'list': best_of(lambda: AllLimited(LIST, alo=0, ahi=1), 1),
+             'ndarray': best_of(lambda: AllLimited(ARRAY, alo=0, ahi=1)),
+             'ndarray with NaN': best_of(
+                 lambda: AllLimited(WITH_NAN, alo=0, ahi=1))}
+    for name, time in times.items():
+        print(f'{name:>16}: {time:8.3f} ms')
+
+
+if __name__ == '__main__':
+    main()
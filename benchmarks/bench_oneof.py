@@ -0,0 +1,39 @@
+"""Cost of membership checks with OneOf for a growing number of items.
+
+Lists of items are scanned on every call, which takes time linear in the
+number of items. Tuples of many hashable items are indexed once and the
+index is cached, such that membership takes constant time. Binding items
+with `OneOf.bind` indexes lists and tuples alike and skips the cache
+lookup. Values are the last item, the worst case for a scan. Run from the
+top-level directory of the repository with
+
+    python -m benchmarks.bench_oneof
+
+"""
+from timeit import repeat
+from checkerpy.validators.one import OneOf
+
+NUMBER = 2_000
+
+
+def best_of(statement, number: int = NUMBER) -> float:
+    """Best time per call in nanoseconds."""
+    return min(repeat(statement, number=number, repeat=5)) / number * 1e9
+
+
+def main() -> None:
+    print(f'{"items":>7} {"list scan":>10} {"tuple":>8} {"bound":>8}')
+    for n_items in (10, 100, 1_000, 10_000, 100_000):
+        codes = list(range(n_items))
+        table = tuple(codes)
+        value = codes[-1]
+        bound = OneOf.bind(items=codes)
+        print(f'{n_items:>7}',
+              f'{best_of(lambda: OneOf(value, items=codes)):10.1f}',
+              f'{best_of(lambda: OneOf(value, items=table)):8.1f}',
+              f'{best_of(lambda: bound(value)):8.1f}')
+    print('(nanoseconds per passing call)')
+
+
+if __name__ == '__main__':
+    main()
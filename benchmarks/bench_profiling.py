@@ -0,0 +1,48 @@
+"""Per-call overhead of profiling checks of decorated functions.
+
+While profiling is disabled, decorated functions run exactly the same
+checks as before, because tables of profiled checks are only built once
+profiling is enabled. While enabled, every check of an argument is timed
+and recorded. Timings are compared against undecorated calls.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_profiling
+
+"""
+from timeit import repeat
+from checkerpy import Profiled, profile, stats
+from checkerpy.decorators import Typed
+from checkerpy.types.one import JustInt
+
+
+def best_of(statement, number: int = 200_000) -> float:
+    """Best time per call in microseconds."""
+    return min(repeat(statement, number=number, repeat=7)) / number * 1e6
+
+
+@Typed(int, float, z=str)
+def f(x, y, z):
+    return x
+
+
+def g(x, y, z):
+    return x
+
+
+def main() -> None:
+    check = Profiled(JustInt, __name__)
+    times = {'undecorated': best_of(lambda: g(1, 2.0, z='a')),
+             'profiling disabled': best_of(lambda: f(1, 2.0, z='a')),
+             'inline disabled': best_of(lambda: check(1, 'x'))}
+    profile()
+    times['profiling enabled'] = best_of(lambda: f(1, 2.0, z='a'))
+    times['inline enabled'] = best_of(lambda: check(1, 'x'))
+    profile(False)
+    calls = stats(reset=True)[f'{__name__}.f']['x']['calls']
+    print(f'Recorded {calls} profiled calls.')
+    for name, time in times.items():
+        print(f'{name:>20}: {time:6.3f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Cost of checking a fixed-size sample of the elements of large lists.
+
+Checking all elements of a list with `AllLimited` costs time proportional to
+its length, whereas checking a `sample` of them only costs time proportional
+to the size of the sample, regardless of the length of the list.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_sampling
+
+"""
+from timeit import repeat
+from checkerpy.validators.all import AllLimited
+
+SIZES = (10_000, 100_000, 1_000_000)
+SAMPLE = 1_000
+
+
+def best_of(statement, number: int) -> float:
+    """Best time per call in milliseconds."""
+    return min(repeat(statement, number=number, repeat=3)) / number * 1e3
+
+
+def main() -> None:
+    print(f'{"size":>10} {"full":>10} {"evenly":>8} {"seeded":>8}'
+          f' {"speedup":>8}')
+    for size in SIZES:
+        data = list(range(size))
+        full = best_of(lambda: AllLimited(data, alo=0), 1)
+        evenly = best_of(lambda: AllLimited(data, alo=0, sample=SAMPLE), 10)
+        seeded = best_of(lambda: AllLimited(data, alo=0, sample=SAMPLE,
+                                            seed=42), 10)
+        print(f'{size:>10} {full:10.2f} {evenly:8.2f} {seeded:8.2f}'
+              f' {full / evenly:7.0f}x')
+    print(f'(milliseconds per passing call, sample of {SAMPLE} elements)')
+
+
+if __name__ == '__main__':
+    main()
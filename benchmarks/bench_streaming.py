@@ -0,0 +1,58 @@
+"""Time and memory of element-wise checks on inputs of growing size.
+
+Elements are checked while iterating over the input, without copying it
+first. Failing at the first element of a named input must therefore cost
+the same for any input size, and peak memory of a passing check must not
+grow with it. Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_streaming
+
+"""
+import logging
+import tracemalloc
+from timeit import repeat
+from checkerpy.types.all import AllInt
+from checkerpy.validators.all import AllLimited
+from checkerpy.exceptions import WrongTypeError
+
+SIZES = (1_000, 100_000, 1_000_000)
+
+
+def fail_first(data: list) -> None:
+    try:
+        AllInt(data, 'data')
+    except WrongTypeError:
+        pass
+
+
+def best_of(statement, number: int) -> float:
+    """Best time per call in microseconds."""
+    return min(repeat(statement, number=number, repeat=3)) / number * 1e6
+
+
+def peak_of(statement) -> float:
+    """Peak memory allocated during the call in kilobytes."""
+    tracemalloc.start()
+    statement()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1e3
+
+
+def main() -> None:
+    logging.disable(logging.ERROR)
+    print(f'{"size":>9} {"fail first/us":>14} {"pass/ms":>8}'
+          f' {"peak/kB":>8} {"generator peak/kB":>18}')
+    for size in SIZES:
+        data = [1.0] + list(range(size - 1))
+        valid = list(range(size))
+        t_fail = best_of(lambda: fail_first(data), 1_000)
+        t_pass = best_of(lambda: AllLimited(valid, alo=0), 1) / 1e3
+        peak = peak_of(lambda: AllInt(valid))
+        generator = peak_of(lambda: sum(AllInt(x for x in range(size))))
+        print(f'{size:>9} {t_fail:14.2f} {t_pass:8.1f}'
+              f' {peak:8.1f} {generator:18.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Throughput of shared checkers called from a growing number of threads.
+
+Checkers keep no per-call state on shared objects, so the same checker can be
+called from many threads at once without locking. On a free-threaded build
+of CPython, throughput should grow roughly linearly with the number of
+workers. With the GIL, it stays flat but must not degrade. Run from the
+top-level directory of the repository with
+
+    python -m benchmarks.bench_threads
+
+"""
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+from checkerpy.types.all import AllInt
+from checkerpy.validators.one import JustLen, Limited
+
+WORKERS = (1, 2, 4, 8)
+CALLS = 20_000
+DATA = list(range(10))
+
+
+def work(calls: int) -> None:
+    for _ in range(calls):
+        JustLen(DATA, length=10)
+        Limited(5, lo=0, hi=10)
+        AllInt(DATA)
+
+
+def calls_per_second(workers: int) -> float:
+    with ThreadPoolExecutor(workers) as pool:
+        start = perf_counter()
+        list(pool.map(work, [CALLS] * workers))
+        elapsed = perf_counter() - start
+    return 3 * CALLS * workers / elapsed
+
+
+def main() -> None:
+    print(f'{"workers":>7} {"calls/s":>12}')
+    for workers in WORKERS:
+        print(f'{workers:>7} {calls_per_second(workers):12.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Checking the types of 1,000 arguments passed through ``*args``/``**kwargs``.
+
+Arguments collected by ``*args`` are checked straight from the tuple of
+positional arguments, all at once if they are of the right type, and so
+are the values of ``**kwargs``. The reference is the former workaround of
+checking them with an ``All`` type checker inside the function. Note that
+any decorator has to pass ``**kwargs`` on, which packs them a second time.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_variadic
+
+"""
+from timeit import repeat
+from checkerpy.decorators import Typed
+from checkerpy.types.all import All
+
+ARGS = tuple(range(1_000))
+KWARGS = {f'x{i}': float(i) for i in range(1_000)}
+ALL_INT = All(int)
+ALL_FLOAT = All(float)
+
+
+def best_of(statement, number: int = 5_000) -> float:
+    """Best time per call in microseconds."""
+    return min(repeat(statement, number=number, repeat=7)) / number * 1e6
+
+
+def plain(*args, **kwargs):
+    return args
+
+
+def inside(*args, **kwargs):
+    _ = ALL_INT(args, 'args')
+    _ = ALL_FLOAT(kwargs.values(), 'kwargs')
+    return args
+
+
+@Typed(args=int, kwargs=float)
+def typed(*args, **kwargs):
+    return args
+
+
+def main() -> None:
+    calls = {'*args': lambda function: function(*ARGS),
+             '**kwargs': lambda function: function(**KWARGS)}
+    print(f'{len(ARGS)} arguments     undecorated  All inside       Typed')
+    for name, call in calls.items():
+        times = (best_of(lambda: call(function))
+                 for function in (plain, inside, typed))
+        print(f'{name:>14}' + ''.join(f'{time:12.2f}' for time in times))
+    print('(microseconds per call)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Per-item overhead of checking values yielded by decorated generators.
+
+Items are checked one by one as the wrapping generator passes them on,
+which keeps memory constant. The reference collects all items into a list
+to then check them with an ``All`` type checker.
+Run from the top-level directory of the repository with
+
+    python -m benchmarks.bench_yields
+
+"""
+from timeit import repeat
+from collections import deque
+from checkerpy.decorators import Typed, Bounded
+from checkerpy.types.all import All
+
+N_ITEMS = 100_000
+ALL_INT = All(int)
+
+
+def best_of(statement, number: int = 5) -> float:
+    """Best time per item in nanoseconds."""
+    best = min(repeat(statement, number=number, repeat=5))
+    return best / number / N_ITEMS * 1e9
+
+
+def plain():
+    yield from range(N_ITEMS)
+
+
+@Typed(yields=int)
+def typed():
+    yield from range(N_ITEMS)
+
+
+@Bounded(yields=(0, ...))
+def bounded():
+    yield from range(N_ITEMS)
+
+
+def consumed(generator) -> None:
+    _ = deque(generator, maxlen=0)
+
+
+def main() -> None:
+    times = {'undecorated': best_of(lambda: consumed(plain())),
+             'list and All': best_of(lambda: ALL_INT(list(plain()))),
+             'Typed': best_of(lambda: consumed(typed())),
+             'Bounded': best_of(lambda: consumed(bounded()))}
+    print(f'Generators of {N_ITEMS} items')
+    for name, time in times.items():
+        print(f'{name:>14}: {time:6.1f} ns per item')
+
+
+if __name__ == '__main__':
+    main()
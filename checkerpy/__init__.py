@@ -0,0 +1,10 @@
+from .decorators.compiler import compile
+from .functional.sampled import Sampled
+from .functional.offloaded import Offloaded
+from .functional.memoized import Memoized
+from .levels import Level, set_level, get_level
+from .profiling import Profiled, profile, stats
+
+__all__ = ['compile', 'Sampled', 'Offloaded', 'Memoized',
+           'Level', 'set_level', 'get_level',
+           'Profiled', 'profile', 'stats']
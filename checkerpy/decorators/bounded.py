@@ -13,6 +13,9 @@ class Bounded(Decorator):
     **kwarg_limits
         Limits specification for function or method arguments by name. May
         be ellipsis, a 2-tuple, or an iterable of 2-tuples. See Examples.
+    yields : optional
+        Limits specification for items yielded by generator functions or
+        asynchronous generator functions. Defaults to ellipsis.
 
     Examples
     --------
@@ -53,6 +56,42 @@ class Bounded(Decorator):
     >>> def f(x, y):
     ...     return x[0] + x[1] + x[2], y
 
+    To check only a sample of the elements of very long lists or tuples of
+    arbitrary length, wrap their specification in `Sampled` with the number
+    of elements to check, which always include the first and the last one.
+
+    >>> @Bounded(Sampled([(0, 1)], 1000, seed=42))
+    >>> def f(x):
+    ...     return sum(x)
+
+    Limits specified in a list also accept numpy arrays of booleans or
+    numbers, whose elements are then all checked at once and at C speed.
+
+    >>> @Bounded([(0.0, 1.0)])
+    >>> def f(x):
+    ...     return x.sum()
+
+    To check every single argument passed through variadic ``*args`` or
+    ``**kwargs``, specify limits for them by the name of these parameters.
+
+    >>> @Bounded((0, ...), args=(0, 1), kwargs=('a', 'z'))
+    >>> def f(x, *args, **kwargs):
+    ...     return x + sum(args), max(kwargs.values())
+
+    To check every item yielded by a generator function, pass its limits
+    specification as `yields`. Items are checked one by one as they are
+    produced, without ever collecting them, and values sent or exceptions
+    thrown into the generator are passed on. Arguments, however, are checked
+    right away, when the decorated function is called, rather than only once
+    the first item is requested. The decorated function is, therefore, a
+    plain function that returns a generator and ``inspect.isgeneratorfunction``
+    reports False for it.
+
+    >>> @Bounded((0, ...), yields=(0, 1))
+    >>> def f(n):
+    ...     for i in range(n):
+    ...         yield 1 / (i + 1)
+
 
     Notes
     -----
@@ -62,11 +101,15 @@ class Bounded(Decorator):
     limits for named keyword arguments that do not actually occur in the
     function or method signature. Specifying limits per named keyword argument
     takes precedence over limit specification by positional argument.
+    Because `yields` is reserved for yielded items, arguments named "yields"
+    can only be specified by position.
 
     Raises
     ------
     TypeError
-        If one or more limits are not specified as tuple, list, set, or dict.
+        If one or more limits are not specified as tuple, list, set, or dict,
+        or if `yields` is specified for a function that is not a generator
+        function.
     LenError
         If one or more of the tuples specifying limits are not of length 2.
     WrongTypeError
@@ -1,14 +1,17 @@
 from typing import Callable, List, Set, Any, Tuple
-from ..validators.all import AllLimited, LimitedTuple
-from ..validators.one import JustLen, Limited
-from ..types.one import JustTuple, JustDict
+from ..validators.all import LimitedTuple
+from ..validators.one import JustLen, Interval
+from ..types.one import JustTuple, JustDict, JustLists, JustSets
 from .mixin import ParserMixin, SpecID
+from .speccache import SpecCache
+from ..functional.arrays import numeric_array
 
 Limit = Tuple[Any, Any]
 
 
 class BoundsParser(ParserMixin):
     """Takes tuple or dict of limits specs and returns limit checkers"""
+    _interned = SpecCache()
 
     def list_checker(self, limits: List[Limit], limits_id: SpecID) -> Callable:
         limits_name = 'for ' + self.__limits_string_from(limits_id).format('')
@@ -16,9 +19,12 @@ class BoundsParser(ParserMixin):
         limits: list = JustLen(limits, name=limits_name, length=1)
         limits = JustTuple(limits[0], name=list_limits_name)
         lo, hi = JustLen(limits, name='for '+list_limits_name, length=2)
+        interval = Interval(lo, hi)
 
-        def limited_list(value, name: str = None):
-            return AllLimited.JustLists(value, name=name, alo=lo, ahi=hi)
+        def limited_list(value, name: str = None, **kwargs):
+            if numeric_array(value) is None:
+                value = JustLists(value, name)
+            return interval.check_many(value, name, **kwargs)
 
         return limited_list
 
@@ -26,11 +32,12 @@ class BoundsParser(ParserMixin):
         limits_name = 'for ' + self.__limits_string_from(limits_id).format('')
         set_limits_name = self.__limits_string_from(limits_id).format('set ')
         limits: set = JustLen(limits, name=limits_name, length=1)
-        limits = JustTuple(limits.pop(), name=set_limits_name)
+        limits = JustTuple(next(iter(limits)), name=set_limits_name)
         lo, hi = JustLen(limits, name='for '+set_limits_name, length=2)
+        interval = Interval(lo, hi)
 
-        def limited_set(value, name: str = None):
-            return AllLimited.JustSets(value, name=name, alo=lo, ahi=hi)
+        def limited_set(value, name: str = None, **kwargs):
+            return interval.check_many(JustSets(value, name), name, **kwargs)
 
         return limited_set
 
@@ -46,11 +53,13 @@ class BoundsParser(ParserMixin):
         values = (..., ...) if values is ... else values
         values = JustTuple(values, name=dict_limits_name)
         lo, hi = JustLen(values, name='for '+dict_limits_name, length=2)
+        key_interval = Interval(lo_key, hi_key)
+        value_interval = Interval(lo, hi)
 
-        def limited_dict(mapping, name: str = None):
+        def limited_dict(mapping, name: str = None, **kwargs):
             mapping = JustDict(mapping, name=name)
-            _ = AllLimited(mapping.keys(), name=name, alo=lo_key, ahi=hi_key)
-            _ = AllLimited(mapping.values(), name=name, alo=lo, ahi=hi)
+            _ = key_interval.check_many(mapping.keys(), name, **kwargs)
+            _ = value_interval.check_many(mapping.values(), name, **kwargs)
             return mapping
 
         return limited_dict
@@ -64,20 +73,17 @@ class BoundsParser(ParserMixin):
             limits = filter(lambda limit: limit is not ..., limits)
             limits = tuple(filter(lambda limit: type(limit) is tuple, limits))
             lo, hi = JustLen(limits[0], name='for '+tup_limits_name, length=2)
+            interval = Interval(lo, hi)
 
-            def limited_tuple(value, name: str = None):
-                return AllLimited.JustTuple(value, name, alo=lo, ahi=hi)
+            def limited_tuple(value, name: str = None, **kwargs):
+                value = JustTuple(value, name)
+                return interval.check_many(value, name, **kwargs)
 
         elif all(type(limit) is tuple for limit in limits):
-
-            def limited_tuple(value, name: str = None):
-                return LimitedTuple(value, name=name, limits=limits)
-
+            limited_tuple = LimitedTuple.bind(limits=limits)
         else:
             lo, hi = JustLen(limits, name=limits_name, length=2)
-
-            def limited_tuple(value, name: str = None):
-                return Limited(value, name=name, lo=lo, hi=hi)
+            limited_tuple = Interval(lo, hi)
 
         return limited_tuple
 
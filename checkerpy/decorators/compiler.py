@@ -0,0 +1,283 @@
+from operator import lt, gt
+from itertools import repeat
+from typing import Callable, Dict, Iterable, Any
+from ..types.one import Just, JustTuple, JustDict, JustLists, JustSets
+from ..types.one import JustDicts
+from .typeparser import TypeParser
+from .boundsparser import BoundsParser
+from .mixin import identity
+
+Namespace = Dict[str, Any]
+
+TEMPLATE = '''
+def compiled(value, name=None, **kwargs):
+    if not kwargs:
+        try:
+            if {}:
+                return value
+        except Exception:
+            pass
+    return fallback(value, name, **kwargs)
+'''
+
+
+class CompilerMixin:
+    """Provides code generation common to type and bounds spec compilers"""
+    def __init__(self, parser: Callable):
+        self.__parse = parser
+        self._expression_for = {list: self.list_expression,
+                                set: self.set_expression,
+                                dict: self.dict_expression,
+                                tuple: self.tuple_expression}
+
+    def __call__(self, spec: Any) -> Callable:
+        namespace = {'_lt': lt, '_gt': gt, '_repeat': repeat}
+        try:
+            expression_for = self._expression_for[type(spec)]
+            expression = expression_for(spec, 'value', namespace)
+        except (LookupError, TypeError, AttributeError, ValueError):
+            expression = None
+        fallback = self.__parse((spec,))[0]
+        if expression is None or fallback is identity:
+            return fallback
+        namespace['fallback'] = fallback
+        exec(TEMPLATE.format(expression), namespace)
+        return namespace['compiled']
+
+    @staticmethod
+    def _constant(value: Any, namespace: Namespace) -> str:
+        name = f'_{len(namespace)}'
+        namespace[name] = value
+        return name
+
+    @staticmethod
+    def _all_of(*conditions: str) -> str:
+        conditions = tuple(filter(None, conditions))
+        if not conditions:
+            return 'True'
+        return ' and '.join(f'({condition})' for condition in conditions)
+
+    def _type_in(self, types: Iterable[type], variable: str,
+                 namespace: Namespace) -> str:
+        types = tuple(types)
+        if len(types) == 1:
+            type_ = self._constant(types[0], namespace)
+            return f'type({variable}) is {type_}'
+        types = self._constant(frozenset(types), namespace)
+        return f'type({variable}) in {types}'
+
+
+class TypeCompiler(CompilerMixin):
+    """Compiles type specifications into flat, specialized type checkers"""
+    def __init__(self):
+        super().__init__(TypeParser())
+        self._expression_for.update({type: self.type_expression})
+
+    def list_expression(self, types: list, variable: str,
+                        namespace: Namespace) -> str:
+        return self._all_of(
+            self._type_in(JustLists.types, variable, namespace),
+            self.__all_types_in(Just(*types).types, variable, namespace)
+        )
+
+    def set_expression(self, types: set, variable: str,
+                       namespace: Namespace) -> str:
+        return self._all_of(
+            self._type_in(JustSets.types, variable, namespace),
+            self.__all_types_in(Just(*types).types, variable, namespace)
+        )
+
+    def dict_expression(self, types: dict, variable: str,
+                        namespace: Namespace) -> str:
+        if len(types) != 1:
+            raise ValueError('Dictionary must have exactly one item!')
+        (keys, values), = types.items()
+        conditions = [self._type_in(JustDicts.types, variable, namespace)]
+        if keys and keys is not ...:
+            types = Just(keys).types
+            conditions.append(self.__all_types_in(types, variable, namespace))
+        if values and values is not ...:
+            types = Just(values).types
+            in_values = f'{variable}.values()'
+            conditions.append(self.__all_types_in(types, in_values, namespace))
+        return self._all_of(*conditions)
+
+    def tuple_expression(self, types: tuple, variable: str,
+                         namespace: Namespace) -> str:
+        if ... in types:
+            types = tuple(filter(lambda type_: type_ is not ..., types))
+            return self._all_of(
+                self._type_in(JustTuple.types, variable, namespace),
+                self.__all_types_in(Just(*types).types, variable, namespace)
+            )
+        elif all(type(type_) in (tuple, list, set) for type_ in types):
+            conditions = [self._type_in(JustTuple.types, variable, namespace),
+                          f'len({variable}) == {len(types)}']
+            for index, type_ in enumerate(types):
+                if not self.__is_or_contains_ellipsis(type_):
+                    types_ = Just(type_).types
+                    item = f'{variable}[{index}]'
+                    conditions.append(self._type_in(types_, item, namespace))
+            return self._all_of(*conditions)
+        return self._type_in(Just(*types).types, variable, namespace)
+
+    def type_expression(self, type_: type, variable: str,
+                        namespace: Namespace) -> str:
+        return self._type_in(Just(type_).types, variable, namespace)
+
+    def __all_types_in(self, types: Iterable[type], variable: str,
+                       namespace: Namespace) -> str:
+        types = self._constant(frozenset(types), namespace)
+        return f'all(map({types}.__contains__, map(type, {variable})))'
+
+    @staticmethod
+    def __is_or_contains_ellipsis(types: Any) -> bool:
+        is_ellipsis = types is ...
+        try:
+            contains_ellipsis = ... in types
+        except TypeError:
+            contains_ellipsis = False
+        return is_ellipsis or contains_ellipsis
+
+
+class BoundsCompiler(CompilerMixin):
+    """Compiles limits specifications into flat, specialized limit checkers"""
+    def __init__(self):
+        super().__init__(BoundsParser())
+
+    def list_expression(self, limits: list, variable: str,
+                        namespace: Namespace) -> str:
+        lo, hi = self.__valid(limits[0])
+        return self._all_of(
+            self._type_in(JustLists.types, variable, namespace),
+            self.__all_within(lo, hi, variable, namespace)
+        )
+
+    def set_expression(self, limits: set, variable: str,
+                       namespace: Namespace) -> str:
+        if len(limits) != 1:
+            raise ValueError('Set must have exactly one element!')
+        lo, hi = self.__valid(next(iter(limits)))
+        return self._all_of(
+            self._type_in(JustSets.types, variable, namespace),
+            self.__all_within(lo, hi, variable, namespace)
+        )
+
+    def dict_expression(self, limits: dict, variable: str,
+                        namespace: Namespace) -> str:
+        if len(limits) != 1:
+            raise ValueError('Dictionary must have exactly one item!')
+        (keys, values), = limits.items()
+        lo_key, hi_key = self.__valid((..., ...) if keys is ... else keys)
+        lo, hi = self.__valid((..., ...) if values is ... else values)
+        keys, values = f'{variable}.keys()', f'{variable}.values()'
+        return self._all_of(
+            self._type_in(JustDict.types, variable, namespace),
+            self.__all_within(lo_key, hi_key, keys, namespace),
+            self.__all_within(lo, hi, values, namespace)
+        )
+
+    def tuple_expression(self, limits: tuple, variable: str,
+                         namespace: Namespace) -> str:
+        contains_ellipsis = ... in limits
+        contains_tuples = any(type(limit) is tuple for limit in limits)
+        if contains_ellipsis and contains_tuples:
+            limits = filter(lambda limit: limit is not ..., limits)
+            limits = tuple(filter(lambda limit: type(limit) is tuple, limits))
+            lo, hi = self.__valid(limits[0])
+            return self._all_of(
+                self._type_in(JustTuple.types, variable, namespace),
+                self.__all_within(lo, hi, variable, namespace)
+            )
+        elif all(type(limit) is tuple for limit in limits):
+            conditions = [self._type_in(JustTuple.types, variable, namespace),
+                          f'len({variable}) == {len(limits)}']
+            for index, limit in enumerate(limits):
+                lo, hi = self.__valid(limit)
+                element = f'{variable}[{index}]'
+                conditions.append(self.__within(lo, hi, element, namespace))
+            return self._all_of(*conditions)
+        lo, hi = self.__valid(limits)
+        return self._all_of(self.__within(lo, hi, variable, namespace))
+
+    def __within(self, lo: Any, hi: Any, variable: str,
+                 namespace: Namespace) -> str:
+        comparisons = []
+        if lo is not Ellipsis:
+            comparisons.append(f'{variable} < {self._constant(lo, namespace)}')
+        if hi is not Ellipsis:
+            comparisons.append(f'{variable} > {self._constant(hi, namespace)}')
+        if not comparisons:
+            return ''
+        return f'not ({" or ".join(comparisons)})'
+
+    def __all_within(self, lo: Any, hi: Any, variable: str,
+                     namespace: Namespace) -> str:
+        conditions = []
+        if lo is not Ellipsis:
+            lo = self._constant(lo, namespace)
+            conditions.append(f'not any(map(_lt, {variable}, _repeat({lo})))')
+        if hi is not Ellipsis:
+            hi = self._constant(hi, namespace)
+            conditions.append(f'not any(map(_gt, {variable}, _repeat({hi})))')
+        return self._all_of(*conditions) if conditions else ''
+
+    @staticmethod
+    def __valid(limits: Any) -> tuple:
+        if type(limits) is not tuple or len(limits) != 2:
+            raise TypeError('Limits must be a tuple of length 2!')
+        return limits
+
+
+COMPILERS = {'type': TypeCompiler(), 'bounds': BoundsCompiler()}
+
+
+def compile(spec: Any, kind: str = 'type') -> Callable:
+    """Compiles a type or limits specification into a specialized checker.
+
+    Any single-argument specification accepted by the `Typed` (for `kind`
+    'type') or the `Bounded` (for `kind` 'bounds') decorator is translated
+    into one flat, generated function that performs all checks inline. Only
+    if one of these checks fails, or if the value cannot be checked inline,
+    is the value handed on to the same checker the decorator would use, so
+    that errors are raised and logged exactly as they would be there.
+
+    Parameters
+    ----------
+    spec
+        Type or limits specification for a single argument, e.g.,
+        ``[int]``, ``{str: ...}``, ``(float, ...)``, or ``(0, 1)``.
+    kind : str, optional
+        Either 'type' or 'bounds'. Defaults to 'type'.
+
+    Returns
+    -------
+    callable
+        A checker with call signature (value, name=None, **kwargs) that
+        returns `value` if it passes all checks.
+
+    Raises
+    ------
+    ValueError
+        If `kind` is neither 'type' nor 'bounds'.
+    TypeError
+        If `spec` is not understood by the respective decorator.
+
+    Examples
+    --------
+    >>> check = compile({str: [int]})
+    >>> check({'a': 1}, 'mapping')
+    {'a': 1}
+
+    See Also
+    --------
+    Typed, Bounded
+
+    """
+    try:
+        compiler = COMPILERS[kind]
+    except (KeyError, TypeError) as error:
+        message = ("Kind of specification must be 'type' or 'bounds',"
+                   f' not {kind}!')
+        raise ValueError(message) from error
+    return compiler(spec)
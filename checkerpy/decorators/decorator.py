@@ -1,42 +1,300 @@
+from sys import maxsize
+from functools import partial
+from inspect import iscoroutinefunction, isasyncgenfunction
+from inspect import isgeneratorfunction
 from types import FunctionType, MethodType
-from typing import Union, Callable, Tuple, Any, Dict
+from typing import Union, Callable, Tuple, Generator, Optional, FrozenSet
+from typing import Any, Dict
+from ..levels import LEVELS, OPTIONS, Level
+from ..profiling import REGISTRY, Record, Timed
+from ..functional.offloaded import Offloaded
 from .mixin import identity
+from .variadic import StarArgs, StarKwargs, batched, star_names_from
+from .variadic import exact_types_of
 
 Func = Union[FunctionType, MethodType]
 FuncSpecs = Tuple[int, Tuple[str, str, str], tuple]
 Decorated = Callable[[Tuple[Any, ...], Dict[str, Any]], Any]
+Yields = Optional[Tuple[str, Callable, FrozenSet[type]]]
+Tables = Tuple[tuple, Dict[str, tuple], tuple, Yields]
+Stars = Dict[str, Tuple[Callable, Callable[[Callable], Callable]]]
+
+
+async def checked(args: tuple, kwargs: dict, by_position: tuple,
+                  by_name: Dict[str, tuple], variadic: tuple,
+                  yields: Yields) -> None:
+    """Checks arguments of coroutines, awaiting offloaded checks"""
+    n_args = len(args)
+    for name, value in kwargs.items() if by_name else ():
+        if name in by_name:
+            position, arg_name, check = by_name[name]
+            if position >= n_args:
+                await offloaded(check, value, arg_name)
+    for position, arg_name, check in by_position:
+        if position >= n_args:
+            break
+        await offloaded(check, args[position], arg_name)
+    for check in variadic:
+        check(args, kwargs)
+
+
+async def offloaded(check: Callable, value: Any, arg_name: str) -> None:
+    """Runs offloaded checks in their executor and all others right away"""
+    checker = check.func if type(check) is partial else check
+    if type(checker) is Offloaded:
+        from asyncio import get_running_loop
+        loop = get_running_loop()
+        check = partial(check, value, arg_name)
+        _ = await loop.run_in_executor(checker.executor, check)
+    else:
+        _ = check(value, arg_name)
+
+
+def yielded(generator: Generator, name: str, check: Callable,
+            allowed: FrozenSet[type]) -> Generator:
+    """Checks items of a generator as they are yielded, passing on the rest"""
+    try:
+        value = next(generator)
+        while True:
+            if type(value) not in allowed:
+                _ = check(value, name)
+            try:
+                sent = yield value
+            except GeneratorExit:
+                raise
+            except BaseException as error:
+                value = generator.throw(error)
+            else:
+                value = generator.send(sent)
+    except StopIteration as stop:
+        return stop.value
+    finally:
+        generator.close()
+
+
+def profiled(check: Callable, record: Record) -> Callable:
+    """Times checks, keeping offloaded ones recognizable as such"""
+    if type(check) is Offloaded:
+        return Offloaded(Timed(check.checker, record), check.executor)
+    return Timed(check, record)
+
+
+class TablesPerLevel(dict):
+    """Builds tables of checks for a validation level on first lookup"""
+    def __init__(self, build: Callable[[Dict[str, Any]], Tables]) -> None:
+        super().__init__()
+        self.__build = build
+
+    def __missing__(self, level: Level) -> Tables:
+        tables = self[level] = self.__build(OPTIONS[level])
+        return tables
 
 
 class Decorator:
-    def __init__(self, parser: Callable, *arg_specs, **kwarg_specs) -> None:
+    def __init__(self, parser: Callable, *arg_specs,
+                 yields: Any = ..., **kwarg_specs) -> None:
         self.parsed = parser
         self.arg_checks = self.parsed(arg_specs)
         self.n_arg_specs = len(self.arg_checks)
         self.kwarg_checks = self.parsed(kwarg_specs)
+        self.yield_check = self.parsed({'yields': yields})['yields']
 
     def __call__(self, function_to_decorate: Func) -> Decorated:
         first_index, func_specs, names = self.type_of(function_to_decorate)
         arg_string = self.arg_string_from(func_specs)
+        star_names = star_names_from(function_to_decorate)
+        kind = self.kind_of(function_to_decorate)
         function_to_decorate.__argnames__ = names
+        function_to_decorate.__starnames__ = star_names
+        function_to_decorate.__kind__ = kind
         names = names[first_index:]
-        n_names = len(names)
-        arg_range = range(min(n_names, self.n_arg_specs))
-        for arg in arg_range:
-            if names[arg] not in self.kwarg_checks.keys():
-                self.kwarg_checks.update({names[arg]: self.arg_checks[arg]})
+        checks = self.checks_for(names)
+        yields = self.yields_for(kind, func_specs)
+        module = function_to_decorate.__module__
+        if not (checks or yields) or LEVELS[module] is Level.OFF:
+            return function_to_decorate
+        positions = {name: first_index + index
+                     for index, name in enumerate(names)}
+        stars = self.stars_for(checks, star_names, names, arg_string)
+        if kind == 'coroutine':
+            wrap = self.coroutine_wrapper
+        elif kind == 'async generator':
+            wrap = self.async_generator_wrapper
+        else:
+            wrap = self.generator_wrapper if yields else self.function_wrapper
+            checks = {name: check.checker if type(check) is Offloaded
+                      else check for name, check in checks.items()}
+        site = f'{module}.{function_to_decorate.__qualname__}'
+        tables = REGISTRY.watch(TablesPerLevel(partial(
+            self.tables_for, checks, stars, yields,
+            positions, arg_string, site)))
+        typed_function = wrap(function_to_decorate, module, tables)
+        return self.transfer_attributes(function_to_decorate, typed_function)
+
+    @staticmethod
+    def function_wrapper(function: Callable, module: str,
+                         tables: TablesPerLevel) -> Callable:
+        off = Level.OFF
 
         def typed_function(*args, **kwargs):
-            named_args = kwargs.copy()
+            level = LEVELS[module]
+            if level is off:
+                return function(*args, **kwargs)
+            by_position, by_name, variadic, _ = tables[level]
             n_args = len(args)
-            i_args = range(min(n_args-first_index, n_names))
-            for i_arg in i_args:
-                named_args.update({names[i_arg]: args[first_index + i_arg]})
-            for arg_name, arg_value in named_args.items():
-                kwarg_check = self.kwarg_checks.get(arg_name, identity)
-                _ = kwarg_check(arg_value, arg_string.format(arg_name))
-            return function_to_decorate(*args, **kwargs)
+            for name, value in kwargs.items() if by_name else ():
+                if name in by_name:
+                    position, arg_name, check = by_name[name]
+                    if position >= n_args:
+                        _ = check(value, arg_name)
+            for position, arg_name, check in by_position:
+                if position >= n_args:
+                    break
+                _ = check(args[position], arg_name)
+            for check in variadic:
+                check(args, kwargs)
+            return function(*args, **kwargs)
 
-        return self.transfer_attributes(function_to_decorate, typed_function)
+        return typed_function
+
+    @classmethod
+    def generator_wrapper(cls, function: Callable, module: str,
+                          tables: TablesPerLevel) -> Callable:
+        off = Level.OFF
+        typed_function = cls.function_wrapper(function, module, tables)
+
+        def checked_generator(*args, **kwargs):
+            level = LEVELS[module]
+            if level is off:
+                return function(*args, **kwargs)
+            yields = tables[level][3]
+            return yielded(typed_function(*args, **kwargs), *yields)
+
+        return checked_generator
+
+    @staticmethod
+    def coroutine_wrapper(function: Callable, module: str,
+                          tables: TablesPerLevel) -> Callable:
+        off = Level.OFF
+
+        async def typed_function(*args, **kwargs):
+            level = LEVELS[module]
+            if level is not off:
+                await checked(args, kwargs, *tables[level])
+            return await function(*args, **kwargs)
+
+        return typed_function
+
+    @staticmethod
+    def async_generator_wrapper(function: Callable, module: str,
+                                tables: TablesPerLevel) -> Callable:
+        off = Level.OFF
+
+        async def typed_function(*args, **kwargs):
+            level = LEVELS[module]
+            yields = None
+            if level is not off:
+                checks = tables[level]
+                yields = checks[3]
+                await checked(args, kwargs, *checks)
+            generator = function(*args, **kwargs)
+            try:
+                value = await generator.__anext__()
+                while True:
+                    if yields and type(value) not in yields[2]:
+                        _ = yields[1](value, yields[0])
+                    try:
+                        sent = yield value
+                    except GeneratorExit:
+                        raise
+                    except BaseException as error:
+                        value = await generator.athrow(error)
+                    else:
+                        value = await generator.asend(sent)
+            except StopAsyncIteration:
+                return
+            finally:
+                await generator.aclose()
+
+        return typed_function
+
+    @staticmethod
+    def kind_of(function_to_decorate: Func) -> str:
+        if hasattr(function_to_decorate, '__kind__'):
+            return function_to_decorate.__kind__
+        if iscoroutinefunction(function_to_decorate):
+            return 'coroutine'
+        if isasyncgenfunction(function_to_decorate):
+            return 'async generator'
+        if isgeneratorfunction(function_to_decorate):
+            return 'generator'
+        return 'function'
+
+    def yields_for(self, kind: str, func_specs: Tuple[str, str, str]) -> Any:
+        if self.yield_check is identity:
+            return None
+        func_string = '{} {} defined in module {}'.format(*func_specs)
+        if kind not in ('generator', 'async generator'):
+            message = (f'Cannot check values yielded by {func_string},'
+                       ' because it is not a generator function!')
+            raise TypeError(message)
+        check = self.yield_check
+        return f'item yielded by {func_string}', check, exact_types_of(check)
+
+    def checks_for(self, names: Tuple[str, ...]) -> Dict[str, Callable]:
+        checks = dict(zip(names, self.arg_checks))
+        checks.update(self.kwarg_checks)
+        return {name: check for name, check in checks.items()
+                if check is not identity}
+
+    @staticmethod
+    def stars_for(checks: Dict[str, Callable], star_names: tuple,
+                  names: Tuple[str, ...], arg_string: str) -> Stars:
+        star, starstar, start = star_names
+        stars = {}
+        if star in checks:
+            stars[star] = partial(StarArgs, start=start,
+                                  arg_string=arg_string, star=star)
+        if starstar in checks:
+            stars[starstar] = partial(StarKwargs, named=frozenset(names),
+                                      arg_string=arg_string)
+        for name, star_checks in stars.items():
+            check = checks.pop(name)
+            check = check.checker if type(check) is Offloaded else check
+            stars[name] = check, partial(star_checks, accepts=batched(check))
+        return stars
+
+    @staticmethod
+    def tables_for(checks: Dict[str, Callable], stars: Stars, yields: Yields,
+                   positions: Dict[str, int], arg_string: str, site: str,
+                   options: Dict[str, Any]) -> Tables:
+        variadic = {name: star_checks(partial(check, **options)
+                                      if options else check)
+                    for name, (check, star_checks) in stars.items()}
+        if REGISTRY.enabled:
+            variadic = {name: Timed(check, REGISTRY.record(site, name))
+                        for name, check in variadic.items()}
+        if REGISTRY.enabled:
+            checks = {name: profiled(check, REGISTRY.record(site, name))
+                      for name, check in checks.items()}
+        if options:
+            checks = {name: partial(check, **options)
+                      for name, check in checks.items()}
+        by_position = tuple(sorted((positions[name], arg_string.format(name),
+                                    check) for name, check in checks.items()
+                                   if name in positions))
+        by_name = {name: (positions.get(name, maxsize),
+                          arg_string.format(name), check)
+                   for name, check in checks.items()}
+        if yields is not None:
+            yield_string, check, allowed = yields
+            if REGISTRY.enabled:
+                check = Timed(check, REGISTRY.record(site, 'yields'))
+                allowed = frozenset()
+            if options:
+                check = partial(check, **options)
+            yields = yield_string, check, allowed
+        return by_position, by_name, tuple(variadic.values()), yields
 
     def type_of(self, function_to_decorate: Func) -> FuncSpecs:
         func_name = function_to_decorate.__name__
@@ -1,4 +1,8 @@
 from typing import Union, Dict, Callable, List, Any
+from ..functional.sampled import Sampled
+from ..functional.offloaded import Offloaded
+from ..functional.memoized import Memoized
+from .speccache import SpecCache, key_for
 
 CheckerDict = Dict[type, Callable]
 Specs = Union[tuple, dict]
@@ -13,24 +17,53 @@ def identity(value: Any, name: str = None, **kwargs) -> Any:
 
 class ParserMixin:
     """Provides basic functionality for *args and **kwargs parsers"""
+    _interned = SpecCache()
+
     def __init__(self):
         self._checker_for: CheckerDict = {type(...): self.ellipsis_checker,
                                           list: self.list_checker,
                                           set: self.set_checker,
                                           dict: self.dict_checker,
-                                          tuple: self.tuple_checker}
+                                          tuple: self.tuple_checker,
+                                          Sampled: self.sampled_checker,
+                                          Offloaded: self.offloaded_checker,
+                                          Memoized: self.memoized_checker}
 
     def __call__(self, specs: Specs) -> Checkers:
         specs, checkers = self._iterators_for(specs)
         for spec_id, spec in specs:
-            try:
-                checker_for = self._checker_for[type(spec)]
-            except KeyError as error:
-                message = self._wrong_spec_message_for(spec, spec_id)
-                raise TypeError(message) from error
-            checkers[spec_id] = checker_for(spec, spec_id)
+            checkers[spec_id] = self.__checker_from(spec, spec_id)
         return checkers
 
+    def sampled_checker(self, spec: Sampled, spec_id: SpecID) -> Callable:
+        checker = self.__checker_from(spec.checker, spec_id)
+        return Sampled(checker, spec.k, spec.seed)
+
+    def offloaded_checker(self, spec: Offloaded, spec_id: SpecID) -> Callable:
+        checker = self.__checker_from(spec.checker, spec_id)
+        return Offloaded(checker, spec.executor)
+
+    def memoized_checker(self, spec: Memoized, spec_id: SpecID) -> Callable:
+        checker = self.__checker_from(spec.checker, spec_id)
+        return Memoized(checker, spec.maxsize)
+
+    def __checker_from(self, spec: Any, spec_id: SpecID) -> Callable:
+        key = key_for(spec)
+        checker = self._interned.get(key)
+        if checker is None:
+            checker = self.__parsed(spec, spec_id)
+            if key is not None:
+                _ = self._interned.add(key, checker)
+        return checker
+
+    def __parsed(self, spec: Any, spec_id: SpecID) -> Callable:
+        try:
+            checker_for = self._checker_for[type(spec)]
+        except KeyError as error:
+            message = self._wrong_spec_message_for(spec, spec_id)
+            raise TypeError(message) from error
+        return checker_for(spec, spec_id)
+
     def _iterators_for(self, specs: Specs) -> (Specs, Checkers):
         type_of_specs = type(specs)
         if type_of_specs not in (tuple, dict):
@@ -0,0 +1,105 @@
+from threading import RLock
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Any
+from ..functional.sampled import Sampled
+from ..functional.offloaded import Offloaded
+from ..functional.memoized import Memoized
+
+
+class SpecCache(OrderedDict):
+    """Bounded cache of checkers parsed from specifications, evicting LRU.
+
+    Checkers are stored under the normalized form of the specification they
+    were parsed from (see `key_for`), such that identical specifications in
+    many decorators resolve to one and the same checker instead of parsing
+    new ones every time. If the cache is full, the least recently used entry
+    is evicted to make room for a new one.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of checkers to cache. Defaults to 1024.
+
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        super().__init__()
+        self.__maxsize = maxsize
+        self.__lock = RLock()
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.__lock:
+            if key not in self:
+                return default
+            self.move_to_end(key)
+            return self[key]
+
+    def add(self, key: Hashable, checker: Callable) -> Callable:
+        """Caches `checker` under the given key and returns it.
+
+        Parameters
+        ----------
+        key
+            Normalized specification to cache the checker under.
+        checker : callable
+            The checker to cache.
+
+        Returns
+        -------
+        callable
+            The cached `checker`.
+
+        """
+        with self.__lock:
+            if self.__maxsize > 0:
+                self[key] = checker
+                self.move_to_end(key)
+                while len(self) > self.__maxsize:
+                    self.popitem(last=False)
+        return checker
+
+
+def key_for(spec: Any) -> Optional[Hashable]:
+    """Normalizes a specification into a hashable key.
+
+    Containers are converted into tuples tagged with their type and all other
+    values are tagged with their type as well. That way, specifications that
+    merely compare equal, like (0, 1) and (0.0, 1.0), are told apart and do
+    not share a checker that would report limits of the wrong type.
+
+    Parameters
+    ----------
+    spec
+        Type or limits specification for a single argument.
+
+    Returns
+    -------
+    tuple or None
+        The normalized specification or None if (part of) `spec` is not
+        hashable.
+
+    """
+    try:
+        return _normalized(spec)
+    except TypeError:
+        return None
+
+
+def _normalized(spec: Any) -> Hashable:
+    kind = type(spec)
+    if kind in (tuple, list, set):
+        return kind, tuple(map(_normalized, spec))
+    if kind is dict:
+        return kind, tuple(map(_normalized, spec.items()))
+    if kind is Sampled:
+        return kind, _normalized(spec.checker), spec.k, _normalized(spec.seed)
+    if kind is Offloaded:
+        return kind, _normalized(spec.checker), _normalized(spec.executor)
+    if kind is Memoized:
+        return kind, _normalized(spec.checker), spec.maxsize
+    _ = hash(spec)
+    return kind, spec
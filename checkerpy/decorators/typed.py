@@ -13,6 +13,9 @@ class Typed(Decorator):
     **kwarg_types
         Type specification for function or method arguments by name. May
         be ellipsis, a type, or an iterable of types. See Examples.
+    yields : optional
+        Type specification for items yielded by generator functions or
+        asynchronous generator functions. Defaults to ellipsis.
 
     Examples
     --------
@@ -60,6 +63,35 @@ class Typed(Decorator):
     ...     print(f'{x[0]} is {x[2]} years old.')
     ...     return x[1]
 
+    To check only a sample of the elements of very long lists or tuples of
+    arbitrary length, wrap their specification in `Sampled` with the number
+    of elements to check, which always include the first and the last one.
+
+    >>> @Typed(Sampled([float], 1000))
+    >>> def f(x):
+    ...     return sum(x)
+
+    To check every single argument passed through variadic ``*args`` or
+    ``**kwargs``, specify types for them by the name of these parameters.
+
+    >>> @Typed(str, args=int, kwargs=(int, float))
+    >>> def f(x, *args, **kwargs):
+    ...     return x, sum(args) + sum(kwargs.values())
+
+    To check every item yielded by a generator function, pass its type
+    specification as `yields`. Items are checked one by one as they are
+    produced, without ever collecting them, and values sent or exceptions
+    thrown into the generator are passed on. Arguments, however, are checked
+    right away, when the decorated function is called, rather than only once
+    the first item is requested. The decorated function is, therefore, a
+    plain function that returns a generator and ``inspect.isgeneratorfunction``
+    reports False for it.
+
+    >>> @Typed(int, yields=(int, float))
+    >>> def f(n):
+    ...     for i in range(n):
+    ...         yield i / 2 if i % 2 else i
+
     Notes
     -----
     The first argument of (class) methods must be called `self`, `cls`, `mcs`,
@@ -67,13 +99,16 @@ class Typed(Decorator):
     function or method call is never a problem and neither is specifying types
     for named keyword arguments that do not actually occur in the function or
     method signature. Specifying types per named keyword argument takes
-    precedence over type specification by positional argument.
+    precedence over type specification by positional argument. Because
+    `yields` is reserved for yielded items, arguments named "yields" can
+    only be specified by position.
 
     Raises
     ------
     TypeError
         If the specified types to check for contain one or more entries that
-        are not of type ``type`` themselves.
+        are not of type ``type`` themselves, or if `yields` is specified for
+        a function that is not a generator function.
     WrongTypeError
         If one function or method argument has a type that is not among the
         types specified for that argument.
@@ -3,10 +3,13 @@ from ..types.all import All, TypedDict, TypedTuple
 from ..types.one import Just
 from ..validators.one import JustLen
 from .mixin import ParserMixin, SpecID
+from .speccache import SpecCache
 
 
 class TypeParser(ParserMixin):
     """Takes tuple or dict of type specifications and returns type checkers"""
+    _interned = SpecCache()
+
     def __init__(self):
         super().__init__()
         self._checker_for.update({type: self.type_checker})
@@ -18,8 +21,8 @@ class TypeParser(ParserMixin):
             return All(*types).JustTuple
         elif all(type(type_) in (tuple, list, set) for type_ in types):
 
-            def typed_tuple(value, name: str = None):
-                return TypedTuple(value, name=name, types=types)
+            def typed_tuple(value, name: str = None, **kwargs):
+                return TypedTuple(value, name=name, types=types, **kwargs)
 
             return typed_tuple
         else:
@@ -39,8 +42,8 @@ class TypeParser(ParserMixin):
         keys = tuple(types.keys())[0]
         values = tuple(types.values())[0]
 
-        def typed_dict(mapping, name: str = None):
-            return TypedDict(mapping, name=name, keys=keys, values=values)
+        def typed_dict(mapping, name: str = None, **kwargs):
+            return TypedDict(mapping, name, keys=keys, values=values, **kwargs)
 
         return typed_dict
 
@@ -0,0 +1,161 @@
+from itertools import islice
+from inspect import CO_VARARGS, CO_VARKEYWORDS
+from typing import Callable, Iterable, Optional, FrozenSet, Tuple
+from ..functional.context import Deferred
+from ..types.one import Just
+
+Accepts = Optional[Callable[[Iterable], bool]]
+StarNames = Tuple[Optional[str], Optional[str], int]
+
+
+def exact_types_of(check: Callable) -> FrozenSet[type]:
+    """Types that values passing a check can have, if it is a type check.
+
+    Parameters
+    ----------
+    check : callable
+        Checker for a single value.
+
+    Returns
+    -------
+    frozenset
+        The types the `check` checks for, without subclasses, or an empty
+        set if `check` is not a type checker.
+
+    """
+    return frozenset(check.types) if type(check) is Just else frozenset()
+
+
+def batched(check: Callable) -> Accepts:
+    """Decides at once whether all of many values pass a type check.
+
+    Parameters
+    ----------
+    check : callable
+        Checker for a single value.
+
+    Returns
+    -------
+    callable or None
+        Function that returns True if all values in the iterable it is
+        called with are of exactly one of the types the `check` checks for,
+        or None if `check` is not a type checker.
+
+    """
+    allowed = exact_types_of(check)
+    if not allowed:
+        return None
+
+    def accepts(values: Iterable) -> bool:
+        return allowed.issuperset(map(type, values))
+
+    return accepts
+
+
+class StarArgs:
+    """Checks all positional arguments collected by ``*args`` of a function.
+
+    Arguments are taken straight from the tuple of all positional arguments
+    that the function is called with, without slicing it. If they are all of
+    the right type already, they are accepted all at once. Otherwise, and
+    for all other checks, they are checked one by one.
+
+    Parameters
+    ----------
+    check : callable
+        Checker for every single positional argument collected by ``*args``.
+    start : int
+        Number of positional arguments taken by named parameters.
+    arg_string : str
+        Template for names of arguments, to be formatted with their name.
+    star : str
+        The name of the ``*args`` parameter.
+    accepts : callable, optional
+        Decides at once whether all arguments pass. Defaults to None.
+
+    """
+
+    def __init__(self, check: Callable, start: int, arg_string: str,
+                 star: str, accepts: Accepts = None) -> None:
+        self.__check = check
+        self.__start = start
+        self.__arg_string = arg_string
+        self.__star = star
+        self.__accepts = accepts
+
+    def __call__(self, args: tuple, kwargs: dict) -> None:
+        start = self.__start
+        if len(args) <= start:
+            return
+        if self.__accepts and self.__accepts(islice(args, start, None)):
+            return
+        for index in range(start, len(args)):
+            name = Deferred(self.__name_from, index - start)
+            _ = self.__check(args[index], name)
+
+    def __name_from(self, index: int) -> str:
+        return self.__arg_string.format(f'{self.__star}[{index}]')
+
+
+class StarKwargs:
+    """Checks all keyword arguments collected by ``**kwargs`` of a function.
+
+    If none of the keyword arguments a function is called with are taken by
+    named parameters and they are all of the right type already, they are
+    accepted all at once. Otherwise, they are checked one by one.
+
+    Parameters
+    ----------
+    check : callable
+        Checker for every single keyword argument collected by ``**kwargs``.
+    named : frozenset
+        Names of all named parameters of the function.
+    arg_string : str
+        Template for names of arguments, to be formatted with their name.
+    accepts : callable, optional
+        Decides at once whether all arguments pass. Defaults to None.
+
+    """
+
+    def __init__(self, check: Callable, named: FrozenSet[str],
+                 arg_string: str, accepts: Accepts = None) -> None:
+        self.__check = check
+        self.__named = named
+        self.__arg_string = arg_string
+        self.__accepts = accepts
+
+    def __call__(self, args: tuple, kwargs: dict) -> None:
+        if not kwargs:
+            return
+        named = self.__named
+        if self.__accepts and named.isdisjoint(kwargs):
+            if self.__accepts(kwargs.values()):
+                return
+        for name, value in kwargs.items():
+            if name not in named:
+                _ = self.__check(value, self.__arg_string.format(name))
+
+
+def star_names_from(function: Callable) -> StarNames:
+    """Names of the ``*args`` and ``**kwargs`` parameters of a function.
+
+    Parameters
+    ----------
+    function : callable
+        The function to inspect.
+
+    Returns
+    -------
+    tuple
+        The name of the ``*args`` parameter (or None if there is none), the
+        name of the ``**kwargs`` parameter (or None if there is none), and
+        the number of positional parameters of the `function`.
+
+    """
+    if hasattr(function, '__starnames__'):
+        return function.__starnames__
+    code = function.__code__
+    names = iter(code.co_varnames[code.co_argcount+code.co_kwonlyargcount:])
+    star = next(names) if code.co_flags & CO_VARARGS else None
+    starstar = next(names) if code.co_flags & CO_VARKEYWORDS else None
+    return star, starstar, code.co_argcount
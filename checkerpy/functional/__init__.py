@@ -1 +1,2 @@
 from .composition import CompositionOf
+from .bound import Bound
@@ -0,0 +1,97 @@
+from sys import modules
+from operator import lt, gt
+from typing import Callable, Optional, Tuple, Union, Any
+
+NUMERIC_KINDS = frozenset('biuf')
+
+
+def numeric_array(value: Any) -> Any:
+    """Returns `value` if it is a numpy array of booleans or numbers.
+
+    Numpy is never imported here. If it has not been imported elsewhere,
+    there cannot be any numpy arrays around, and None is returned right away.
+    That way, checkers work the same with and without numpy installed.
+
+    Parameters
+    ----------
+    value
+        The value to inspect.
+
+    Returns
+    -------
+    ndarray or None
+        The `value` passed in if it is a numpy array with a boolean, integer,
+        or floating-point dtype and None otherwise.
+
+    """
+    numpy = modules.get('numpy')
+    if numpy is None or not isinstance(value, numpy.ndarray):
+        return None
+    return value if value.dtype.kind in NUMERIC_KINDS else None
+
+
+def vectorizable(limit: Any) -> bool:
+    """Checks if a limit can be compared to numeric arrays all at once."""
+    if limit is Ellipsis or isinstance(limit, (int, float)):
+        return True
+    numpy = modules['numpy']
+    return isinstance(limit, (numpy.integer, numpy.floating))
+
+
+def first_outside(array: Any, lo: Any, hi: Any, below: Callable = lt,
+                  above: Callable = gt) -> Optional[int]:
+    """Finds the first element of a numeric array outside the given limits.
+
+    Whether any element lies outside is decided with a single `min()`
+    and/or `max()` reduction. Only if that is the case, or if the reduction
+    is inconclusive because the array contains NaN, elements are compared to
+    the limits one by one (at C speed) and the offending index is found
+    with `argmax`. Just like a NaN compared to a limit, NaNs in the array
+    never lie outside.
+
+    Parameters
+    ----------
+    array : ndarray
+        Numeric array to check the elements of.
+    lo
+        Lower bound for all elements or Ellipsis if there is none.
+    hi
+        Upper bound for all elements or Ellipsis if there is none.
+    below : callable, optional
+        Comparison telling if elements lie below `lo`. Defaults to ``lt``,
+        which treats `lo` as inside. Pass ``le`` to treat it as outside.
+    above : callable, optional
+        Comparison telling if elements lie above `hi`. Defaults to ``gt``,
+        which treats `hi` as inside. Pass ``ge`` to treat it as outside.
+
+    Returns
+    -------
+    int or None
+        Index into the flattened `array` of the first element that lies
+        outside the limits or None if there is none.
+
+    """
+    if array.size == 0:
+        return None
+    outside = None
+    if lo is not Ellipsis:
+        lowest = array.min()
+        if below(lowest, lo) or lowest != lowest:
+            outside = below(array, lo)
+    if hi is not Ellipsis:
+        highest = array.max()
+        if above(highest, hi) or highest != highest:
+            too_high = above(array, hi)
+            outside = too_high if outside is None else outside | too_high
+    if outside is None:
+        return None
+    index = int(outside.argmax())
+    return index if outside.flat[index] else None
+
+
+def position_of(array: Any, index: int) -> Union[int, Tuple[int, ...]]:
+    """Converts an index into a flattened array into one into the array."""
+    if array.ndim == 1:
+        return index
+    numpy = modules['numpy']
+    return tuple(map(int, numpy.unravel_index(index, array.shape)))
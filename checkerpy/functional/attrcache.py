@@ -0,0 +1,134 @@
+from itertools import filterfalse
+from typing import Any, Iterable, Tuple
+from types import FunctionType, BuiltinFunctionType, MethodDescriptorType
+from types import WrapperDescriptorType, ClassMethodDescriptorType
+from .typecache import TypeCache
+
+IMMUTABLE = 1 << 8  # Py_TPFLAGS_IMMUTABLETYPE
+MISSING = object()
+GETTERS = frozenset({FunctionType, BuiltinFunctionType, MethodDescriptorType,
+                     WrapperDescriptorType, ClassMethodDescriptorType,
+                     classmethod, staticmethod})
+
+
+def provides(type_: type, attr: str) -> bool:
+    """Checks if every instance of a type has an attribute by virtue of it.
+
+    That is the case if the attribute is found in the namespace of (one of
+    the classes in the MRO of) the type and retrieving it from an instance
+    cannot fail. Data descriptors, like properties or slots, can raise an
+    AttributeError and, therefore, do not count. Neither do attributes of
+    types that customize attribute access in python or in extension modules,
+    because these might hide attributes that are defined on the type.
+
+    Parameters
+    ----------
+    type_ : type
+        The type of the instances to check for the attribute.
+    attr : str
+        The name of the attribute to check for.
+
+    Returns
+    -------
+    bool
+        True if all instances of `type_` have the attribute `attr` and False
+        if that cannot be decided without inspecting the instance itself.
+
+    """
+    getattribute = lookup(type_, '__getattribute__')
+    if type(getattribute) is not WrapperDescriptorType:
+        return False
+    if getattribute.__objclass__.__module__ != 'builtins':
+        return False
+    found = lookup(type_, attr)
+    if found is MISSING:
+        return False
+    kind = type(found)
+    return kind in GETTERS or not hasattr(kind, '__get__')
+
+
+def lookup(type_: type, attr: str) -> Any:
+    """Finds an attribute in the namespaces of the MRO of a type."""
+    for klass in type_.__mro__:
+        namespace = vars(klass)
+        if attr in namespace:
+            return namespace[attr]
+    return MISSING
+
+
+class AttrCache(TypeCache):
+    """Bounded cache of the attributes that types provide to all instances.
+
+    For each type, the names of attributes that are known to be present on
+    every instance (see `provides`) are stored as a frozenset, together with
+    the names of all attributes examined so far. Checking instances of the
+    same type for the same attributes again then only requires checking the
+    rest of them on the instance itself. To notice if the type is mutated,
+    the attribute names in the namespaces of all classes in its MRO are kept
+    as well and compared to the current ones whenever the cached result is
+    used. It is recomputed if attributes were added to or deleted from (one
+    of the classes in) the MRO or if the bases of one of these classes were
+    reassigned. Replacing an attribute by another of the same name goes
+    unnoticed. The types of built-in objects cannot be mutated.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of types to cache attributes for. Defaults to 256.
+
+    Examples
+    --------
+    >>> cache = AttrCache()
+    >>> cache.unverified(list, ('append', 'foo'))
+    ('foo',)
+
+    """
+
+    def unverified(self, type_: type, attrs: Tuple[str, ...]) -> tuple:
+        """Names of the attributes not provided by the type of instances.
+
+        Parameters
+        ----------
+        type_ : type
+            The type of the instances to check for attributes.
+        attrs : tuple(str)
+            The names of the attributes to check for.
+
+        Returns
+        -------
+        tuple
+            The names in `attrs` that need to be checked on instances.
+
+        """
+        entry = self.get(id(type_))
+        if entry is None or not self.__current(type_, *entry[:2]):
+            entry = self.__entry_for(type_, attrs, frozenset())
+        verified, examined = entry[2:]
+        if verified.issuperset(attrs):
+            return ()
+        if not examined.issuperset(attrs):
+            entry = self.__entry_for(type_, attrs, examined)
+            verified = entry[2]
+        return tuple(filterfalse(verified.__contains__, attrs))
+
+    def __entry_for(self, type_: type, attrs: Iterable[str],
+                    examined: frozenset) -> tuple:
+        examined = examined.union(attrs)
+        verified = frozenset(attr for attr in examined
+                             if provides(type_, attr))
+        if type_.__flags__ & IMMUTABLE:
+            bases, names = None, None
+        else:
+            bases = type_.__mro__[1:]
+            names = tuple(frozenset(vars(klass)) for klass in type_.__mro__)
+        return self.add(type_, (bases, names, verified, examined))
+
+    @staticmethod
+    def __current(type_: type, bases: tuple, names: tuple) -> bool:
+        if names is None:
+            return True
+        mro = type_.__mro__
+        if mro[1:] != bases:
+            return False
+        return all(vars(klass).keys() == keys
+                   for klass, keys in zip(mro, names))
@@ -0,0 +1,63 @@
+from types import MappingProxyType
+from typing import Callable, Mapping, Any
+from .mixins import CompositionMixin
+from ..levels import LEVELS
+
+
+class Bound(CompositionMixin):
+    """Validator with its specification validated and normalized only once.
+
+    Returned by the `bind` class method of validators, for example,
+    ``JustLen.bind(length=(2, 3))``. When called, only the value passed in
+    is checked, against the specification that was validated and normalized
+    at binding time. Keyword arguments that replace (part of) the bound
+    specification are passed on to the validator itself, together with the
+    rest of the bound specification. All other keyword arguments are ignored,
+    just as the validator itself would ignore them.
+
+    Parameters
+    ----------
+    validator : type
+        The validator class that the specification was bound to.
+    check : callable
+        Checks a value, given its name and the normalized specification.
+    spec : dict
+        The specification as passed to `bind`.
+    *normalized
+        The specification as validated and normalized by the `validator`.
+
+    Methods
+    -------
+    o(callable) : CompositionOf
+        Daisy-chains the bound validator to another `callable`, returning the
+        functional composition of both.
+
+    """
+
+    def __init__(self, validator: type, check: Callable,
+                 spec: Mapping[str, Any], *normalized) -> None:
+        self.__validator = validator
+        self.__check = check
+        self.__spec = MappingProxyType(dict(spec))
+        self.__normalized = normalized
+        self.__name__ = validator.__name__
+
+    @property
+    def validator(self) -> type:
+        return self.__validator
+
+    @property
+    def spec(self) -> Mapping[str, Any]:
+        return self.__spec
+
+    @property
+    def normalized(self) -> tuple:
+        return self.__normalized
+
+    def __call__(self, value: Any, name: str = None, **kwargs) -> Any:
+        if LEVELS.off:
+            return value
+        if kwargs and not self.__spec.keys().isdisjoint(kwargs):
+            spec = {**self.__spec, **kwargs}
+            return self.__validator(value, name, **spec)
+        return self.__check(value, name, *self.__normalized)
@@ -1,6 +1,8 @@
-from typing import Callable
+from typing import Callable, Tuple
 from ..exceptions import CallableError
 
+MISSING = object()
+
 
 class CompositionOf:
     """Combines two callables into their functional composition.
@@ -20,10 +22,14 @@ class CompositionOf:
     CompositionOf
         The returned object is a callable itself, representing the functional
         composition of the two inputs. Attributes of the second input callable
-        are simply re-attached to the returned object if they start with a
-        lowercase letter. If an attribute starts with an uppercase letter
-        and is callable, then a composition of the returned object and that
-        attribute is attached to the returned object as attribute.
+        are simply forwarded by the returned object if they start with a
+        lowercase letter and are not callable. If an attribute starts with an
+        uppercase letter and is callable, then a composition of the returned
+        object and that attribute is returned instead. Both are only looked up
+        on first access and then cached. Compositions of compositions are
+        flattened into a single sequence of callables that are called one
+        after the other, such that call depth does not grow with the length
+        of a daisy chain.
 
     Methods
     -------
@@ -43,22 +49,19 @@ class CompositionOf:
     """
 
     def __init__(self, first: Callable, second: Callable) -> None:
-        self.__first = self.__callable(first)
+        stages_of_first = self.__stages_of(first)
         self.__second = self.__callable(second)
+        self.__stages = self.__stages_of(second) + stages_of_first
         self.__copy_attributes_from_second_to_self()
 
     def __call__(self, value, name=None, **kwargs):
-        try:
-            intermediate = self.__second(value, name, **kwargs)
-        except TypeError as error:
-            message = self.__not_callable_message_for(self.__second)
-            raise CallableError(message) from error
-        try:
-            final = self.__first(intermediate, name, **kwargs)
-        except TypeError as error:
-            message = self.__not_callable_message_for(self.__first)
-            raise CallableError(message) from error
-        return final
+        for stage in self.__stages:
+            try:
+                value = stage(value, name, **kwargs)
+            except TypeError as error:
+                message = self.__not_callable_message_for(stage)
+                raise CallableError(message) from error
+        return value
 
     def o(self, other: Callable):
         """Daisy-chain self and other callable into new functional composition.
@@ -83,6 +86,11 @@ class CompositionOf:
         """
         return CompositionOf(self, other)
 
+    def __stages_of(self, value: Callable) -> Tuple[Callable, ...]:
+        if type(value) is CompositionOf:
+            return value.__stages
+        return self.__callable(value),
+
     def __callable(self, value: Callable) -> Callable:
         if not callable(value):
             message = self.__not_callable_message_for(value)
@@ -104,11 +112,29 @@ class CompositionOf:
                 pass
         has_name = hasattr(self.__second, '__name__')
         self.__name__ = self.__second.__name__ if has_name else 'Composition'
-        public_attrs = [(attr_name, getattr(self.__second, attr_name))
-                        for attr_name in dir(self.__second)
-                        if not attr_name.startswith('_')]
-        for attr_name, attr in public_attrs:
-            if attr_name[0].isupper() and callable(attr):
-                setattr(self, attr_name, CompositionOf(self, attr))
-            if attr_name[0].islower() and not callable(attr):
-                setattr(self, attr_name, attr)
+
+    def __getattr__(self, attr_name: str):
+        if attr_name.startswith('_'):
+            raise AttributeError(self.__no_attribute_message_for(attr_name))
+        attr = getattr(self.__second, attr_name, MISSING)
+        if attr_name[0].isupper() and callable(attr):
+            attr = CompositionOf(self, attr)
+        elif not attr_name[0].islower() or callable(attr) or attr is MISSING:
+            raise AttributeError(self.__no_attribute_message_for(attr_name))
+        self.__dict__[attr_name] = attr
+        return attr
+
+    def __dir__(self):
+        attr_names = set(super().__dir__())
+        for attr_name in dir(self.__second):
+            if not attr_name.startswith('_') and attr_name not in attr_names:
+                try:
+                    _ = getattr(self, attr_name)
+                except AttributeError:
+                    continue
+                attr_names.add(attr_name)
+        return sorted(attr_names)
+
+    @staticmethod
+    def __no_attribute_message_for(attr_name: str) -> str:
+        return f"'CompositionOf' object has no attribute '{attr_name}'"
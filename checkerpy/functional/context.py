@@ -0,0 +1,83 @@
+from typing import Callable, Any
+
+
+class Context:
+    """Holds a checked value and its name, rendering both only on demand.
+
+    Checkers build their error messages from the name of the checked variable
+    or, if no name was given, from its string representation. Rendering the
+    latter for large iterables or arrays is expensive and wasted whenever the
+    check passes. A `Context` therefore defers calling ``str()`` on either the
+    name or the value until an error message actually asks for it.
+
+    Parameters
+    ----------
+    value
+        The value that is being checked.
+    name : optional
+        The name of the variable that is being checked. Can be anything that
+        renders to a string, e.g., a `Deferred` object. Defaults to None.
+
+    Attributes
+    ----------
+    value
+        The value that is being checked.
+    name : str
+        The rendered name of the variable or an empty string if none was given.
+    string : str
+        The rendered name of the variable or, if none was given, the rendered
+        value itself.
+    type_name : str
+        The name of the type of the value that is being checked.
+
+    """
+
+    __slots__ = ('value', '__raw_name', '__name', '__string')
+
+    def __init__(self, value: Any, name: Any = None) -> None:
+        self.value = value
+        self.__raw_name = name
+        self.__name = None
+        self.__string = None
+
+    @property
+    def name(self) -> str:
+        if self.__name is None:
+            raw_name = self.__raw_name
+            self.__name = str(raw_name) if raw_name is not None else ''
+        return self.__name
+
+    @property
+    def string(self) -> str:
+        if self.__string is None:
+            self.__string = self.name or str(self.value)
+        return self.__string
+
+    @property
+    def type_name(self) -> str:
+        return type(self.value).__name__
+
+
+class Deferred:
+    """Renders a string by calling a function only when converted to str.
+
+    Parameters
+    ----------
+    render : callable
+        Function that returns a string.
+    *args
+        Positional arguments to call `render` with.
+
+    """
+
+    __slots__ = ('__render', '__args')
+
+    def __init__(self, render: Callable[..., str], *args: Any) -> None:
+        self.__render = render
+        self.__args = args
+
+    def __str__(self) -> str:
+        return self.__render(*self.__args)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
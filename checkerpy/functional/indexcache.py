@@ -0,0 +1,91 @@
+from threading import RLock
+from typing import Any, FrozenSet, Optional
+
+Index = Optional[FrozenSet]
+INDEXED = (tuple, list)
+MIN_SIZE = 32
+
+
+def index_of(items: Any, min_size: int = MIN_SIZE) -> Index:
+    """Builds a hash index for fast membership tests on a sequence of items.
+
+    Parameters
+    ----------
+    items
+        The items to index.
+    min_size : int, optional
+        Minimum number of items for an index to pay off compared to a scan.
+        Defaults to 32.
+
+    Returns
+    -------
+    frozenset or None
+        The items as frozenset or None if `items` is not a tuple or list,
+        has fewer than `min_size` elements, or (some of) its elements are
+        not hashable.
+
+    """
+    if type(items) not in INDEXED or len(items) < min_size:
+        return None
+    try:
+        return frozenset(items)
+    except TypeError:
+        return None
+
+
+class IndexCache(dict):
+    """Bounded cache of hash indices of tuples of items.
+
+    Indices are stored under the ``id()`` of the tuple they were built for,
+    together with the tuple itself. Keeping a reference to the tuple ensures
+    that its ``id()`` is not reused by a new object for as long as it is
+    cached, such that finding the index for the very same tuple again costs
+    no more than a dictionary lookup. Tuples that cannot be indexed are
+    remembered as well, so that this is not tried again on every call. If
+    the cache is full, the oldest entry is evicted to make room for a new one.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of tuples to cache indices for. Defaults to 64.
+
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        super().__init__()
+        self.__maxsize = maxsize
+        self.__lock = RLock()
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def index(self, items: Any) -> Index:
+        """Gets the index for a tuple of items, building it if new.
+
+        Parameters
+        ----------
+        items
+            The items to get the index for.
+
+        Returns
+        -------
+        frozenset or None
+            The index for `items` or None if it is not a tuple or cannot be
+            indexed.
+
+        """
+        if type(items) is not tuple or len(items) < MIN_SIZE:
+            return None
+        key = id(items)
+        entry = self.get(key)
+        if entry is not None and entry[0] is items:
+            return entry[1]
+        index = index_of(items)
+        with self.__lock:
+            if self.__maxsize > 0:
+                self.pop(key, None)
+                while self and len(self) >= self.__maxsize:
+                    del self[next(iter(self))]
+                self[key] = items, index
+        return index
@@ -0,0 +1,153 @@
+import logging as log
+from random import Random
+from operator import attrgetter
+from itertools import count, repeat
+from collections import deque, defaultdict, OrderedDict
+from typing import Callable, Iterable, Iterator, List, Optional, Any
+from .context import Context, Deferred
+from ..exceptions import IterError
+from ..levels import LEVELS
+
+Check = Callable[..., Any]
+CONTAINERS = frozenset({list, tuple, set, frozenset, deque,
+                        dict, defaultdict, OrderedDict,
+                        type({}.keys()), type({}.values()),
+                        type({}.items()), type(OrderedDict().keys()),
+                        type(OrderedDict().values()),
+                        type(OrderedDict().items())})
+
+
+def check_all(context: Context, check: Check, *args: Any,
+              sample: int = None, seed: Any = None,
+              accept: Callable[[Iterable], bool] = None) -> Any:
+    """Checks all elements of an iterable one by one as it iterates over them.
+
+    Elements are streamed to the `check` without ever copying the iterable,
+    and checking stops at the first element that fails. Elements of
+    sequences are passed on together with their index, elements of all other
+    iterables with an index of -1. One-shot iterators (like generators) are
+    not consumed. Rather, a new iterator is returned that checks each element
+    only when it is requested.
+
+    Optionally, only a `sample` of the elements of a sequence is checked,
+    which is then always guaranteed to include its first and its last
+    element. How many elements were verified is logged at level DEBUG.
+    Since elements are accessed by index, this comes at a cost proportional
+    to the size of the `sample` rather than to the size of the sequence.
+    All other iterables are always checked in full.
+    If validation is turned off everywhere, nothing is checked at all.
+
+    Parameters
+    ----------
+    context : Context
+        Context of the iterable to check the elements of.
+    check : callable
+        Called as ``check(context, index, element, *args)`` for each element
+        and expected to raise an exception if the element fails the check.
+    *args
+        Additional positional arguments to call `check` with.
+    sample : int, optional
+        Maximum number of elements of a sequence to check. Defaults to None,
+        which checks all elements.
+    seed : optional
+        If None, elements to check are spaced evenly across the sequence.
+        Otherwise, they are chosen at random, with `seed` seeding a new
+        random number generator. Defaults to None.
+    accept : callable, optional
+        Called with an iterable over the sampled elements to decide at once
+        whether all of them pass, in which case they are not checked one by
+        one anymore. Defaults to None.
+
+    Returns
+    -------
+    iterable
+        The iterable passed in or, if that is an iterator, an iterator that
+        yields its elements after checking each of them.
+
+    Raises
+    ------
+    IterError
+        If the value of the `context` is not iterable.
+    ValueError
+        If the `sample` size is not an integer larger than 1.
+
+    """
+    iterable = context.value
+    if LEVELS.off:
+        return iterable
+    if sample is not None:
+        sample = sample_size(sample)
+    try:
+        iterator = iter(iterable)
+    except TypeError as error:
+        message = _not_an_iterable_message_for(context)
+        log.error(message)
+        raise IterError(message) from error
+    if iterator is iterable:
+        return _lazily_checked(context, check, args)
+    is_sequence = hasattr(iterable, 'index') and hasattr(iterable, 'count')
+    if is_sequence and sample is not None and sample < len(iterable):
+        return _sampled(context, check, args, sample, seed, accept)
+    indices = count() if is_sequence else repeat(-1)
+    for index, element in zip(indices, iterator):
+        check(context, index, element, *args)
+    return iterable
+
+
+def sample_size(sample: Any) -> int:
+    """Returns a valid sample size or raises a ValueError.
+
+    Parameters
+    ----------
+    sample
+        The number of elements to check.
+
+    Returns
+    -------
+    int
+        The `sample` size passed in.
+
+    Raises
+    ------
+    ValueError
+        If `sample` is not an integer larger than 1, which is needed to always
+        include both the first and the last element of a sequence.
+
+    """
+    if type(sample) is not int or sample < 2:
+        message = f'Sample size must be an integer > 1, not {sample}!'
+        log.error(message)
+        raise ValueError(message)
+    return sample
+
+
+def _sampled(context: Context, check: Check, args: tuple,
+             sample: int, seed: Any, accept: Optional[Callable]) -> Any:
+    sequence = context.value
+    n_elements = len(sequence)
+    indices = _indices_for(n_elements, sample, seed)
+    if accept is None or not accept(map(sequence.__getitem__, indices)):
+        for index in indices:
+            check(context, index, sequence[index], *args)
+    log.debug('Verified %d of %d elements of %s.', sample, n_elements,
+              Deferred(attrgetter('string'), context))
+    return sequence
+
+
+def _indices_for(n_elements: int, sample: int, seed: Any) -> List[int]:
+    last = n_elements - 1
+    if seed is None:
+        return [index * last // (sample - 1) for index in range(sample)]
+    middle = Random(seed).sample(range(1, last), sample - 2)
+    return [0, *sorted(middle), last]
+
+
+def _lazily_checked(context: Context, check: Check, args: tuple) -> Iterator:
+    for index, element in enumerate(context.value):
+        check(context, index, element, *args)
+        yield element
+
+
+def _not_an_iterable_message_for(context: Context) -> str:
+    return (f'Variable {context.string} with type {context.type_name} does'
+            ' not seem to be an iterable with elements to inspect!')
@@ -0,0 +1,48 @@
+from typing import Callable, Any
+from .composition import CompositionOf
+
+
+class LazyComposition:
+    """Descriptor that composes its owner with a callable on first access.
+
+    Type checkers and validators come with a host of convenience attributes
+    that are functional compositions of themselves with other checkers. Rather
+    than creating all of these eagerly (and, along with them, all attributes
+    of the compositions themselves), this descriptor only creates the
+    composition when the attribute is actually accessed for the first time.
+    The composition is then cached on the object the attribute was accessed
+    on, so that all subsequent accesses are regular attribute lookups.
+
+    Parameters
+    ----------
+    second : callable
+        The callable to compose the owner with. Its ``__name__`` must be the
+        name of the attribute the descriptor is attached under.
+    per_instance : bool, optional
+        If False, the class the descriptor is attached to is composed with
+        `second`. If True, instances of that class are composed with `second`
+        instead and the attribute is not accessible on the class itself.
+        Defaults to False.
+
+    See Also
+    --------
+    CompositionOf
+
+    """
+
+    def __init__(self, second: Callable, per_instance: bool = False) -> None:
+        self.__second = second
+        self.__name = second.__name__
+        self.__per_instance = per_instance
+
+    def __get__(self, instance: Any, owner: type) -> CompositionOf:
+        if not self.__per_instance:
+            composition = CompositionOf(owner, self.__second)
+            setattr(owner, self.__name, composition)
+        elif instance is None:
+            raise AttributeError(f"type object '{owner.__name__}' has"
+                                 f" no attribute '{self.__name}'")
+        else:
+            composition = CompositionOf(instance, self.__second)
+            instance.__dict__[self.__name] = composition
+        return composition
@@ -0,0 +1,156 @@
+from threading import RLock
+from collections import OrderedDict
+from typing import Any
+
+MAXSIZE = 2 ** 20
+LEAVES = frozenset({str, bytes, int, float, complex, bool, type(None),
+                    type(...), range})
+MEMOIZABLE = frozenset({tuple, frozenset, str, bytes})
+
+
+def frozen(value: Any) -> bool:
+    """Checks if a value is deeply immutable.
+
+    Only instances of built-in immutable types are, as well as tuples and
+    frozensets that contain nothing but deeply immutable values. Instances
+    of subclasses never are, because they could carry mutable attributes.
+
+    Parameters
+    ----------
+    value
+        The value to inspect.
+
+    Returns
+    -------
+    bool
+        True if the value is deeply immutable and False otherwise.
+
+    """
+    kind = type(value)
+    if kind in LEAVES:
+        return True
+    if kind is tuple or kind is frozenset:
+        return LEAVES.issuperset(map(type, value)) or all(map(frozen, value))
+    return False
+
+
+class VerdictCache(OrderedDict):
+    """Bounded cache of values that passed a check, evicting LRU.
+
+    Values are stored under their ``id()``, together with their size. To
+    make sure that the ``id()`` of a cached value is never reused by a new
+    object, a reference to the value itself is kept for as long as it is
+    cached. Whether a value passed is therefore decided by identity alone,
+    in constant time. The total size of cached values, counted as their
+    number of elements (plus one for the value itself), is bounded. If a
+    new value exceeds that bound, the least recently used values are
+    evicted to make room.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum total size of cached values. Defaults to 2**20.
+
+    """
+
+    def __init__(self, maxsize: int = MAXSIZE) -> None:
+        super().__init__()
+        self.__maxsize = maxsize
+        self.__size = 0
+        self.__lock = RLock()
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def passed(self, value: Any) -> bool:
+        key = id(value)
+        with self.__lock:
+            entry = self.get(key)
+            if entry is None or entry[0] is not value:
+                return False
+            self.move_to_end(key)
+        return True
+
+    def add(self, value: Any) -> bool:
+        """Caches a value that passed a check, if it is deeply immutable.
+
+        Parameters
+        ----------
+        value
+            The value that passed.
+
+        Returns
+        -------
+        bool
+            True if the value is cached and False otherwise.
+
+        """
+        size = len(value) + 1 if hasattr(value, '__len__') else 1
+        if size > self.__maxsize or not frozen(value):
+            return False
+        key = id(value)
+        with self.__lock:
+            if key in self:
+                self.__size -= self.pop(key)[1]
+            self[key] = value, size
+            self.__size += size
+            while self.__size > self.__maxsize:
+                _, (_, evicted) = self.popitem(last=False)
+                self.__size -= evicted
+        return True
+
+
+class Memoized:
+    """Remembers which immutable values passed a checker before.
+
+    Tuples, frozensets, strings, and bytes that are deeply immutable, like
+    large constant tables or lookup keys, cannot change after they passed a
+    check once. Repeatedly checking the very same object then only costs a
+    dictionary lookup. Values of all other types are checked every time.
+    Because the verdict is not affected by it, the `name` passed to the
+    checker is ignored in remembering values. Values are only remembered, and
+    only looked up, if passed without additional keyword arguments (like
+    `sample` or limits), such that checks of a sample never vouch for a
+    full check and values are always checked against specifications passed
+    at call time.
+
+    Type or limits specifications can be wrapped as well when passed to the
+    `Typed` or the `Bounded` decorator, e.g., ``Typed(Memoized([int]))``.
+
+    Parameters
+    ----------
+    checker
+        Checker to call or, when passed to a decorator, specification to
+        check arguments against.
+    maxsize : int, optional
+        Maximum total number of elements of remembered values, which are
+        kept alive until they are forgotten again. Defaults to 2**20.
+
+    """
+
+    def __init__(self, checker: Any, maxsize: int = MAXSIZE) -> None:
+        self.__checker = checker
+        self.__verdicts = VerdictCache(maxsize)
+        self.__name__ = getattr(checker, '__name__', type(self).__name__)
+
+    @property
+    def checker(self) -> Any:
+        return self.__checker
+
+    @property
+    def maxsize(self) -> int:
+        return self.__verdicts.maxsize
+
+    def __call__(self, value: Any, name: str = None, **kwargs) -> Any:
+        if kwargs or type(value) not in MEMOIZABLE:
+            return self.__checker(value, name, **kwargs)
+        if self.__verdicts.passed(value):
+            return value
+        checked = self.__checker(value, name)
+        _ = self.__verdicts.add(value)
+        return checked
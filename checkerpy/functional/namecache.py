@@ -0,0 +1,67 @@
+from sys import intern
+from threading import RLock
+from typing import Iterable
+
+
+class NameCache(dict):
+    """Bounded cache of strings that are known to be valid names.
+
+    Strings are stored as keys, interned, such that looking up the very same
+    names again compares them by identity only. Whether all of many names
+    are cached is decided in a single pass at C level. If the cache is full,
+    the oldest names are evicted to make room for new ones.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of names to cache. Defaults to 4096.
+
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        super().__init__()
+        self.__maxsize = maxsize
+        self.__lock = RLock()
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def knows(self, names: Iterable) -> bool:
+        """Checks if all of the given names are cached.
+
+        Parameters
+        ----------
+        names : iterable
+            The names to look up.
+
+        Returns
+        -------
+        bool
+            True if all `names` are cached and False if not or if (some of)
+            them are not hashable.
+
+        """
+        try:
+            return all(map(self.__contains__, names))
+        except TypeError:
+            return False
+
+    def add(self, names: Iterable[str]) -> None:
+        """Caches the given names, evicting the oldest ones if full.
+
+        Parameters
+        ----------
+        names : iterable
+            The names to cache. Anything but strings is skipped.
+
+        """
+        if self.__maxsize <= 0:
+            return
+        with self.__lock:
+            for name in dict.fromkeys(names):
+                if type(name) is not str or name in self:
+                    continue
+                while len(self) >= self.__maxsize:
+                    del self[next(iter(self))]
+                self[intern(name)] = None
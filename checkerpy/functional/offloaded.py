@@ -0,0 +1,42 @@
+from concurrent.futures import Executor
+from typing import Any
+
+
+class Offloaded:
+    """Marks a checker to run in an executor when checking async arguments.
+
+    Checking large arguments can take long enough to noticeably block an
+    event loop. When passed to the `Typed` or the `Bounded` decorator, e.g.,
+    as ``Typed(Offloaded([int]))``, the arguments of decorated coroutine
+    functions and asynchronous generator functions are checked in a thread
+    of the given executor instead, while the event loop is free to run other
+    tasks. Arguments of regular functions are still checked right away.
+    Because checkers hold the GIL while they run, an executor with only a
+    few workers keeps the event loop more responsive than one with many.
+
+    Parameters
+    ----------
+    checker
+        Checker to call or, when passed to a decorator, specification to
+        check arguments against.
+    executor : Executor, optional
+        The executor to run the checker in. Defaults to None, which uses the
+        default executor of the running event loop.
+
+    """
+
+    def __init__(self, checker: Any, executor: Executor = None) -> None:
+        self.__checker = checker
+        self.__executor = executor
+        self.__name__ = getattr(checker, '__name__', type(self).__name__)
+
+    @property
+    def checker(self) -> Any:
+        return self.__checker
+
+    @property
+    def executor(self) -> Executor:
+        return self.__executor
+
+    def __call__(self, value: Any, name: str = None, **kwargs) -> Any:
+        return self.__checker(value, name, **kwargs)
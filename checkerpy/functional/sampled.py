@@ -0,0 +1,57 @@
+from typing import Any
+from .iteration import sample_size
+
+
+class Sampled:
+    """Restricts a container checker to checking a sample of the elements.
+
+    Wraps type checkers and validators for all elements of an iterable
+    (like ``All(int)``, `AllLimited`, `AllLen`, or `AllHave`), which then
+    check only `k` elements of sequences, always including the first and the
+    last. Because elements are accessed by index, the cost of checking is
+    proportional to `k` instead of to the length of the sequence. All other
+    iterables are still checked in full.
+
+    Type or limits specifications can be wrapped as well when passed to the
+    `Typed` or the `Bounded` decorator, e.g., ``Typed(Sampled([int], 100))``.
+
+    Parameters
+    ----------
+    checker
+        Checker to call or, when passed to a decorator, specification to
+        check arguments against.
+    k : int
+        Maximum number of elements to check. Must be larger than 1.
+    seed : optional
+        If None, elements to check are spaced evenly across the sequence.
+        Otherwise, they are chosen at random, with `seed` seeding a new random
+        number generator on every call. Defaults to None.
+
+    Raises
+    ------
+    ValueError
+        If `k` is not an integer larger than 1.
+
+    """
+
+    def __init__(self, checker: Any, k: int, seed: Any = None) -> None:
+        self.__checker = checker
+        self.__k = sample_size(k)
+        self.__seed = seed
+        self.__name__ = getattr(checker, '__name__', type(self).__name__)
+
+    @property
+    def checker(self) -> Any:
+        return self.__checker
+
+    @property
+    def k(self) -> int:
+        return self.__k
+
+    @property
+    def seed(self) -> Any:
+        return self.__seed
+
+    def __call__(self, value: Any, name: str = None, **kwargs) -> Any:
+        kwargs.update(sample=self.__k, seed=self.__seed)
+        return self.__checker(value, name, **kwargs)
@@ -0,0 +1,70 @@
+from weakref import ref
+from threading import RLock
+from functools import partial
+from typing import Any
+
+
+class TypeCache(dict):
+    """Bounded cache of per-type results that does not keep types alive.
+
+    Results are stored under the ``id()`` of the type they were computed for
+    so that looking one up costs no more than a single dictionary access.
+    Rather than the type itself, only a weak reference to it is kept, which
+    removes the cached result as soon as the type is garbage collected. This
+    way, dynamically created classes are neither leaked nor is a stale result
+    ever served for a new type that happens to reuse the same ``id()``. If the
+    cache is full, the oldest entry is evicted to make room for a new one.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of types to cache results for. Defaults to 256.
+
+    Examples
+    --------
+    >>> cache = TypeCache()
+    >>> verdict = cache.get(id(bool))
+    >>> if verdict is None:
+    ...     verdict = cache.add(bool, issubclass(bool, int))
+
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        super().__init__()
+        self.__maxsize = maxsize
+        self.__refs = {}
+        self.__lock = RLock()
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def add(self, type_: type, result: Any) -> Any:
+        """Caches `result` for the given type and returns it.
+
+        Parameters
+        ----------
+        type_ : type
+            The type to cache the result for.
+        result
+            The result to cache.
+
+        Returns
+        -------
+        object
+            The cached `result`.
+
+        """
+        key = id(type_)
+        with self.__lock:
+            if key not in self.__refs:
+                if self.__refs and len(self.__refs) >= self.__maxsize:
+                    self.__evict(next(iter(self.__refs)))
+                self.__refs[key] = ref(type_, partial(self.__evict, key))
+            self[key] = result
+        return result
+
+    def __evict(self, key: int, *_) -> None:
+        with self.__lock:
+            self.__refs.pop(key, None)
+            self.pop(key, None)
@@ -0,0 +1,223 @@
+import os
+import logging as log
+from enum import IntEnum
+from threading import RLock
+from typing import Dict, Union, Any
+
+__all__ = ['Level', 'set_level', 'get_level']
+
+ENV_VAR = 'CHECKERPY_LEVEL'
+SAMPLE = 1000
+
+
+class Level(IntEnum):
+    """Validation levels, ordered from least to most thorough.
+
+    Attributes
+    ----------
+    OFF
+        Nothing is checked. Functions decorated at this level are not
+        wrapped at all and are never checked.
+    BOUNDARY
+        Arguments are checked, but of the elements of sequences, only the
+        first and the last are.
+    SAMPLED
+        Arguments are checked, but only a sample of `SAMPLE` elements of
+        sequences is, always including the first and the last.
+    FULL
+        Everything is checked.
+
+    """
+    OFF = 0
+    BOUNDARY = 1
+    SAMPLED = 2
+    FULL = 3
+
+
+LevelT = Union[Level, int, str]
+OPTIONS = {Level.BOUNDARY: {'sample': 2},
+           Level.SAMPLED: {'sample': SAMPLE},
+           Level.FULL: {}}
+
+
+class Levels(dict):
+    """Validation levels of modules, set globally and per package prefix.
+
+    Maps names of modules to their validation level. Modules are added on
+    first lookup with the level set for the longest package prefix of their
+    name or, if there is none, with the global level. Whenever levels are
+    set, the levels of all modules added so far are updated in place, such
+    that looking up the level of a module costs a single dictionary access.
+
+    Parameters
+    ----------
+    default : Level
+        The initial global level.
+
+    Attributes
+    ----------
+    off : bool
+        True only if validation is turned off globally and for all package
+        prefixes. Checkers skip all checks if set.
+
+    """
+
+    def __init__(self, default: Level) -> None:
+        super().__init__()
+        self.__default = default
+        self.__prefixes: Dict[str, Level] = {}
+        self.__lock = RLock()
+        self.off = default is Level.OFF
+
+    def __missing__(self, module: str) -> Level:
+        with self.__lock:
+            level = self[module] = self.__resolved(module)
+        return level
+
+    def set(self, level: LevelT, module: str = None) -> None:
+        with self.__lock:
+            if module is None:
+                self.__default = valid(level)
+            elif level is None:
+                self.__prefixes.pop(module, None)
+            else:
+                self.__prefixes[module] = valid(level)
+            for name in self:
+                self[name] = self.__resolved(name)
+            levels = (self.__default, *self.__prefixes.values())
+            self.off = all(value is Level.OFF for value in levels)
+
+    def of(self, module: str = None) -> Level:
+        return self.__default if module is None else self[module]
+
+    def __resolved(self, module: str) -> Level:
+        while module:
+            if module in self.__prefixes:
+                return self.__prefixes[module]
+            module, _, _ = module.rpartition('.')
+        return self.__default
+
+
+def valid(level: Any) -> Level:
+    """Converts names or numbers of validation levels to a `Level`.
+
+    Parameters
+    ----------
+    level : Level, int, or str
+        The validation level, its value, or its (case-insensitive) name.
+
+    Returns
+    -------
+    Level
+        The validation level.
+
+    Raises
+    ------
+    ValueError
+        If `level` does not correspond to any of the validation levels.
+
+    """
+    try:
+        if type(level) is str:
+            return Level[level.strip().upper()]
+        return Level(level)
+    except (KeyError, ValueError, TypeError) as error:
+        names = ', '.join(value.name.lower() for value in Level)
+        message = f'Validation level must be one of {names}, not {level}!'
+        log.error(message)
+        raise ValueError(message) from error
+
+
+def from_environment(variable: str = ENV_VAR) -> Levels:
+    """Reads validation levels from an environment variable.
+
+    The variable holds a comma-separated list of levels. Entries of the form
+    ``package=level`` set the level for a package prefix, while an entry
+    without a prefix sets the global level, e.g., "off,myapp.api=full".
+
+    Parameters
+    ----------
+    variable : str, optional
+        Name of the environment variable. Defaults to 'CHECKERPY_LEVEL'.
+
+    Returns
+    -------
+    Levels
+        Validation levels with the global level defaulting to FULL.
+
+    Raises
+    ------
+    ValueError
+        If one of the levels is not valid.
+
+    """
+    levels = Levels(Level.FULL)
+    entries = filter(None, os.environ.get(variable, '').split(','))
+    for entry in entries:
+        module, _, level = entry.rpartition('=')
+        levels.set(level, module.strip() or None)
+    return levels
+
+
+LEVELS = from_environment()
+
+
+def set_level(level: LevelT, module: str = None) -> None:
+    """Sets the validation level globally or for a package prefix.
+
+    The level of a package prefix applies to functions decorated with
+    `Typed` or `Bounded` in all modules whose names start with the prefix,
+    unless a longer prefix has a level of its own. Levels take effect
+    immediately, also for functions decorated before, with one exception.
+    Functions decorated while the level for their module is "off" are
+    returned as they are. Only these cost nothing at all when called, but
+    they also remain unchecked, even if the level is raised later on. All
+    other decorated functions look up the level of their module whenever
+    they are called. Switching them off at runtime thus skips their checks,
+    but still costs about 0.4 microseconds per call. Standalone checkers,
+    finally, skip all checks only if validation is off both globally and
+    for all package prefixes.
+
+    The initial levels are read from the environment variable
+    CHECKERPY_LEVEL on import. See `from_environment` for its format.
+
+    Parameters
+    ----------
+    level : Level, int, str, or None
+        The validation level, its value, or its (case-insensitive) name, i.e.,
+        one of "off", "boundary", "sampled", or "full". None removes a level
+        previously set for the given `module`.
+    module : str, optional
+        Package prefix to set the level for. Defaults to None, which sets
+        the global level.
+
+    Raises
+    ------
+    ValueError
+        If `level` does not correspond to any of the validation levels.
+
+    Examples
+    --------
+    >>> set_level('sampled')
+    >>> set_level('full', 'myapp.api')
+
+    """
+    LEVELS.set(level, module)
+
+
+def get_level(module: str = None) -> Level:
+    """Gets the validation level globally or for a given module.
+
+    Parameters
+    ----------
+    module : str, optional
+        Name of the module to get the validation level for. Defaults to None,
+        which returns the global level.
+
+    Returns
+    -------
+    Level
+        The validation level.
+
+    """
+    return LEVELS.of(module)
@@ -0,0 +1,283 @@
+from time import perf_counter_ns
+from weakref import WeakValueDictionary
+from threading import Lock, RLock
+from typing import Callable, Dict, Tuple, Any
+
+__all__ = ['Profiled', 'profile', 'stats']
+
+MAXSIZE = 1024
+OTHER = '<other>'
+
+
+class Record:
+    """Calls, failures, and time spent in checking one argument."""
+    __slots__ = ('calls', 'failures', 'total_ns', 'max_ns', 'lock')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.lock = Lock()
+
+    def add(self, elapsed: int, failed: bool) -> None:
+        with self.lock:
+            self.calls += 1
+            self.failures += failed
+            self.total_ns += elapsed
+            if elapsed > self.max_ns:
+                self.max_ns = elapsed
+
+    def as_dict(self) -> Dict[str, int]:
+        with self.lock:
+            return {'calls': self.calls, 'failures': self.failures,
+                    'total_ns': self.total_ns, 'max_ns': self.max_ns}
+
+
+class Registry:
+    """Records of validation profiles, keyed by call site and argument.
+
+    Memory is bounded by keeping at most `maxsize` records. Once the
+    registry is full, profiles of any new call site or argument are added up
+    in a single record under the call site and argument "<other>" instead.
+    Checks of decorated functions are only timed while profiling is enabled.
+    To that end, decorators register their tables of checks, which are
+    cleared (and subsequently rebuilt) whenever profiling is switched on or
+    off, such that there is no overhead at all while it is disabled. They
+    are cleared on reset as well, such that checks are timed into the new
+    records from then on.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of records to keep. Defaults to 1024.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether checks are currently profiled.
+
+    """
+
+    def __init__(self, maxsize: int = MAXSIZE) -> None:
+        self.__maxsize = maxsize
+        self.__records: Dict[Tuple[str, str], Record] = {}
+        self.__tables = WeakValueDictionary()
+        self.__lock = RLock()
+        self.enabled = False
+
+    @property
+    def maxsize(self) -> int:
+        return self.__maxsize
+
+    def enable(self, maxsize: int = None) -> None:
+        with self.__lock:
+            if maxsize is not None:
+                self.__maxsize = maxsize
+            self.enabled = True
+            self.__clear_tables()
+
+    def disable(self) -> None:
+        with self.__lock:
+            self.enabled = False
+            self.__clear_tables()
+
+    def watch(self, tables: dict) -> dict:
+        """Registers tables of checks to clear when profiling is toggled.
+
+        Parameters
+        ----------
+        tables : dict
+            Tables of checks of a decorated function, which are expected to
+            be rebuilt on their next lookup. Only weakly referenced, they
+            must be an instance of a subclass of ``dict``.
+
+        Returns
+        -------
+        dict
+            The `tables` passed in.
+
+        """
+        with self.__lock:
+            self.__tables[id(tables)] = tables
+        return tables
+
+    def record(self, site: str, argument: str) -> Record:
+        """Gets the record for an argument at a call site, creating it if new.
+
+        Parameters
+        ----------
+        site : str
+            Name of the call site, e.g., of a decorated function.
+        argument : str
+            Name of the argument checked at that call site.
+
+        Returns
+        -------
+        Record
+            The record to add profiles to.
+
+        """
+        key = site, argument
+        record = self.__records.get(key)
+        if record is None:
+            with self.__lock:
+                if key not in self.__records:
+                    if len(self.__records) >= self.__maxsize - 1:
+                        key = OTHER, OTHER
+                    self.__records.setdefault(key, Record())
+                record = self.__records[key]
+        return record
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Dict[str, dict]]:
+        with self.__lock:
+            records = self.__records
+            if reset:
+                self.__records = {}
+                self.__clear_tables()
+        snapshot = {}
+        for (site, argument), record in records.items():
+            snapshot.setdefault(site, {})[argument] = record.as_dict()
+        return snapshot
+
+    def __clear_tables(self) -> None:
+        for tables in list(self.__tables.values()):
+            tables.clear()
+
+
+REGISTRY = Registry()
+
+
+def timed(check: Callable, record: Record, value: Any,
+          name: str, kwargs: Dict[str, Any]) -> Any:
+    """Calls the `check` and adds its duration and outcome to the `record`."""
+    failed = True
+    start = perf_counter_ns()
+    try:
+        value = check(value, name, **kwargs)
+        failed = False
+        return value
+    finally:
+        record.add(perf_counter_ns() - start, failed)
+
+
+class Timed:
+    """Profiles every call to a checker of an argument of a decorated function.
+
+    Parameters
+    ----------
+    checker : callable
+        The checker to profile.
+    record : Record
+        The record to add profiles to.
+
+    """
+
+    def __init__(self, checker: Callable, record: Record) -> None:
+        self.__checker = checker
+        self.__record = record
+        self.__name__ = getattr(checker, '__name__', type(self).__name__)
+
+    def __call__(self, value: Any, name: str = None, **kwargs) -> Any:
+        return timed(self.__checker, self.__record, value, name, kwargs)
+
+
+class Profiled:
+    """Profiles calls to a checker while profiling is enabled.
+
+    Checks of functions decorated with `Typed` or `Bounded` are profiled
+    automatically, once profiling is enabled with `profile`. Wrap checkers
+    you call directly in your code with `Profiled` to have them show up in
+    the `stats` as well, under the given call site and the name of the
+    value they check. Otherwise, the checker is simply called.
+
+    Parameters
+    ----------
+    checker : callable
+        The checker to profile.
+    site : str, optional
+        Name of the call site to record profiles under. Defaults to None,
+        which uses the name of the `checker`.
+
+    Examples
+    --------
+    >>> check = Profiled(AllInt, 'myapp.loader')
+    >>> profile()
+    >>> _ = check([1, 2, 3], 'rows')
+    >>> stats()['myapp.loader']['rows']['calls']
+    1
+
+    """
+
+    def __init__(self, checker: Callable, site: str = None) -> None:
+        self.__checker = checker
+        self.__name__ = getattr(checker, '__name__', type(self).__name__)
+        self.__site = self.__name__ if site is None else site
+
+    @property
+    def checker(self) -> Callable:
+        return self.__checker
+
+    @property
+    def site(self) -> str:
+        return self.__site
+
+    def __call__(self, value: Any, name: str = None, **kwargs) -> Any:
+        if not REGISTRY.enabled:
+            return self.__checker(value, name, **kwargs)
+        record = REGISTRY.record(self.__site, str(name))
+        return timed(self.__checker, record, value, name, kwargs)
+
+
+def profile(enabled: bool = True, maxsize: int = None) -> None:
+    """Switches profiling of checks on or off.
+
+    While enabled, every check of an argument of a function decorated with
+    `Typed` or `Bounded` (and every call to a `Profiled` checker) is timed
+    with ``perf_counter_ns``. Per function and argument, the number of
+    calls, the number of failed checks, and the cumulative and maximum time
+    spent in checking are recorded. Profiles recorded so far are kept when
+    profiling is switched off. Retrieve (and reset) them with `stats`.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Whether to switch profiling on or off. Defaults to True.
+    maxsize : int, optional
+        Maximum number of function-argument pairs to keep records for.
+        Defaults to None, which keeps the current maximum (initially 1024).
+        Once exceeded, all new ones are added up in a single record under
+        the call site and argument "<other>".
+
+    """
+    if enabled:
+        REGISTRY.enable(maxsize)
+    else:
+        REGISTRY.disable()
+
+
+def stats(reset: bool = False) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Returns a snapshot of validation profiles recorded so far.
+
+    Parameters
+    ----------
+    reset : bool, optional
+        Whether to start over with empty records after taking the snapshot.
+        Defaults to False.
+
+    Returns
+    -------
+    dict
+        Dictionary with the names of decorated functions (prefixed by their
+        module) or of call sites as keys. Values are dictionaries with the
+        names of checked arguments as keys and, as values, dictionaries of
+        "calls", "failures", "total_ns", and "max_ns".
+
+    Examples
+    --------
+    >>> profile()
+    >>> # ... call some decorated functions ...
+    >>> snapshot = stats(reset=True)
+
+    """
+    return REGISTRY.snapshot(reset)
@@ -0,0 +1,255 @@
+import asyncio
+import logging
+import unittest as ut
+from time import perf_counter
+from inspect import iscoroutinefunction, isasyncgenfunction
+from concurrent.futures import ThreadPoolExecutor
+from ...decorators import Typed, Bounded
+from ...functional.offloaded import Offloaded
+from ...levels import set_level
+from ...exceptions import WrongTypeError, LimitError
+
+
+class CountingExecutor(ThreadPoolExecutor):
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+class TestTypedCoroutines(ut.TestCase):
+
+    def test_wrapper_is_coroutine_function(self):
+        @Typed(int)
+        async def f(x):
+            return x
+        self.assertTrue(iscoroutinefunction(f))
+
+    def test_works(self):
+        @Typed(int, y=str)
+        async def f(x, y):
+            return x, y
+        self.assertTupleEqual(asyncio.run(f(1, y='a')), (1, 'a'))
+
+    def test_error_on_wrong_type(self):
+        @Typed(int)
+        async def f(x):
+            return x
+        err_msg = ('Type of argument x to function f defined in module'
+                   f' {__name__} must be int, not str like foo!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = asyncio.run(f('foo'))
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_works_with_methods(self):
+        class Test:
+            @Bounded((0, 1))
+            async def m(self, x):
+                return x
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = asyncio.run(Test().m(2))
+        self.assertEqual(asyncio.run(Test().m(1)), 1)
+
+    def test_checks_star_args(self):
+        @Typed(args=int)
+        async def f(*args):
+            return args
+        self.assertTupleEqual(asyncio.run(f(1, 2)), (1, 2))
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = asyncio.run(f(1, 'a'))
+
+    def test_works_stacked(self):
+        @Typed(int)
+        @Bounded((0, 1))
+        async def f(x):
+            return x
+        self.assertTrue(iscoroutinefunction(f))
+        self.assertEqual(asyncio.run(f(1)), 1)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = asyncio.run(f(2))
+
+    def test_checks_nothing_if_switched_off(self):
+        @Typed(int)
+        async def f(x):
+            return x
+        set_level('off', __name__)
+        try:
+            self.assertEqual(asyncio.run(f('foo')), 'foo')
+        finally:
+            set_level(None, __name__)
+
+
+class TestTypedAsyncGenerators(ut.TestCase):
+
+    @staticmethod
+    def collect(generator):
+        async def collected():
+            return [value async for value in generator]
+        return asyncio.run(collected())
+
+    def test_wrapper_is_async_generator_function(self):
+        @Typed(int)
+        async def f(x):
+            yield x
+        self.assertTrue(isasyncgenfunction(f))
+
+    def test_works(self):
+        @Typed(int)
+        async def f(x):
+            for value in range(x):
+                yield value
+        self.assertListEqual(self.collect(f(3)), [0, 1, 2])
+
+    def test_error_on_wrong_type(self):
+        @Bounded((0, 5))
+        async def f(x):
+            yield x
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = self.collect(f(7))
+
+    def test_passes_on_sent_and_thrown_values(self):
+        @Typed(int)
+        async def f(x):
+            while True:
+                try:
+                    x = yield x
+                except ValueError:
+                    x = -1
+
+        async def exchanged():
+            generator = f(1)
+            values = [await generator.asend(None), await generator.asend(2),
+                      await generator.athrow(ValueError)]
+            await generator.aclose()
+            return values
+        self.assertListEqual(asyncio.run(exchanged()), [1, 2, -1])
+
+    def test_checks_yielded_items(self):
+        @Typed(yields=int)
+        async def f():
+            for value in (1, 2, 'foo'):
+                yield value
+        err_msg = ('Type of item yielded by function f defined in module'
+                   f' {__name__} must be int, not str like foo!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = self.collect(f())
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_closing_wrapper_closes_generator(self):
+        closed = []
+
+        @Typed(int)
+        async def f(x):
+            try:
+                while True:
+                    yield x
+            finally:
+                closed.append(True)
+
+        async def closing():
+            generator = f(1)
+            _ = await generator.__anext__()
+            await generator.aclose()
+        asyncio.run(closing())
+        self.assertListEqual(closed, [True])
+
+
+class TestOffloaded(ut.TestCase):
+
+    def test_has_attributes(self):
+        executor = ThreadPoolExecutor(1)
+        offloaded = Offloaded([int], executor)
+        self.assertListEqual(offloaded.checker, [int])
+        self.assertIs(offloaded.executor, executor)
+        executor.shutdown()
+
+    def test_checks_coroutine_arguments_in_executor(self):
+        executor = CountingExecutor()
+
+        @Typed(Offloaded([int], executor), y=Offloaded(str, executor))
+        async def f(x, y):
+            return x, y
+        self.assertTupleEqual(asyncio.run(f([1], y='a')), ([1], 'a'))
+        self.assertEqual(executor.submitted, 2)
+        executor.shutdown()
+
+    def test_error_in_executor(self):
+        @Bounded(Offloaded([(0, 5)]))
+        async def f(x):
+            return x
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = asyncio.run(f([1, 7]))
+
+    def test_checks_async_generator_arguments_in_executor(self):
+        executor = CountingExecutor()
+
+        @Typed(Offloaded([int], executor))
+        async def f(x):
+            for value in x:
+                yield value
+
+        async def collected():
+            return [value async for value in f([1, 2])]
+        self.assertListEqual(asyncio.run(collected()), [1, 2])
+        self.assertEqual(executor.submitted, 1)
+        executor.shutdown()
+
+    def test_checks_function_arguments_right_away(self):
+        executor = CountingExecutor()
+
+        @Typed(Offloaded([int], executor))
+        def f(x):
+            return x
+        self.assertListEqual(f([1, 2]), [1, 2])
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f([1, 'a'])
+        self.assertEqual(executor.submitted, 0)
+        executor.shutdown()
+
+
+class TestEventLoopLatency(ut.TestCase):
+
+    def test_offloaded_checks_do_not_stall_event_loop(self):
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        @Bounded(Offloaded([(0, ...)], executor))
+        async def f(x):
+            return len(x)
+
+        async def heartbeat(stop, gaps):
+            last = perf_counter()
+            while not stop.is_set():
+                await asyncio.sleep(0.001)
+                now = perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        async def main():
+            stop, gaps = asyncio.Event(), []
+            beat = asyncio.create_task(heartbeat(stop, gaps))
+            data = list(range(50_000))
+            lengths = await asyncio.gather(*(f(data) for _ in range(8)))
+            stop.set()
+            await beat
+            return lengths, gaps
+
+        lengths, gaps = asyncio.run(main())
+        executor.shutdown()
+        self.assertListEqual(lengths, [50_000] * 8)
+        self.assertLess(max(gaps), 0.05)
+
+
+if __name__ == '__main__':
+    ut.main()
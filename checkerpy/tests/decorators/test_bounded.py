@@ -1,7 +1,14 @@
 import logging
 import unittest as ut
 from ...decorators import Bounded
+from ...functional.sampled import Sampled
 from ...exceptions import LimitError, WrongTypeError, LenError
+try:
+    import numpy as np
+except ImportError:
+    no_numpy = True
+else:
+    no_numpy = False
 
 
 class TestBoundedInstantiation(ut.TestCase):
@@ -1214,5 +1221,133 @@ class TestBoundedFunctionDict(ut.TestCase):
         self.assertEqual(log.output, log_msg)
 
 
+class TestBoundedSampled(ut.TestCase):
+
+    def test_works_with_sampled_list(self):
+        @Bounded(Sampled([(0, 5)], 2))
+        def f(x):
+            return x
+        inputs = [1, 9, 2]
+        self.assertIs(f(inputs), inputs)
+
+    def test_works_with_sampled_tuple(self):
+        @Bounded(x=Sampled(((0, 5), ...), 2, seed=7))
+        def f(x):
+            return x
+        inputs = (1, 9, 2)
+        self.assertIs(f(x=inputs), inputs)
+
+    def test_dicts_are_checked_in_full(self):
+        @Bounded(Sampled({(0, 5): ...}, 2))
+        def f(x):
+            return x
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = f({1: 'a', 9: 'b', 2: 'c'})
+
+    def test_error_on_sampled_element(self):
+        @Bounded(Sampled([(0, 5)], 2))
+        def f(x):
+            return x
+        err_msg = ('Value 7 of list argument x to function f defined in'
+                   f' module {__name__} at index 2 lies outside the'
+                   ' allowed interval [0, 5]!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = f([1, 9, 7])
+        self.assertEqual(str(err.exception), err_msg)
+
+
+class TestBoundedVariadic(ut.TestCase):
+
+    def test_works_with_star_args_and_star_star_kwargs(self):
+        @Bounded(args=(0, 5), kwargs=('a', 'c'))
+        def f(*args, **kwargs):
+            return args, kwargs
+        self.assertTupleEqual(f(1, 2, y='b'), ((1, 2), {'y': 'b'}))
+
+    def test_error_on_star_arg_outside_limits(self):
+        @Bounded(args=(0, 5))
+        def f(x, *args):
+            return x, args
+        err_msg = ('Value 7 of argument args[1] to function f defined in'
+                   f' module {__name__} lies outside the allowed'
+                   ' interval [0, 5]!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = f(9, 1, 7)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_star_star_kwarg_outside_limits(self):
+        @Bounded(kwargs=('a', 'c'))
+        def f(**kwargs):
+            return kwargs
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = f(y='b', z='d')
+
+
+class TestBoundedYields(ut.TestCase):
+
+    def test_works_with_generators(self):
+        @Bounded((0, ...), yields=(0, 5))
+        def f(n):
+            yield from range(n)
+        self.assertListEqual(list(f(3)), [0, 1, 2])
+
+    def test_error_on_item_outside_limits(self):
+        @Bounded(yields=(0, 5))
+        def f():
+            yield from (1, 7)
+        err_msg = ('Value 7 of item yielded by function f defined in'
+                   f' module {__name__} lies outside the allowed'
+                   ' interval [0, 5]!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = list(f())
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_works_with_container_specs(self):
+        @Bounded(yields=[(0, 1)])
+        def f():
+            yield [0, 1]
+            yield [1, 2]
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = list(f())
+
+
+@ut.skipIf(no_numpy, 'Could not import numpy!')
+class TestBoundedNdarray(ut.TestCase):
+
+    def test_list_limits_accept_arrays(self):
+        @Bounded([(0, 1)])
+        def f(x):
+            return x
+        inputs = np.linspace(0, 1, 11)
+        self.assertIs(f(inputs), inputs)
+
+    def test_error_on_array_element_outside_limits(self):
+        @Bounded([(0, 1)])
+        def f(x):
+            return x
+        inputs = np.array([0.0, 0.5, 1.0, 1.5])
+        err_msg = ('Value 1.5 of ndarray argument x to function f defined in'
+                   f' module {__name__} at index 3 lies outside the'
+                   ' allowed interval [0, 1]!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = f(inputs)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_other_arrays_are_still_rejected(self):
+        @Bounded([('a', 'z')])
+        def f(x):
+            return x
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f(np.array(['b', 'c']))
+
+
 if __name__ == '__main__':
     ut.main()
@@ -1,5 +1,7 @@
 import unittest as ut
 from ...decorators.boundsparser import BoundsParser
+from ...validators.all import LimitedTuple
+from ...functional import Bound
 
 
 class TestBoundsParser(ut.TestCase):
@@ -15,6 +17,12 @@ class TestBoundsParser(ut.TestCase):
             _ = self.parse('foo')
         self.assertEqual(str(err.exception), err_msg)
 
+    def test_tuple_of_limits_is_bound_once(self):
+        checker = self.parse((((0, 1), (2, 3)),))[0]
+        self.assertIsInstance(checker, Bound)
+        self.assertIs(checker.validator, LimitedTuple)
+        self.assertTupleEqual(checker((1, 2), 'test'), (1, 2))
+
 
 if __name__ == '__main__':
     ut.main()
@@ -0,0 +1,180 @@
+import logging
+import unittest as ut
+from collections import deque, OrderedDict, defaultdict
+from ...decorators.compiler import compile
+from ...decorators.typeparser import TypeParser
+from ...decorators.boundsparser import BoundsParser
+from ...decorators.mixin import identity
+from ...functional.sampled import Sampled
+
+TYPE_SPECS = (
+    int,
+    (int, float),
+    [int],
+    [int, bool],
+    [(str, bool)],
+    {float},
+    {str: int},
+    {str: ...},
+    {...: (list, tuple)},
+    {(): int},
+    (bool, ...),
+    (int, str, ...),
+    ((str,), (...,), (int, float)),
+    ((int,), [float]),
+    (),
+)
+
+TYPE_VALUES = (
+    1, 1.0, True, 'foo', None,
+    [], [1, 2], [1, 2.0], [True, False], ['a', True], [[1]],
+    deque([1, 2]), deque(['a']),
+    set(), {1.0, 2.0}, frozenset({1.0}), {1, 2.0},
+    {}, {'a': 1}, {'a': 1.0}, {1: 1}, {'a': []}, {'a': (1,)},
+    OrderedDict(a=1), defaultdict(int, a=1),
+    (), (True,), (True, False), (1, 'a'), (1, 'a', 2), (1.0, 'a'),
+    ('a', None, 1), ('a', None, 1.0), ('a', None), ('a', None, 'b'),
+    (1, 1.0), (1, 1), ((1,), 1.0),
+)
+
+BOUNDS_SPECS = (
+    (0, 10),
+    (..., 10),
+    (0, ...),
+    (..., ...),
+    ('a', 'f'),
+    [(0, 10)],
+    [(..., 1.5)],
+    {(0, 10)},
+    {(0, 10): ...},
+    {...: (0, 10)},
+    {('a', 'c'): (0, 10)},
+    ((0, 10), ...),
+    ((0, 1), (5, 10)),
+    ((0, 1), (...,  ...), ('a', 'c')),
+)
+
+BOUNDS_VALUES = (
+    -1, 0, 5, 10, 11, 1.5, float('nan'), 'a', 'e', 'z', None,
+    [], [0, 5], [-1, 5], [5, 11], ['a'], [1, 1.2], [2.0],
+    deque([1, 2]), {0, 10}, {11}, frozenset({1}),
+    {}, {0: 0}, {11: 5}, {5: 11}, {'a': 1}, {'b': 20},
+    OrderedDict(a=1),
+    (), (0,), (0, 5), (11, 5), (0, 5, 'b'), (1, 10, 'b'), (0, 7, 'z'),
+    (0, 'x', 'b'), (0, None, 'b'), (1.0, 5.0),
+)
+
+
+class TestCompile(ut.TestCase):
+
+    def setUp(self):
+        logging.disable(logging.ERROR)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def assertSameOutcome(self, compiled, reference, value):
+        try:
+            expected = reference(value, 'test')
+        except Exception as error:
+            with self.assertRaises(type(error)) as err:
+                _ = compiled(value, 'test')
+            self.assertEqual(str(err.exception), str(error))
+        else:
+            self.assertIs(compiled(value, 'test'), expected)
+
+    def test_type_specs_behave_like_type_parser(self):
+        parse = TypeParser()
+        for spec in TYPE_SPECS:
+            compiled = compile(spec)
+            reference = parse((spec,))[0]
+            for value in TYPE_VALUES:
+                with self.subTest(spec=spec, value=value):
+                    self.assertSameOutcome(compiled, reference, value)
+
+    def test_bounds_specs_behave_like_bounds_parser(self):
+        parse = BoundsParser()
+        for spec in BOUNDS_SPECS:
+            compiled = compile(spec, kind='bounds')
+            reference = parse((spec,))[0]
+            for value in BOUNDS_VALUES:
+                with self.subTest(spec=spec, value=value):
+                    self.assertSameOutcome(compiled, reference, value)
+
+    def test_ellipsis_compiles_to_identity(self):
+        self.assertIs(compile(...), identity)
+        self.assertIs(compile(..., kind='bounds'), identity)
+
+    def test_name_is_optional(self):
+        self.assertListEqual(compile([int])([1, 2]), [1, 2])
+
+    def test_kwargs_are_passed_through_to_fallback(self):
+        compiled = compile([(0, 1)], kind='bounds')
+        self.assertListEqual(compiled([1, 5, 0], 'test', sample=2), [1, 5, 0])
+
+    def test_sampled_specs_compile_to_their_fallback(self):
+        compiled = compile(Sampled([int], 2))
+        self.assertIsInstance(compiled, Sampled)
+        self.assertListEqual(compiled([1, 'a', 2]), [1, 'a', 2])
+
+    def test_passing_values_are_not_logged(self):
+        logging.disable(logging.NOTSET)
+        with self.assertRaises(AssertionError):
+            with self.assertLogs(level=logging.DEBUG):
+                _ = compile({str: [int]})({'a': 1}, 'test')
+
+    def test_failing_values_are_logged(self):
+        logging.disable(logging.NOTSET)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(Exception):
+                _ = compile({str: [int]})({'a': 1.0}, 'test')
+
+    def test_error_on_invalid_type_spec(self):
+        err_msg = ('Invalid expression 1 of type int for type specification'
+                   ' of argument at position 0! Must be one of type, tuple,'
+                   ' list, set, dict, or ellipsis.')
+        with self.assertRaises(TypeError) as err:
+            _ = compile(1)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_invalid_bounds_spec(self):
+        err_msg = ('Invalid expression 1 of type int for limits specification'
+                   ' of argument at position 0! Must be one of tuple, list,'
+                   ' set, dict, or ellipsis.')
+        with self.assertRaises(TypeError) as err:
+            _ = compile(1, kind='bounds')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_invalid_kind(self):
+        err_msg = ("Kind of specification must be 'type'"
+                   " or 'bounds', not foo!")
+        with self.assertRaises(ValueError) as err:
+            _ = compile(int, kind='foo')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_unhashable_kind(self):
+        with self.assertRaises(ValueError):
+            _ = compile(int, kind=[])
+
+    def test_invalid_nested_types_raise_at_call_time(self):
+        parse = TypeParser()
+        spec = ((int,), ('foo',))
+        compiled = compile(spec)
+        reference = parse((spec,))[0]
+        self.assertSameOutcome(compiled, reference, (1, 2))
+
+    def test_invalid_nested_limits_raise_at_compile_time(self):
+        parse = BoundsParser()
+        spec = ((0, 1), (0, 1, 2))
+        err_msg = ('There must be exactly 2 limits (lo and'
+                   ' hi) for argument 1, not 3!')
+        with self.assertRaises(ValueError) as err:
+            _ = parse((spec,))
+        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaises(ValueError) as err:
+            _ = compile(spec, kind='bounds')
+        self.assertEqual(str(err.exception), err_msg)
+
+
+if __name__ == '__main__':
+    ut.main()
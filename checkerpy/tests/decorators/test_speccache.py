@@ -0,0 +1,139 @@
+import unittest as ut
+from ...decorators.speccache import SpecCache, key_for
+from ...decorators.typeparser import TypeParser
+from ...decorators.boundsparser import BoundsParser
+from ...decorators import Typed, Bounded
+from ...functional.sampled import Sampled
+from ...functional.offloaded import Offloaded
+from ...functional.memoized import Memoized
+
+
+class TestKeyFor(ut.TestCase):
+
+    def test_equal_specs_have_equal_keys(self):
+        for spec in (int, [int], {str}, {str: (int, float)}, (bool, ...),
+                     ((int,), (...,)), (0, ...), [(0, 1)], {('a', 'c'): ...},
+                     Sampled([int], 10, seed=1), Offloaded([int]),
+                     Memoized([int])):
+            with self.subTest(spec=spec):
+                self.assertEqual(key_for(spec), key_for(spec))
+                self.assertEqual(hash(key_for(spec)), hash(key_for(spec)))
+
+    def test_keys_tell_apart_types_of_containers(self):
+        self.assertNotEqual(key_for([int]), key_for((int,)))
+        self.assertNotEqual(key_for({int}), key_for([int]))
+
+    def test_keys_tell_apart_types_of_limits(self):
+        self.assertNotEqual(key_for((0, 1)), key_for((0.0, 1.0)))
+        self.assertNotEqual(key_for((0, 1)), key_for((False, True)))
+
+    def test_keys_tell_apart_samples(self):
+        self.assertNotEqual(key_for(Sampled([int], 10)),
+                            key_for(Sampled([int], 11)))
+        self.assertNotEqual(key_for(Sampled([int], 10)),
+                            key_for(Sampled([int], 10, seed=1)))
+        self.assertNotEqual(key_for(Sampled([int], 10)), key_for([int]))
+
+    def test_keys_tell_apart_offloaded(self):
+        self.assertNotEqual(key_for(Offloaded([int])), key_for([int]))
+        self.assertNotEqual(key_for(Offloaded([int])),
+                            key_for(Offloaded([int], object())))
+
+    def test_keys_tell_apart_memoized(self):
+        self.assertNotEqual(key_for(Memoized([int])), key_for([int]))
+        self.assertNotEqual(key_for(Memoized([int])),
+                            key_for(Memoized([int], 10)))
+
+    def test_none_for_unhashable_specs(self):
+        self.assertIsNone(key_for((bytearray(), 1)))
+        self.assertIsNone(key_for([(0, bytearray())]))
+
+
+class TestSpecCache(ut.TestCase):
+
+    def test_has_maxsize(self):
+        self.assertEqual(SpecCache().maxsize, 1024)
+        self.assertEqual(SpecCache(3).maxsize, 3)
+
+    def test_add_returns_checker(self):
+        self.assertIs(SpecCache().add('key', print), print)
+
+    def test_get_returns_cached_checker(self):
+        cache = SpecCache()
+        _ = cache.add('key', print)
+        self.assertIs(cache.get('key'), print)
+
+    def test_get_returns_default_if_not_cached(self):
+        self.assertIsNone(SpecCache().get('key'))
+        self.assertIs(SpecCache().get('key', print), print)
+
+    def test_evicts_least_recently_used(self):
+        cache = SpecCache(2)
+        _ = cache.add('a', 1)
+        _ = cache.add('b', 2)
+        _ = cache.get('a')
+        _ = cache.add('c', 3)
+        self.assertListEqual(list(cache), ['a', 'c'])
+
+    def test_caches_nothing_with_maxsize_zero(self):
+        cache = SpecCache(0)
+        _ = cache.add('a', 1)
+        self.assertEqual(len(cache), 0)
+
+
+class TestInterning(ut.TestCase):
+
+    def test_identical_type_specs_share_checkers(self):
+        first = TypeParser()(([int], {str: ...}, (bool, ...)))
+        second = TypeParser()(dict(x=[int], y={str: ...}, z=(bool, ...)))
+        self.assertListEqual(first, list(second.values()))
+        for one, other in zip(first, second.values()):
+            self.assertIs(one, other)
+
+    def test_identical_bounds_specs_share_checkers(self):
+        first = BoundsParser()(((0, ...), [(0, 1)]))
+        second = BoundsParser()(((0, ...), [(0, 1)]))
+        self.assertIs(first[0], second[0])
+        self.assertIs(first[1], second[1])
+
+    def test_type_and_bounds_specs_do_not_share_checkers(self):
+        type_check = TypeParser()((((int,), (str,)),))[0]
+        bounds_check = BoundsParser()((((0, 1), (2, 3)),))[0]
+        self.assertIsNot(type_check, bounds_check)
+
+    def test_limits_of_other_types_do_not_share_checkers(self):
+        first = BoundsParser()(((0, 1),))[0]
+        second = BoundsParser()(((0.0, 1.0),))[0]
+        self.assertIsNot(first, second)
+
+    def test_unhashable_limits_are_parsed_every_time(self):
+        first = BoundsParser()(((b'', bytearray(b'a')),))[0]
+        second = BoundsParser()(((b'', bytearray(b'a')),))[0]
+        self.assertIsNot(first, second)
+
+    def test_decorators_share_checkers(self):
+        def f(x):
+            return x
+
+        def g(y):
+            return y
+        typed_f, typed_g = Typed([int]), Typed(y=[int])
+        _, _ = typed_f(f), typed_g(g)
+        self.assertIs(typed_f.arg_checks[0], typed_g.kwarg_checks['y'])
+        bounded_f, bounded_g = Bounded((0, 1)), Bounded(y=(0, 1))
+        _, _ = bounded_f(f), bounded_g(g)
+        self.assertIs(bounded_f.arg_checks[0], bounded_g.kwarg_checks['y'])
+
+    def test_invalid_specs_raise_with_their_own_position(self):
+        err_msg = ('Invalid expression 1 of type int for type specification'
+                   ' of argument at position 1! Must be one of type, tuple,'
+                   ' list, set, dict, or ellipsis.')
+        with self.assertRaises(TypeError):
+            _ = TypeParser()((1,))
+        with self.assertRaises(TypeError) as err:
+            _ = TypeParser()((int, 1))
+        self.assertEqual(str(err.exception), err_msg)
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -1,6 +1,11 @@
 import logging
 import unittest as ut
+from types import GeneratorType
+from inspect import isfunction, isgeneratorfunction
+from itertools import count, islice
 from ...decorators import Typed
+from ...functional.sampled import Sampled
+from ...levels import set_level
 from ...exceptions import WrongTypeError, LenError
 
 
@@ -1195,5 +1200,338 @@ class TestTypedMethods(ut.TestCase):
         self.assertEqual(log.output, log_msg)
 
 
+class TestTypedSpecialization(ut.TestCase):
+
+    def test_returns_function_if_nothing_to_check(self):
+        def f(x, y):
+            return x + y
+        self.assertIs(Typed(..., y=...)(f), f)
+
+    def test_same_decorator_works_on_functions_with_other_names(self):
+        typed = Typed(int)
+
+        @typed
+        def f(x):
+            return x
+
+        @typed
+        def g(y, x):
+            return y, x
+        self.assertTupleEqual(g(1, 'foo'), (1, 'foo'))
+        self.assertTupleEqual(g(1, x='foo'), (1, 'foo'))
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f('foo')
+
+    def test_checks_kwargs_in_order_of_call(self):
+        @Typed(x=int, y=int)
+        def f(x, y):
+            return x, y
+        err_msg = ('Type of argument y to function f defined in module'
+                   f' {__name__} must be int, not str like foo!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = f(y='foo', x='bar')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_checks_undeclared_kwargs(self):
+        @Typed(z=int)
+        def f(x, **kwargs):
+            return x, kwargs
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f(1, z='foo')
+
+    def test_does_not_check_surplus_positional_args(self):
+        @Typed(int, int)
+        def f(x, *args):
+            return x, args
+        self.assertTupleEqual(f(1, 'foo', 2.0), (1, ('foo', 2.0)))
+
+
+class TestTypedSampled(ut.TestCase):
+
+    def test_works_with_sampled_list(self):
+        @Typed(Sampled([int], 2))
+        def f(x):
+            return x
+        inputs = [1, 'a', 2]
+        self.assertIs(f(inputs), inputs)
+
+    def test_works_with_sampled_kwarg(self):
+        @Typed(x=Sampled((int, ...), 2, seed=1))
+        def f(x):
+            return x
+        inputs = (1, 'a', 2.0, 3, 4)
+        self.assertIs(f(x=inputs), inputs)
+
+    def test_error_on_sampled_element(self):
+        @Typed(Sampled([int], 2))
+        def f(x):
+            return x
+        err_msg = ('Type of element 2 in list argument x to function f'
+                   f' defined in module {__name__} must be int, not str'
+                   ' like b!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = f([1, 'a', 'b'])
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_wrong_container_type(self):
+        @Typed(Sampled([int], 2))
+        def f(x):
+            return x
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f((1, 2, 3))
+
+    def test_error_on_invalid_sampled_type_specification(self):
+        err_msg = ('Invalid expression 1 of type int for type specification'
+                   ' of argument x! Must be one of type, tuple, list, set,'
+                   ' dict, or ellipsis.')
+        with self.assertRaises(TypeError) as err:
+            @Typed(x=Sampled(1, 2))
+            def f(x):
+                return x
+        self.assertEqual(str(err.exception), err_msg)
+
+
+class TestTypedVariadic(ut.TestCase):
+
+    def test_works_with_star_args(self):
+        @Typed(str, args=int)
+        def f(x, *args):
+            return x, args
+        self.assertTupleEqual(f('a'), ('a', ()))
+        self.assertTupleEqual(f('a', 1, 2, 3), ('a', (1, 2, 3)))
+
+    def test_error_on_wrong_type_of_star_arg(self):
+        @Typed(args=int)
+        def f(x, *args):
+            return x, args
+        err_msg = ('Type of argument args[1] to function f defined in module'
+                   f' {__name__} must be int, not str like foo!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = f('no', 1, 'foo', 3)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_subclasses_of_star_args_are_checked_one_by_one(self):
+        @Typed(args=int)
+        def f(*args):
+            return args
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f(1, True)
+
+    def test_works_with_star_star_kwargs(self):
+        @Typed(kwargs=(int, float))
+        def f(x, **kwargs):
+            return x, kwargs
+        self.assertTupleEqual(f('a', y=1, z=2.0), ('a', {'y': 1, 'z': 2.0}))
+        self.assertTupleEqual(f(x='a', y=1), ('a', {'y': 1}))
+
+    def test_error_on_wrong_type_of_star_star_kwarg(self):
+        @Typed(kwargs=int)
+        def f(x, **kwargs):
+            return x, kwargs
+        err_msg = ('Type of argument z to function f defined in module'
+                   f' {__name__} must be int, not str like foo!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = f(x='no', y=1, z='foo')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_named_parameters_are_not_star_star_kwargs(self):
+        @Typed(kwargs=int)
+        def f(x, *, y='foo', **kwargs):
+            return x, y, kwargs
+        self.assertTupleEqual(f(x='a', y='b', z=1), ('a', 'b', {'z': 1}))
+
+    def test_works_with_container_specs(self):
+        @Typed(args=[int], kwargs={str: int})
+        def f(*args, **kwargs):
+            return args, kwargs
+        _ = f([1, 2], [3], y={'a': 1})
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f([1, 2], [3.0])
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f(y={'a': 'b'})
+
+    def test_works_with_methods(self):
+        class Test:
+            @Typed(args=int)
+            def m(self, x, *args):
+                return x, args
+        self.assertTupleEqual(Test().m('a', 1, 2), ('a', (1, 2)))
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = Test().m('a', 1, 'b')
+
+    def test_works_stacked(self):
+        @Typed(args=int)
+        @Typed(kwargs=str)
+        def f(*args, **kwargs):
+            return args, kwargs
+        self.assertTupleEqual(f(1, y='a'), ((1,), {'y': 'a'}))
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f('a')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f(y=1)
+
+    def test_works_with_sampled_specs(self):
+        @Typed(args=Sampled([int], 2))
+        def f(*args):
+            return args
+        inputs = [1, 'a', 2]
+        self.assertTupleEqual(f(inputs), (inputs,))
+
+    def test_elements_of_star_args_are_sampled_at_boundary_level(self):
+        @Typed(args=[int])
+        def f(*args):
+            return args
+        inputs = [1, 'a', 2]
+        set_level('boundary', __name__)
+        try:
+            self.assertTupleEqual(f(inputs), (inputs,))
+        finally:
+            set_level(None, __name__)
+
+
+class TestTypedYields(ut.TestCase):
+
+    def test_works_with_generators(self):
+        @Typed(int, yields=int)
+        def f(n):
+            yield from range(n)
+        self.assertListEqual(list(f(3)), [0, 1, 2])
+
+    def test_checks_arguments_right_away(self):
+        @Typed(int, yields=int)
+        def f(n):
+            yield from range(n)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f('foo')
+
+    def test_returns_plain_function_that_returns_generator(self):
+        @Typed(int, yields=int)
+        def f(n):
+            yield from range(n)
+        self.assertFalse(isgeneratorfunction(f))
+        self.assertTrue(isfunction(f))
+        self.assertIsInstance(f(3), GeneratorType)
+
+    def test_checks_items_as_they_are_yielded(self):
+        produced = []
+
+        @Typed(yields=int)
+        def f():
+            for value in (1, 2, 'foo', 4):
+                produced.append(value)
+                yield value
+        generator = f()
+        self.assertListEqual(produced, [])
+        self.assertEqual(next(generator), 1)
+        self.assertListEqual(produced, [1])
+        err_msg = ('Type of item yielded by function f defined in module'
+                   f' {__name__} must be int, not str like foo!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = list(generator)
+        self.assertEqual(str(err.exception), err_msg)
+        self.assertListEqual(produced, [1, 2, 'foo'])
+
+    def test_works_with_endless_generators(self):
+        @Typed(yields=int)
+        def f():
+            yield from count()
+        self.assertListEqual(list(islice(f(), 1000, 1003)), [1000, 1001, 1002])
+
+    def test_passes_on_sent_values_and_return_value(self):
+        @Typed(yields=int)
+        def f():
+            total = 0
+            while total < 10:
+                total += yield total
+            return total
+        generator = f()
+        self.assertEqual(next(generator), 0)
+        self.assertEqual(generator.send(4), 4)
+        with self.assertRaises(StopIteration) as stop:
+            _ = generator.send(7)
+        self.assertEqual(stop.exception.value, 11)
+
+    def test_passes_on_thrown_exceptions(self):
+        @Typed(yields=int)
+        def f():
+            while True:
+                try:
+                    yield 1
+                except ValueError:
+                    yield -1
+        generator = f()
+        _ = next(generator)
+        self.assertEqual(generator.throw(ValueError), -1)
+        with self.assertRaises(KeyError):
+            _ = generator.throw(KeyError)
+
+    def test_closing_wrapper_closes_generator(self):
+        closed = []
+
+        @Typed(yields=int)
+        def f():
+            try:
+                while True:
+                    yield 1
+            finally:
+                closed.append(True)
+        generator = f()
+        _ = next(generator)
+        generator.close()
+        self.assertListEqual(closed, [True])
+
+    def test_works_stacked(self):
+        @Typed(int, yields=int)
+        @Typed(yields=(int, float))
+        def f(n):
+            yield from range(n)
+            yield 1.5
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = list(f(2))
+
+    def test_works_with_methods(self):
+        class Test:
+            @Typed(yields=str)
+            def m(self, n):
+                yield from 'a' * n
+        self.assertListEqual(list(Test().m(2)), ['a', 'a'])
+
+    def test_checks_nothing_if_switched_off(self):
+        @Typed(yields=int)
+        def f():
+            yield 'foo'
+        set_level('off', __name__)
+        try:
+            self.assertListEqual(list(f()), ['foo'])
+        finally:
+            set_level(None, __name__)
+
+    def test_error_on_function_that_is_no_generator(self):
+        def f():
+            return 1
+        err_msg = ('Cannot check values yielded by function f defined in'
+                   f' module {__name__}, because it is not a generator'
+                   ' function!')
+        with self.assertRaises(TypeError) as err:
+            _ = Typed(yields=int)(f)
+        self.assertEqual(str(err.exception), err_msg)
+
+
 if __name__ == '__main__':
     ut.main()
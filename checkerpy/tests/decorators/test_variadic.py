@@ -0,0 +1,123 @@
+import logging
+import unittest as ut
+from ...decorators.variadic import StarArgs, StarKwargs, batched
+from ...decorators.variadic import star_names_from
+from ...types.one import Just
+from ...validators.one import Limited
+from ...exceptions import WrongTypeError
+
+ARG_STRING = 'argument {} to function f'
+
+
+class CountingCheck:
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, value, name=None, **kwargs):
+        self.calls.append((value, str(name)))
+        return value
+
+
+class TestBatched(ut.TestCase):
+
+    def test_none_for_other_checks(self):
+        self.assertIsNone(batched(Limited))
+        self.assertIsNone(batched(lambda value, name=None: value))
+
+    def test_accepts_exact_types(self):
+        accepts = batched(Just(int, float))
+        self.assertTrue(accepts([1, 2.0, 3]))
+        self.assertTrue(accepts([]))
+        self.assertFalse(accepts([1, 'a']))
+        self.assertFalse(accepts([True]))
+
+
+class TestStarArgs(ut.TestCase):
+
+    def test_checks_only_arguments_after_start(self):
+        check = CountingCheck()
+        star_args = StarArgs(check, 2, ARG_STRING, 'args')
+        star_args((0, 1, 'a', 'b'), {})
+        self.assertListEqual(check.calls, [
+            ('a', 'argument args[0] to function f'),
+            ('b', 'argument args[1] to function f')])
+
+    def test_nothing_to_check(self):
+        check = CountingCheck()
+        StarArgs(check, 2, ARG_STRING, 'args')((0, 1), {})
+        self.assertListEqual(check.calls, [])
+
+    def test_accepted_arguments_are_not_checked_one_by_one(self):
+        check = CountingCheck()
+        accepted = []
+
+        def accepts(values):
+            accepted.extend(values)
+            return True
+        StarArgs(check, 1, ARG_STRING, 'args', accepts)((0, 1, 2), {})
+        self.assertListEqual(accepted, [1, 2])
+        self.assertListEqual(check.calls, [])
+
+    def test_error_names_argument(self):
+        check = Just(int)
+        star_args = StarArgs(check, 0, ARG_STRING, 'args', batched(check))
+        err_msg = ('Type of argument args[2] to function f must be int,'
+                   ' not str like a!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                star_args((1, 2, 'a'), {})
+        self.assertEqual(str(err.exception), err_msg)
+
+
+class TestStarKwargs(ut.TestCase):
+
+    def test_checks_only_arguments_not_named(self):
+        check = CountingCheck()
+        star_kwargs = StarKwargs(check, frozenset({'x'}), ARG_STRING)
+        star_kwargs((), {'x': 1, 'y': 2})
+        self.assertListEqual(check.calls,
+                             [(2, 'argument y to function f')])
+
+    def test_accepted_arguments_are_not_checked_one_by_one(self):
+        check = CountingCheck()
+        star_kwargs = StarKwargs(check, frozenset({'x'}), ARG_STRING,
+                                 batched(Just(int)))
+        star_kwargs((), {'y': 1, 'z': 2})
+        self.assertListEqual(check.calls, [])
+
+    def test_named_arguments_are_never_accepted_at_once(self):
+        check = CountingCheck()
+        star_kwargs = StarKwargs(check, frozenset({'x'}), ARG_STRING,
+                                 batched(Just(int)))
+        star_kwargs((), {'x': 'a', 'y': 1})
+        self.assertListEqual(check.calls,
+                             [(1, 'argument y to function f')])
+
+
+class TestStarNamesFrom(ut.TestCase):
+
+    def test_no_star_names(self):
+        def f(x, y=1, *, z=2):
+            return x, y, z
+        self.assertTupleEqual(star_names_from(f), (None, None, 2))
+
+    def test_star_names(self):
+        def f(x, *values, y=1, **options):
+            return x, values, y, options
+        self.assertTupleEqual(star_names_from(f), ('values', 'options', 1))
+
+    def test_only_star_star_name(self):
+        def f(self, **kwargs):
+            return kwargs
+        self.assertTupleEqual(star_names_from(f), (None, 'kwargs', 1))
+
+    def test_stored_star_names(self):
+        def f(*args, **kwargs):
+            return args, kwargs
+        f.__starnames__ = ('a', None, 3)
+        self.assertTupleEqual(star_names_from(f), ('a', None, 3))
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -0,0 +1,117 @@
+import unittest as ut
+from operator import le, ge
+from ...functional.arrays import numeric_array, vectorizable
+from ...functional.arrays import first_outside, position_of
+try:
+    import numpy as np
+except ImportError:
+    no_numpy = True
+else:
+    no_numpy = False
+
+
+class TestNumericArrayWithoutNumpy(ut.TestCase):
+
+    def test_none_for_other_values(self):
+        for value in (1, [1, 2], (1.0,), 'foo', None):
+            with self.subTest(value=value):
+                self.assertIsNone(numeric_array(value))
+
+
+@ut.skipIf(no_numpy, 'Could not import numpy!')
+class TestNumericArray(ut.TestCase):
+
+    def test_returns_numeric_arrays(self):
+        for dtype in (bool, np.uint8, np.int64, np.float32):
+            array = np.zeros(3, dtype=dtype)
+            with self.subTest(dtype=dtype):
+                self.assertIs(numeric_array(array), array)
+
+    def test_none_for_other_dtypes(self):
+        for array in (np.array(['a', 'b']), np.array([1, 'a'], dtype=object),
+                      np.array([1j]), np.array(['2020-01-01'], 'M8[D]')):
+            with self.subTest(dtype=array.dtype):
+                self.assertIsNone(numeric_array(array))
+
+
+@ut.skipIf(no_numpy, 'Could not import numpy!')
+class TestVectorizable(ut.TestCase):
+
+    def test_numeric_limits(self):
+        for limit in (..., 1, 1.5, True, np.int8(1), np.float32(1.5)):
+            with self.subTest(limit=limit):
+                self.assertTrue(vectorizable(limit))
+
+    def test_other_limits(self):
+        for limit in ('a', [1], None, 1j, np.array([1, 2])):
+            with self.subTest(limit=limit):
+                self.assertFalse(vectorizable(limit))
+
+
+@ut.skipIf(no_numpy, 'Could not import numpy!')
+class TestFirstOutside(ut.TestCase):
+
+    def test_none_if_inside(self):
+        array = np.arange(10)
+        self.assertIsNone(first_outside(array, 0, 9))
+        self.assertIsNone(first_outside(array, ..., 9))
+        self.assertIsNone(first_outside(array, 0, ...))
+        self.assertIsNone(first_outside(array, ..., ...))
+
+    def test_none_if_empty(self):
+        self.assertIsNone(first_outside(np.array([]), 0, 1))
+
+    def test_finds_first_element_below(self):
+        array = np.array([3, 2, -1, 5, -2])
+        self.assertEqual(first_outside(array, 0, ...), 2)
+
+    def test_finds_first_element_above(self):
+        array = np.array([3, 2, 7, 5, 8])
+        self.assertEqual(first_outside(array, ..., 6), 2)
+
+    def test_finds_first_element_either_side(self):
+        array = np.array([3, 9, -1])
+        self.assertEqual(first_outside(array, 0, 6), 1)
+        array = np.array([3, -1, 9])
+        self.assertEqual(first_outside(array, 0, 6), 1)
+
+    def test_nan_is_never_outside(self):
+        array = np.array([np.nan, 0.5, np.nan])
+        self.assertIsNone(first_outside(array, 0, 1))
+
+    def test_nan_does_not_hide_elements_outside(self):
+        array = np.array([np.nan, 0.5, -1.0, 2.0])
+        self.assertEqual(first_outside(array, 0, ...), 2)
+        self.assertEqual(first_outside(array, ..., 1), 3)
+
+    def test_unsigned_integers_and_negative_limits(self):
+        array = np.arange(5, dtype=np.uint8)
+        self.assertIsNone(first_outside(array, -1, 300))
+        self.assertEqual(first_outside(array, 1, ...), 0)
+
+    def test_flat_index_into_multidimensional_arrays(self):
+        array = np.zeros((3, 4))
+        array[2, 1] = 5
+        self.assertEqual(first_outside(array, ..., 1), 9)
+
+    def test_open_bounds(self):
+        array = np.array([1, 2, 3])
+        self.assertIsNone(first_outside(array, 1, 3))
+        self.assertEqual(first_outside(array, 1, 3, below=le), 0)
+        self.assertEqual(first_outside(array, 1, 3, above=ge), 2)
+
+
+@ut.skipIf(no_numpy, 'Could not import numpy!')
+class TestPositionOf(ut.TestCase):
+
+    def test_one_dimensional(self):
+        self.assertEqual(position_of(np.zeros(5), 3), 3)
+
+    def test_multidimensional(self):
+        position = position_of(np.zeros((3, 4)), 9)
+        self.assertTupleEqual(position, (2, 1))
+        self.assertIs(type(position[0]), int)
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -0,0 +1,132 @@
+import gc
+import unittest as ut
+from ...functional.attrcache import AttrCache, provides
+
+
+class Slotted:
+    __slots__ = 'foo',
+
+
+class Proxy:
+
+    def __getattribute__(self, attr):
+        raise AttributeError(attr)
+
+    def method(self):
+        pass
+
+
+class TestProvides(ut.TestCase):
+
+    def test_method_of_builtin(self):
+        self.assertTrue(provides(list, 'append'))
+
+    def test_method_of_base_class(self):
+        self.assertTrue(provides(bool, 'bit_length'))
+
+    def test_method_of_class(self):
+        self.assertTrue(provides(TestProvides, 'test_method_of_class'))
+
+    def test_class_attribute(self):
+        self.assertTrue(provides(Slotted, '__slots__'))
+
+    def test_missing_attribute(self):
+        self.assertFalse(provides(list, 'foo'))
+
+    def test_not_attribute_of_metaclass(self):
+        self.assertFalse(provides(int, '__name__'))
+
+    def test_not_slot(self):
+        self.assertFalse(provides(Slotted, 'foo'))
+
+    def test_not_property(self):
+        self.assertFalse(provides(complex, 'real'))
+
+    def test_not_with_custom_attribute_access(self):
+        self.assertFalse(provides(Proxy, 'method'))
+
+
+class TestAttrCache(ut.TestCase):
+
+    def test_has_default_maxsize(self):
+        cache = AttrCache()
+        self.assertEqual(cache.maxsize, 256)
+
+    def test_provided_attributes_are_verified(self):
+        cache = AttrCache()
+        unverified = cache.unverified(list, ('append', 'pop'))
+        self.assertTupleEqual(unverified, ())
+
+    def test_other_attributes_are_unverified(self):
+        cache = AttrCache()
+        unverified = cache.unverified(list, ('foo', 'append', 'bar'))
+        self.assertTupleEqual(unverified, ('foo', 'bar'))
+
+    def test_verified_attributes_are_cached_per_type(self):
+        cache = AttrCache()
+        _ = cache.unverified(list, ('append', 'foo'))
+        self.assertEqual(len(cache), 1)
+        *_, verified, examined = cache[id(list)]
+        self.assertSetEqual(verified, {'append'})
+        self.assertSetEqual(examined, {'append', 'foo'})
+
+    def test_further_attributes_are_examined(self):
+        cache = AttrCache()
+        _ = cache.unverified(list, ('append',))
+        unverified = cache.unverified(list, ('pop', 'foo'))
+        self.assertTupleEqual(unverified, ('foo',))
+        *_, verified, examined = cache[id(list)]
+        self.assertSetEqual(verified, {'append', 'pop'})
+        self.assertSetEqual(examined, {'append', 'pop', 'foo'})
+
+    def test_deleted_attribute_is_unverified(self):
+        cache = AttrCache()
+        Dynamic = type('Dynamic', (), {'foo': lambda self: None})
+        self.assertTupleEqual(cache.unverified(Dynamic, ('foo',)), ())
+        del Dynamic.foo
+        self.assertTupleEqual(cache.unverified(Dynamic, ('foo',)), ('foo',))
+
+    def test_added_attribute_is_verified(self):
+        cache = AttrCache()
+        Dynamic = type('Dynamic', (), {})
+        self.assertTupleEqual(cache.unverified(Dynamic, ('foo',)), ('foo',))
+        Dynamic.foo = 1
+        self.assertTupleEqual(cache.unverified(Dynamic, ('foo',)), ())
+
+    def test_attribute_deleted_while_other_added_is_unverified(self):
+        cache = AttrCache()
+        Dynamic = type('Dynamic', (), {'foo': 1})
+        self.assertTupleEqual(cache.unverified(Dynamic, ('foo',)), ())
+        del Dynamic.foo
+        Dynamic.bar = 1
+        self.assertTupleEqual(cache.unverified(Dynamic, ('foo',)), ('foo',))
+
+    def test_attribute_deleted_from_base_is_unverified(self):
+        cache = AttrCache()
+        Base = type('Base', (), {'foo': 1})
+        Derived = type('Derived', (Base,), {})
+        self.assertTupleEqual(cache.unverified(Derived, ('foo',)), ())
+        del Base.foo
+        self.assertTupleEqual(cache.unverified(Derived, ('foo',)), ('foo',))
+
+    def test_reassigned_bases_are_noticed(self):
+        cache = AttrCache()
+        Base = type('Base', (), {'foo': 1})
+        Other = type('Other', (), {'bar': 1})
+        Derived = type('Derived', (Base,), {})
+        self.assertTupleEqual(cache.unverified(Derived, ('foo',)), ())
+        Derived.__bases__ = Other,
+        self.assertTupleEqual(cache.unverified(Derived, ('foo',)), ('foo',))
+
+    def test_does_not_keep_type_alive(self):
+        cache = AttrCache()
+        Dynamic = type('Dynamic', (), {'foo': 1})
+        _ = cache.unverified(Dynamic, ('foo',))
+        self.assertEqual(len(cache), 1)
+        del Dynamic
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    ut.main()
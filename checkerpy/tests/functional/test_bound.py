@@ -0,0 +1,107 @@
+import logging
+import unittest as ut
+from ...functional import Bound, CompositionOf
+from ...validators.one import JustLen, Has, OneOf, Contains
+from ...validators.all import LimitedTuple
+from ...types.one import JustList
+from ...exceptions import LenError, IntError, WrongTypeError, ItemError
+
+
+class Counter:
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value, name=None, *lengths):
+        self.calls += 1
+        return value
+
+
+class TestBound(ut.TestCase):
+
+    def test_has_attributes(self):
+        bound = JustLen.bind(length=(2, 3))
+        self.assertIsInstance(bound, Bound)
+        self.assertIs(bound.validator, JustLen)
+        self.assertDictEqual(dict(bound.spec), {'length': (2, 3)})
+        self.assertEqual(bound.__name__, 'JustLen')
+
+    def test_normalized_spec(self):
+        bound = Has.bind(attr='append')
+        self.assertTupleEqual(bound.normalized, (('append',),))
+
+    def test_spec_is_read_only(self):
+        bound = JustLen.bind(length=2)
+        with self.assertRaises(TypeError):
+            bound.spec['length'] = 3
+        with self.assertRaises(AttributeError):
+            bound.spec = {'length': 3}
+
+    def test_spec_is_copied(self):
+        spec = {'length': 2}
+        bound = Bound(JustLen, Counter(), spec, (2,))
+        spec['length'] = 3
+        self.assertDictEqual(dict(bound.spec), {'length': 2})
+
+    def test_calls_check_with_normalized_spec(self):
+        check = Counter()
+        bound = Bound(JustLen, check, {'length': '2'}, (2,))
+        self.assertListEqual(bound([1, 2], 'test'), [1, 2])
+        self.assertEqual(check.calls, 1)
+
+    def test_validates_spec_once_when_binding(self):
+        with self.assertRaises(IntError):
+            _ = JustLen.bind(length='foo')
+
+    def test_checks_value(self):
+        bound = JustLen.bind(length=(2, 3))
+        self.assertListEqual(bound([1, 2]), [1, 2])
+        self.assertListEqual(bound([1, 2, 3], 'test'), [1, 2, 3])
+        err_msg = 'Length of list test must be one of (2, 3), not 1!'
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LenError) as err:
+                _ = bound([1], 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_same_errors_as_validator(self):
+        cases = ((JustLen.bind(length=2), {'length': 2}, [1]),
+                 (Has.bind(attr='foo'), {'attr': 'foo'}, 1),
+                 (OneOf.bind(items=(1, 2)), {'items': (1, 2)}, 3),
+                 (Contains.bind(every=(1, 2)), {'every': (1, 2)}, [1]),
+                 (LimitedTuple.bind(limits=((0, 1),)),
+                  {'limits': ((0, 1),)}, (2,)),
+                 (LimitedTuple.bind(limits=((0, 1),)),
+                  {'limits': ((0, 1),)}, [1]))
+        for bound, spec, value in cases:
+            with self.subTest(validator=bound.__name__, value=value):
+                with self.assertLogs(level=logging.ERROR):
+                    with self.assertRaises(Exception) as expected:
+                        _ = bound.validator(value, 'test', **spec)
+                with self.assertLogs(level=logging.ERROR):
+                    with self.assertRaises(type(expected.exception)) as err:
+                        _ = bound(value, 'test')
+                self.assertEqual(str(err.exception),
+                                 str(expected.exception))
+
+    def test_ignores_other_keywords(self):
+        bound = JustLen.bind(length=2)
+        self.assertListEqual(bound([1, 2], 'test', foo='bar'), [1, 2])
+
+    def test_keywords_replace_bound_spec(self):
+        bound = Contains.bind(every=(1,), some=(2, 3))
+        self.assertListEqual(bound([1, 2], 'test', every=(2,)), [1, 2])
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError):
+                _ = bound([1, 2], 'test', some=(4,))
+
+    def test_composition(self):
+        composition = JustLen.bind(length=2).o(JustList)
+        self.assertIsInstance(composition, CompositionOf)
+        self.assertListEqual(composition([1, 2], 'test'), [1, 2])
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = composition((1, 2), 'test')
+
+
+if __name__ == '__main__':
+    ut.main()
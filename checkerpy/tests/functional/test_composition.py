@@ -1,3 +1,4 @@
+import sys
 import unittest as ut
 from ...functional import CompositionOf
 from ...exceptions import CallableError
@@ -156,5 +157,78 @@ class TestCompositionOf(ut.TestCase):
         self.assertEqual(comp.__doc__, 'docstring')
 
 
+class TestCompositionOfChains(ut.TestCase):
+
+    def setUp(self):
+        self.depths = []
+
+        def record(value, name=None, **kwargs):
+            self.depths.append(len(self.frames()))
+            return value + 1
+
+        self.record = record
+
+    @staticmethod
+    def frames():
+        frame, frames = sys._getframe(), []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        return frames
+
+    def chain_of(self, n_stages: int) -> CompositionOf:
+        chain = CompositionOf(self.record, self.record)
+        for _ in range(n_stages - 2):
+            chain = chain.o(self.record)
+        return chain
+
+    def test_chain_calls_all_stages(self):
+        self.assertEqual(self.chain_of(10)(0), 10)
+
+    def test_call_depth_does_not_grow_with_chain_length(self):
+        _ = self.chain_of(2)(0)
+        _ = self.chain_of(10)(0)
+        self.assertEqual(len(set(self.depths)), 1)
+
+    def test_call_depth_does_not_grow_with_nesting(self):
+        nested = CompositionOf(self.chain_of(3), self.chain_of(3))
+        _ = self.chain_of(2)(0)
+        _ = nested(0)
+        self.assertEqual(len(set(self.depths)), 1)
+
+    def test_stages_are_called_in_order(self):
+        chain = CompositionOf(lambda x, name=None: x * 2,
+                              lambda x, name=None: x + 1)
+        chain = chain.o(lambda x, name=None: x ** 2)
+        self.assertEqual(chain(3), 20)
+
+    def test_o_does_not_change_original_chain(self):
+        chain = self.chain_of(2)
+        _ = chain.o(self.record)
+        self.assertEqual(chain(0), 2)
+
+    def test_kwargs_are_passed_to_all_stages(self):
+        received = []
+
+        def stage(value, name=None, **kwargs):
+            received.append((name, kwargs))
+            return value
+
+        _ = CompositionOf(stage, stage).o(stage)(1, 'test', foo='bar')
+        self.assertListEqual(received, [('test', {'foo': 'bar'})] * 3)
+
+    def test_error_names_failing_stage_in_long_chain(self):
+        def wrong(value):
+            return value
+
+        chain = self.chain_of(5).o(wrong).o(self.record)
+        err_msg = ('wrong must be a callable that accepts (i) '
+                   'a value, (ii) an optional name for that value,'
+                   ' and (iii) any number of keyword arguments!')
+        with self.assertRaises(CallableError) as err:
+            _ = chain(0)
+        self.assertEqual(str(err.exception), err_msg)
+
+
 if __name__ == '__main__':
     ut.main()
@@ -0,0 +1,182 @@
+import logging
+import unittest as ut
+from ...functional.context import Context, Deferred
+from ...types.one import Just
+from ...types.all import All, TypedDict, TypedTuple
+from ...validators.one import JustLen, OneOf, JustCall, Contains, Has
+from ...validators.one import Limited, NonEmpty, Identifier
+from ...validators.all import AllLimited, AllLen, AllHave, AllNonEmpty
+from ...validators.all import AllContain, LimitedTuple
+from ...exceptions import LimitError
+
+
+class Loud(list):
+    """List that counts how often it is rendered to a string."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.renders = 0
+
+    def __repr__(self):
+        self.renders += 1
+        return super().__repr__()
+
+    __str__ = __repr__
+
+    def __hash__(self):
+        return id(self)
+
+
+class TestContext(ut.TestCase):
+
+    def test_has_value(self):
+        context = Context([1, 2], 'test')
+        self.assertListEqual(context.value, [1, 2])
+
+    def test_name_is_empty_without_name(self):
+        context = Context([1, 2])
+        self.assertEqual(context.name, '')
+
+    def test_name_is_rendered_to_str(self):
+        context = Context([1, 2], 3)
+        self.assertEqual(context.name, '3')
+
+    def test_string_is_name_if_given(self):
+        context = Context([1, 2], 'test')
+        self.assertEqual(context.string, 'test')
+
+    def test_string_is_value_without_name(self):
+        context = Context([1, 2])
+        self.assertEqual(context.string, '[1, 2]')
+
+    def test_type_name(self):
+        context = Context([1, 2])
+        self.assertEqual(context.type_name, 'list')
+
+    def test_does_not_render_value_on_instantiation(self):
+        value = Loud([1, 2])
+        _ = Context(value)
+        self.assertEqual(value.renders, 0)
+
+    def test_renders_value_only_once(self):
+        value = Loud([1, 2])
+        context = Context(value)
+        _ = context.string
+        _ = context.string
+        self.assertEqual(value.renders, 1)
+
+    def test_renders_deferred_name(self):
+        context = Context([1, 2], Deferred('element {}'.format, 3))
+        self.assertEqual(context.name, 'element 3')
+
+
+class TestDeferred(ut.TestCase):
+
+    def test_str_calls_render_with_args(self):
+        deferred = Deferred('{} and {}'.format, 'foo', 'bar')
+        self.assertEqual(str(deferred), 'foo and bar')
+
+    def test_format_calls_render_with_args(self):
+        deferred = Deferred('{} and {}'.format, 'foo', 'bar')
+        self.assertEqual(f'{deferred}!', 'foo and bar!')
+
+    def test_does_not_render_on_instantiation(self):
+        value = Loud([1, 2])
+        _ = Deferred(str, value)
+        self.assertEqual(value.renders, 0)
+
+
+class TestPassingChecksDoNotRender(ut.TestCase):
+
+    def setUp(self):
+        self.value = Loud([Loud([1, 2]), Loud([3, 4])])
+
+    def assertNotRendered(self):
+        self.assertEqual(self.value.renders, 0)
+        for element in self.value:
+            self.assertEqual(element.renders, 0)
+
+    def test_just(self):
+        _ = Just(Loud)(self.value)
+        self.assertNotRendered()
+
+    def test_all(self):
+        _ = All(Loud)(self.value)
+        self.assertNotRendered()
+
+    def test_justlen(self):
+        _ = JustLen(self.value, length=2)
+        self.assertNotRendered()
+
+    def test_oneof(self):
+        _ = OneOf(self.value, items=(self.value,))
+        self.assertNotRendered()
+
+    def test_justcall(self):
+        _ = JustCall(self.value.append)
+        self.assertNotRendered()
+
+    def test_contains(self):
+        _ = Contains(self.value[0], every=(1, 2))
+        self.assertNotRendered()
+
+    def test_has(self):
+        _ = Has(self.value, attr='append')
+        self.assertNotRendered()
+
+    def test_limited(self):
+        _ = Limited(self.value, lo=[])
+        self.assertNotRendered()
+
+    def test_nonempty(self):
+        _ = NonEmpty(self.value)
+        self.assertNotRendered()
+
+    def test_identifier(self):
+        _ = Identifier('foo', name=self.value)
+        self.assertNotRendered()
+
+    def test_typeddict(self):
+        _ = TypedDict({1: self.value}, keys=int, values=Loud)
+        self.assertNotRendered()
+
+    def test_typedtuple(self):
+        _ = TypedTuple((self.value,), types=(Loud,))
+        self.assertNotRendered()
+
+    def test_alllimited(self):
+        _ = AllLimited(self.value, alo=[])
+        self.assertNotRendered()
+
+    def test_alllen(self):
+        _ = AllLen(self.value, alen=2)
+        self.assertNotRendered()
+
+    def test_allhave(self):
+        _ = AllHave(self.value, attrs='append')
+        self.assertNotRendered()
+
+    def test_allnonempty(self):
+        _ = AllNonEmpty(self.value)
+        self.assertNotRendered()
+
+    def test_allcontain(self):
+        _ = AllContain(self.value, asome=(1, 3))
+        self.assertNotRendered()
+
+    def test_limitedtuple(self):
+        _ = LimitedTuple((self.value,), limits=(([], ...),))
+        self.assertNotRendered()
+
+    def test_failing_check_renders_value_once(self):
+        err_msg = ('Value 3 of Loud [3, 4] at index 0 lies '
+                   'outside the allowed interval [4, inf)!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = AllLimited(self.value[1], alo=4)
+        self.assertEqual(str(err.exception), err_msg)
+        self.assertEqual(self.value[1].renders, 1)
+
+
+if __name__ == '__main__':
+    ut.main()
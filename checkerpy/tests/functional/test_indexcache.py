@@ -0,0 +1,96 @@
+import unittest as ut
+from threading import Thread
+from ...functional.indexcache import IndexCache, index_of, MIN_SIZE
+
+
+class TestIndexOf(ut.TestCase):
+
+    def test_indexes_tuples_and_lists(self):
+        for items in (tuple(range(MIN_SIZE)), list(range(MIN_SIZE))):
+            with self.subTest(items=type(items)):
+                index = index_of(items)
+                self.assertIsInstance(index, frozenset)
+                self.assertSetEqual(index, set(items))
+
+    def test_none_for_few_items(self):
+        self.assertIsNone(index_of(tuple(range(MIN_SIZE - 1))))
+        self.assertIsNotNone(index_of(tuple(range(3)), min_size=3))
+
+    def test_none_for_other_types(self):
+        for items in ('a' * MIN_SIZE, set(range(MIN_SIZE)),
+                      dict.fromkeys(range(MIN_SIZE)), range(MIN_SIZE)):
+            with self.subTest(items=type(items)):
+                self.assertIsNone(index_of(items))
+
+    def test_none_for_unhashable_items(self):
+        items = [[i] for i in range(MIN_SIZE)]
+        self.assertIsNone(index_of(items))
+
+
+class TestIndexCache(ut.TestCase):
+
+    def setUp(self):
+        self.items = tuple(range(MIN_SIZE))
+
+    def test_has_maxsize(self):
+        self.assertEqual(IndexCache().maxsize, 64)
+        self.assertEqual(IndexCache(3).maxsize, 3)
+
+    def test_index_is_built_once_per_tuple(self):
+        cache = IndexCache()
+        index = cache.index(self.items)
+        self.assertSetEqual(index, set(self.items))
+        self.assertIs(cache.index(self.items), index)
+        self.assertEqual(len(cache), 1)
+
+    def test_equal_tuples_are_not_the_same(self):
+        cache = IndexCache()
+        _ = cache.index(self.items)
+        _ = cache.index(tuple(range(MIN_SIZE)))
+        self.assertEqual(len(cache), 2)
+
+    def test_unhashable_tuples_are_remembered(self):
+        cache = IndexCache()
+        items = tuple([i] for i in range(MIN_SIZE))
+        self.assertIsNone(cache.index(items))
+        self.assertEqual(len(cache), 1)
+
+    def test_other_types_and_short_tuples_are_not_cached(self):
+        cache = IndexCache()
+        self.assertIsNone(cache.index(list(self.items)))
+        self.assertIsNone(cache.index((1, 2, 3)))
+        self.assertEqual(len(cache), 0)
+
+    def test_oldest_entry_is_evicted(self):
+        cache = IndexCache(2)
+        first, second, third = (tuple(range(i, i + MIN_SIZE))
+                                for i in range(3))
+        for items in (first, second, third):
+            _ = cache.index(items)
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn(id(first), cache)
+        self.assertIn(id(third), cache)
+
+    def test_zero_maxsize_caches_nothing(self):
+        cache = IndexCache(0)
+        self.assertIsNotNone(cache.index(self.items))
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_lookups_stay_within_maxsize(self):
+        cache = IndexCache(4)
+        tuples = [tuple(range(i, i + MIN_SIZE)) for i in range(20)]
+
+        def look_up():
+            for _ in range(50):
+                for items in tuples:
+                    self.assertSetEqual(cache.index(items), set(items))
+        threads = [Thread(target=look_up) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(len(cache), 4)
+
+
+if __name__ == '__main__':
+    ut.main()
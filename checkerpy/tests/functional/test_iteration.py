@@ -0,0 +1,199 @@
+import logging
+import tracemalloc
+import unittest as ut
+from collections import deque
+from ...functional.context import Context
+from ...functional.iteration import check_all
+from ...types.all import AllInt
+from ...validators.all import AllLimited
+from ...exceptions import IterError, WrongTypeError, LimitError
+
+
+class Recorder:
+
+    def __init__(self, fail_at=None):
+        self.calls = []
+        self.fail_at = fail_at
+
+    def __call__(self, context, index, element, *args):
+        self.calls.append((index, element, args))
+        if element == self.fail_at:
+            raise ValueError(f'Failed at {element}!')
+
+
+class TestCheckAll(ut.TestCase):
+
+    def test_returns_iterable(self):
+        iterable = [1, 2, 3]
+        self.assertIs(check_all(Context(iterable), Recorder()), iterable)
+
+    def test_passes_indices_of_sequences(self):
+        check = Recorder()
+        _ = check_all(Context((4, 5)), check)
+        self.assertListEqual(check.calls, [(0, 4, ()), (1, 5, ())])
+
+    def test_passes_indices_of_deques(self):
+        check = Recorder()
+        _ = check_all(Context(deque([4, 5])), check)
+        self.assertListEqual(check.calls, [(0, 4, ()), (1, 5, ())])
+
+    def test_passes_no_indices_for_sets(self):
+        check = Recorder()
+        _ = check_all(Context({4}), check)
+        self.assertListEqual(check.calls, [(-1, 4, ())])
+
+    def test_passes_args(self):
+        check = Recorder()
+        _ = check_all(Context([4]), check, 'foo', 'bar')
+        self.assertListEqual(check.calls, [(0, 4, ('foo', 'bar'))])
+
+    def test_stops_at_first_failure(self):
+        check = Recorder(fail_at=2)
+        with self.assertRaises(ValueError):
+            _ = check_all(Context([1, 2, 3, 4]), check)
+        self.assertEqual(len(check.calls), 2)
+
+    def test_error_on_not_iterable(self):
+        err_msg = ('Variable 3 with type int does not seem to'
+                   ' be an iterable with elements to inspect!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(IterError) as err:
+                _ = check_all(Context(3), Recorder())
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_does_not_consume_iterators(self):
+        iterator = iter([1, 2, 3])
+        check = Recorder()
+        _ = check_all(Context(iterator), check)
+        self.assertListEqual(check.calls, [])
+        self.assertEqual(next(iterator), 1)
+
+    def test_returns_checking_iterator_for_iterators(self):
+        check = Recorder()
+        checked = check_all(Context(x for x in (4, 5)), check)
+        self.assertEqual(next(checked), 4)
+        self.assertListEqual(check.calls, [(0, 4, ())])
+        self.assertListEqual(list(checked), [5])
+        self.assertListEqual(check.calls, [(0, 4, ()), (1, 5, ())])
+
+    def test_checking_iterator_raises_on_failing_element(self):
+        checked = check_all(Context(iter([1, 2, 3])), Recorder(fail_at=2))
+        self.assertEqual(next(checked), 1)
+        with self.assertRaises(ValueError):
+            _ = next(checked)
+
+
+class TestCheckSample(ut.TestCase):
+
+    def test_checks_evenly_spaced_elements(self):
+        check = Recorder()
+        _ = check_all(Context(list(range(10))), check, sample=4)
+        indices = [index for index, _, _ in check.calls]
+        self.assertListEqual(indices, [0, 3, 6, 9])
+
+    def test_always_checks_first_and_last_elements(self):
+        for seed in (None, 0, 1, 'foo'):
+            for sample in (2, 3, 7):
+                with self.subTest(seed=seed, sample=sample):
+                    check = Recorder()
+                    _ = check_all(Context(list(range(100))), check,
+                                  sample=sample, seed=seed)
+                    indices = [index for index, _, _ in check.calls]
+                    self.assertEqual(len(indices), sample)
+                    self.assertEqual(indices[0], 0)
+                    self.assertEqual(indices[-1], 99)
+
+    def test_seeded_samples_are_reproducible(self):
+        first, second = Recorder(), Recorder()
+        _ = check_all(Context(range(1000)), first, sample=10, seed=42)
+        _ = check_all(Context(range(1000)), second, sample=10, seed=42)
+        self.assertListEqual(first.calls, second.calls)
+
+    def test_passes_indexed_elements_and_args(self):
+        check = Recorder()
+        _ = check_all(Context('abcde'), check, 'foo', sample=2)
+        self.assertListEqual(check.calls, [(0, 'a', ('foo',)),
+                                           (4, 'e', ('foo',))])
+
+    def test_returns_sequence(self):
+        sequence = list(range(10))
+        checked = check_all(Context(sequence), Recorder(), sample=2)
+        self.assertIs(checked, sequence)
+
+    def test_checks_all_elements_of_short_sequences(self):
+        check = Recorder()
+        _ = check_all(Context([1, 2, 3]), check, sample=3)
+        self.assertEqual(len(check.calls), 3)
+
+    def test_checks_all_elements_of_non_sequences(self):
+        check = Recorder()
+        _ = check_all(Context(set(range(10))), check, sample=2)
+        self.assertEqual(len(check.calls), 10)
+
+    def test_checks_all_elements_of_iterators(self):
+        check = Recorder()
+        _ = list(check_all(Context(iter(range(10))), check, sample=2))
+        self.assertEqual(len(check.calls), 10)
+
+    def test_logs_number_of_verified_elements(self):
+        with self.assertLogs(level=logging.DEBUG) as log:
+            _ = check_all(Context(range(10), 'test'), Recorder(), sample=3)
+        self.assertIn('Verified 3 of 10 elements of test.', log.output[0])
+
+    def test_accepted_samples_are_not_checked(self):
+        check, accepted = Recorder(), []
+        _ = check_all(Context(list(range(10))), check, sample=3,
+                      accept=lambda elements: accepted.extend(elements) or 1)
+        self.assertListEqual(accepted, [0, 4, 9])
+        self.assertListEqual(check.calls, [])
+
+    def test_rejected_samples_are_checked(self):
+        check = Recorder()
+        _ = check_all(Context(list(range(10))), check, sample=3,
+                      accept=lambda elements: False)
+        self.assertEqual(len(check.calls), 3)
+
+    def test_error_on_invalid_sample_size(self):
+        for sample in (1, 0, -3, 2.0, '2', True):
+            with self.subTest(sample=sample):
+                err_msg = f'Sample size must be an integer > 1, not {sample}!'
+                with self.assertLogs(level=logging.ERROR):
+                    with self.assertRaises(ValueError) as err:
+                        _ = check_all(Context([1]), Recorder(), sample=sample)
+                self.assertEqual(str(err.exception), err_msg)
+
+    def test_cost_does_not_grow_with_input_size(self):
+        check = Recorder()
+        _ = check_all(Context(range(10 ** 15)), check, sample=5)
+        self.assertEqual(len(check.calls), 5)
+
+
+class TestStreamingInCheckers(ut.TestCase):
+
+    def test_all_checks_generators_lazily(self):
+        checked = AllInt((x for x in (1, 2.0)), 'test')
+        self.assertEqual(next(checked), 1)
+        err_msg = ('Type of element 1 in generator test'
+                   ' must be int, not float like 2.0!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = next(checked)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_all_limited_checks_map_objects_lazily(self):
+        checked = AllLimited(map(int, '1293'), alo=0, ahi=5)
+        self.assertListEqual([next(checked), next(checked)], [1, 2])
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = next(checked)
+
+    def test_peak_memory_does_not_grow_with_input_size(self):
+        tracemalloc.start()
+        _ = AllInt(range(100_000))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(peak, 100_000)
+
+
+if __name__ == '__main__':
+    ut.main()
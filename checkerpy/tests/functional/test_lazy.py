@@ -0,0 +1,140 @@
+import unittest as ut
+from ...functional import CompositionOf
+from ...functional.lazy import LazyComposition
+from ...types.one import JustInt, JustList
+from ...types.all import All
+from ...validators.one import Limited
+
+
+def identity(value, name=None, **kwargs):
+    return value
+
+
+class Second:
+    lower = 'foo'
+    Upper = staticmethod(identity)
+    UPPER_CONSTANT = 1
+
+    def __call__(self, value, name=None, **kwargs):
+        return value
+
+    def method(self):
+        return 'bar'
+
+
+class TestLazyCompositionOnClass(ut.TestCase):
+
+    def setUp(self):
+
+        class Owner:
+            def __new__(cls, value, name=None, **kwargs):
+                return value
+
+        Owner.JustInt = LazyComposition(JustInt)
+        self.Owner = Owner
+
+    def test_is_not_composed_before_access(self):
+        self.assertIsInstance(self.Owner.__dict__['JustInt'], LazyComposition)
+
+    def test_returns_composition(self):
+        self.assertIsInstance(self.Owner.JustInt, CompositionOf)
+
+    def test_caches_composition_on_class(self):
+        composition = self.Owner.JustInt
+        self.assertIs(self.Owner.__dict__['JustInt'], composition)
+        self.assertIs(self.Owner.JustInt, composition)
+
+    def test_composition_works(self):
+        self.assertEqual(self.Owner.JustInt(1), 1)
+
+
+class TestLazyCompositionOnInstances(ut.TestCase):
+
+    def setUp(self):
+
+        class Owner:
+            def __call__(self, value, name=None, **kwargs):
+                return value
+
+        Owner.JustInt = LazyComposition(JustInt, per_instance=True)
+        self.Owner = Owner
+
+    def test_error_on_access_through_class(self):
+        with self.assertRaises(AttributeError):
+            _ = self.Owner.JustInt
+
+    def test_returns_composition(self):
+        self.assertIsInstance(self.Owner().JustInt, CompositionOf)
+
+    def test_caches_composition_on_instance(self):
+        owner = self.Owner()
+        composition = owner.JustInt
+        self.assertIs(owner.__dict__['JustInt'], composition)
+        self.assertIs(owner.JustInt, composition)
+
+    def test_instances_get_their_own_composition(self):
+        self.assertIsNot(self.Owner().JustInt, self.Owner().JustInt)
+
+
+class TestLazyCompositionAttributes(ut.TestCase):
+
+    def setUp(self):
+        self.composition = CompositionOf(identity, Second())
+
+    def test_forwards_lowercase_non_callable(self):
+        self.assertEqual(self.composition.lower, 'foo')
+
+    def test_composes_uppercase_callable(self):
+        self.assertIsInstance(self.composition.Upper, CompositionOf)
+
+    def test_caches_uppercase_callable(self):
+        self.assertIs(self.composition.Upper, self.composition.Upper)
+
+    def test_does_not_forward_lowercase_callable(self):
+        with self.assertRaises(AttributeError):
+            _ = self.composition.method
+
+    def test_does_not_forward_uppercase_non_callable(self):
+        with self.assertRaises(AttributeError):
+            _ = self.composition.UPPER_CONSTANT
+
+    def test_does_not_forward_private(self):
+        with self.assertRaises(AttributeError):
+            _ = self.composition._Second__private
+
+    def test_error_on_missing_attribute(self):
+        err_msg = "'CompositionOf' object has no attribute 'missing'"
+        with self.assertRaises(AttributeError) as err:
+            _ = self.composition.missing
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_dir_contains_forwarded_attributes(self):
+        attributes = dir(self.composition)
+        self.assertIn('lower', attributes)
+        self.assertIn('Upper', attributes)
+        self.assertNotIn('method', attributes)
+        self.assertNotIn('UPPER_CONSTANT', attributes)
+
+
+class TestLazyCompositionInPackage(ut.TestCase):
+
+    def test_registrar_attributes_work(self):
+        self.assertEqual(Limited.JustInt(2, lo=1), 2)
+
+    def test_all_attributes_work(self):
+        self.assertListEqual(All(int).JustList([1]), [1])
+
+    def test_all_attributes_not_on_class(self):
+        self.assertFalse(hasattr(All, 'JustList'))
+
+    def test_compositions_forward_types(self):
+        self.assertTupleEqual(All(int).JustList.types, (list,))
+
+    def test_nested_compositions_work(self):
+        composition = CompositionOf(identity, Limited).JustList
+        self.assertListEqual(composition([1]), [1])
+        self.assertTupleEqual(JustList.types, composition.types)
+
+
+if __name__ == '__main__':
+    ut.main()
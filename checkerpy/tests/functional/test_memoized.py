@@ -0,0 +1,203 @@
+import logging
+import unittest as ut
+from threading import Thread
+from ...functional.memoized import Memoized, VerdictCache, frozen
+from ...types.all import AllInt, TypedTuple
+from ...validators.all import LimitedTuple, AllLimited
+from ...validators.one import OneOf
+from ...decorators import Typed, Bounded
+from ...exceptions import WrongTypeError, LimitError
+
+
+class CountingCheck:
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value, name=None, **kwargs):
+        self.calls += 1
+        return value
+
+
+class TestFrozen(ut.TestCase):
+
+    def test_immutable_values(self):
+        for value in ('a', b'a', 1, 1.0, 1j, True, None, ..., range(3),
+                      (), (1, 'a'), frozenset({1, 2}), ((1,), (2, (3,))),
+                      frozenset({(1, 2)})):
+            with self.subTest(value=value):
+                self.assertTrue(frozen(value))
+
+    def test_mutable_values(self):
+        for value in ([], {}, set(), bytearray(), (1, []), ((1,), ({},)),
+                      ((1, bytearray()),)):
+            with self.subTest(value=value):
+                self.assertFalse(frozen(value))
+
+    def test_subclasses_are_not_frozen(self):
+        class Tuple(tuple):
+            pass
+        self.assertFalse(frozen(Tuple((1, 2))))
+        self.assertFalse(frozen((1, Tuple())))
+
+
+class TestVerdictCache(ut.TestCase):
+
+    def test_has_maxsize(self):
+        self.assertEqual(VerdictCache().maxsize, 2 ** 20)
+        self.assertEqual(VerdictCache(10).maxsize, 10)
+
+    def test_remembers_immutable_values(self):
+        cache = VerdictCache()
+        value = (1, 2, 3)
+        self.assertFalse(cache.passed(value))
+        self.assertTrue(cache.add(value))
+        self.assertTrue(cache.passed(value))
+        self.assertEqual(cache.size, 4)
+
+    def test_does_not_remember_mutable_values(self):
+        cache = VerdictCache()
+        value = (1, [2])
+        self.assertFalse(cache.add(value))
+        self.assertFalse(cache.passed(value))
+
+    def test_equal_values_are_not_the_same(self):
+        cache = VerdictCache()
+        _ = cache.add(tuple(range(10)))
+        self.assertFalse(cache.passed(tuple(range(10))))
+
+    def test_remembered_values_are_kept_alive(self):
+        cache = VerdictCache()
+        _ = cache.add(tuple(range(10)))
+        values = [tuple(range(10, 20)) for _ in range(100)]
+        for value in values:
+            self.assertFalse(cache.passed(value))
+
+    def test_size_aware_eviction(self):
+        cache = VerdictCache(10)
+        first, second, third = (1, 2, 3), (4, 5, 6), (7, 8, 9)
+        for value in (first, second):
+            _ = cache.add(value)
+        self.assertTrue(cache.passed(first))
+        _ = cache.add(third)
+        self.assertTrue(cache.passed(first))
+        self.assertFalse(cache.passed(second))
+        self.assertTrue(cache.passed(third))
+        self.assertEqual(cache.size, 8)
+
+    def test_values_larger_than_maxsize_are_not_remembered(self):
+        cache = VerdictCache(10)
+        self.assertFalse(cache.add(tuple(range(10))))
+        self.assertEqual(len(cache), 0)
+
+    def test_adding_twice_counts_once(self):
+        cache = VerdictCache()
+        value = (1, 2)
+        _ = cache.add(value)
+        _ = cache.add(value)
+        self.assertEqual(cache.size, 3)
+
+    def test_concurrent_adds_stay_within_maxsize(self):
+        cache = VerdictCache(50)
+
+        def add():
+            for i in range(1000):
+                _ = cache.add((i, i + 1))
+        threads = [Thread(target=add) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLessEqual(cache.size, 50)
+        self.assertEqual(cache.size, 3 * len(cache))
+
+
+class TestMemoized(ut.TestCase):
+
+    def test_has_attributes(self):
+        memoized = Memoized(AllInt, 100)
+        self.assertIs(memoized.checker, AllInt)
+        self.assertEqual(memoized.maxsize, 100)
+        self.assertEqual(memoized.__name__, 'AllInt')
+
+    def test_checks_same_immutable_value_only_once(self):
+        check = CountingCheck()
+        memoized = Memoized(check)
+        value = tuple(range(100))
+        for _ in range(3):
+            self.assertIs(memoized(value, 'test'), value)
+        self.assertEqual(check.calls, 1)
+
+    def test_checks_mutable_values_every_time(self):
+        check = CountingCheck()
+        memoized = Memoized(check)
+        for value in ([1, 2], [1, 2], (1, [2]), (1, [2])):
+            _ = memoized(value)
+        self.assertEqual(check.calls, 4)
+
+    def test_checks_equal_values_that_are_not_the_same(self):
+        check = CountingCheck()
+        memoized = Memoized(check)
+        _ = memoized(tuple(range(100)))
+        _ = memoized(tuple(range(100)))
+        self.assertEqual(check.calls, 2)
+
+    def test_does_not_remember_checks_with_keywords(self):
+        check = CountingCheck()
+        memoized = Memoized(check)
+        value = tuple(range(100))
+        _ = memoized(value, sample=2)
+        _ = memoized(value, sample=2)
+        self.assertEqual(check.calls, 2)
+        _ = memoized(value)
+        _ = memoized(value, sample=2)
+        self.assertEqual(check.calls, 4)
+
+    def test_checks_remembered_value_against_new_spec(self):
+        memoized = Memoized(AllLimited)
+        value = (1, 2, 3)
+        self.assertIs(memoized(value), value)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = memoized(value, alo=100)
+
+    def test_does_not_remember_failures(self):
+        memoized = Memoized(AllInt)
+        value = (1, 'a')
+        for _ in range(2):
+            with self.assertLogs(level=logging.ERROR):
+                with self.assertRaises(WrongTypeError):
+                    _ = memoized(value, 'test')
+
+    def test_works_with_checkers_of_immutable_values(self):
+        self.assertEqual(Memoized(TypedTuple)((1, 'a'), types=(int, str)),
+                         (1, 'a'))
+        self.assertEqual(Memoized(LimitedTuple)((1, 2), limits=((0, 1),
+                                                                (1, 2))),
+                         (1, 2))
+        self.assertEqual(Memoized(OneOf)('a', items=('a', 'b')), 'a')
+
+    def test_works_as_type_spec(self):
+        @Typed(Memoized([int]), Memoized((int, ...)))
+        def f(x, y):
+            return x, y
+        value = (1, 2)
+        self.assertTupleEqual(f([1], value), ([1], value))
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f([1], (1, 'a'))
+
+    def test_works_as_limits_spec(self):
+        @Bounded(Memoized(((0, 1), ...)))
+        def f(x):
+            return x
+        value = (0, 1)
+        self.assertIs(f(value), value)
+        self.assertIs(f(value), value)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = f((0, 2))
+
+
+if __name__ == '__main__':
+    ut.main()
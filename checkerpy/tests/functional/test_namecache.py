@@ -0,0 +1,62 @@
+import unittest as ut
+from ...functional.namecache import NameCache
+
+
+class TestNameCache(ut.TestCase):
+
+    def test_has_default_maxsize(self):
+        cache = NameCache()
+        self.assertEqual(cache.maxsize, 4096)
+
+    def test_maxsize_can_be_set(self):
+        cache = NameCache(3)
+        self.assertEqual(cache.maxsize, 3)
+
+    def test_knows_nothing_when_empty(self):
+        cache = NameCache()
+        self.assertFalse(cache.knows(['foo']))
+
+    def test_knows_empty_iterable(self):
+        cache = NameCache()
+        self.assertTrue(cache.knows([]))
+
+    def test_knows_added_names(self):
+        cache = NameCache()
+        cache.add(['foo', 'bar'])
+        self.assertTrue(cache.knows(('bar', 'foo', 'bar')))
+        self.assertFalse(cache.knows(('bar', 'baz')))
+
+    def test_does_not_know_unhashable(self):
+        cache = NameCache()
+        cache.add(['foo'])
+        self.assertFalse(cache.knows(['foo', ['bar']]))
+
+    def test_adds_every_name_once(self):
+        cache = NameCache()
+        cache.add(['foo', 'bar', 'foo'])
+        self.assertListEqual(list(cache), ['foo', 'bar'])
+
+    def test_skips_anything_but_strings(self):
+        cache = NameCache()
+        cache.add(['foo', 1, b'bar'])
+        self.assertListEqual(list(cache), ['foo'])
+
+    def test_interns_names(self):
+        cache = NameCache()
+        name = ''.join(['f', 'oo', 'bar'])
+        cache.add([name])
+        self.assertIs(next(iter(cache)), 'foobar')
+
+    def test_evicts_oldest_names_when_full(self):
+        cache = NameCache(2)
+        cache.add(['foo', 'bar', 'baz'])
+        self.assertListEqual(list(cache), ['bar', 'baz'])
+
+    def test_caches_nothing_if_maxsize_zero(self):
+        cache = NameCache(0)
+        cache.add(['foo'])
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    ut.main()
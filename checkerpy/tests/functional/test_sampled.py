@@ -0,0 +1,69 @@
+import logging
+import unittest as ut
+from ...functional.sampled import Sampled
+from ...types.all import AllInt
+from ...validators.all import AllLimited, AllLen, AllHave
+from ...exceptions import WrongTypeError, LimitError
+
+
+class TestSampled(ut.TestCase):
+
+    def test_has_attributes(self):
+        sampled = Sampled(AllInt, 10, seed=3)
+        self.assertIs(sampled.checker, AllInt)
+        self.assertEqual(sampled.k, 10)
+        self.assertEqual(sampled.seed, 3)
+
+    def test_has_name_of_checker(self):
+        self.assertEqual(Sampled(AllLimited, 2).__name__, 'AllLimited')
+
+    def test_seed_defaults_to_none(self):
+        self.assertIsNone(Sampled(AllInt, 2).seed)
+
+    def test_returns_value(self):
+        value = [1, 2, 3]
+        self.assertIs(Sampled(AllInt, 2)(value, 'test'), value)
+
+    def test_name_is_optional(self):
+        self.assertListEqual(Sampled(AllInt, 2)([1, 2, 3]), [1, 2, 3])
+
+    def test_checks_first_and_last_elements_only(self):
+        values = [1] + ['a'] * 100 + [2]
+        self.assertIs(Sampled(AllInt, 2)(values), values)
+        self.assertIs(Sampled(AllInt, 2, seed=1)(values), values)
+
+    def test_error_on_failing_first_element(self):
+        err_msg = ('Type of element 0 in list test must'
+                   ' be int, not str like a!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = Sampled(AllInt, 2)(['a', 1, 1, 1], 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_failing_last_element(self):
+        err_msg = ('Value 9 of list test at index 3 lies outside'
+                   ' the allowed interval (-inf, 5]!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = Sampled(AllLimited, 2)([1, 2, 3, 9], 'test', ahi=5)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_passes_kwargs_through_to_checker(self):
+        values = ['ab', 'abc', 'cd']
+        self.assertIs(Sampled(AllLen, 2)(values, alen=2), values)
+
+    def test_overrides_sample_kwargs(self):
+        values = [1, 'a', 1]
+        self.assertIs(Sampled(AllHave, 2)(values, attrs='real',
+                                          sample=None), values)
+
+    def test_error_on_invalid_k(self):
+        err_msg = 'Sample size must be an integer > 1, not 1!'
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ValueError) as err:
+                _ = Sampled(AllInt, 1)
+        self.assertEqual(str(err.exception), err_msg)
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -0,0 +1,60 @@
+import gc
+import weakref
+import unittest as ut
+from ...functional.typecache import TypeCache
+
+
+class TestTypeCache(ut.TestCase):
+
+    def test_has_default_maxsize(self):
+        cache = TypeCache()
+        self.assertEqual(cache.maxsize, 256)
+
+    def test_maxsize_can_be_set(self):
+        cache = TypeCache(3)
+        self.assertEqual(cache.maxsize, 3)
+
+    def test_add_returns_result(self):
+        cache = TypeCache()
+        self.assertEqual(cache.add(int, 'foo'), 'foo')
+
+    def test_result_is_stored_under_id_of_type(self):
+        cache = TypeCache()
+        _ = cache.add(int, 'foo')
+        self.assertEqual(cache[id(int)], 'foo')
+
+    def test_add_overwrites_result(self):
+        cache = TypeCache()
+        _ = cache.add(int, 'foo')
+        _ = cache.add(int, 'bar')
+        self.assertEqual(cache[id(int)], 'bar')
+        self.assertEqual(len(cache), 1)
+
+    def test_evicts_oldest_entry_when_full(self):
+        cache = TypeCache(2)
+        _ = cache.add(int, 1)
+        _ = cache.add(float, 2)
+        _ = cache.add(str, 3)
+        self.assertDictEqual(cache, {id(float): 2, id(str): 3})
+
+    def test_evicts_entry_when_type_is_collected(self):
+        cache = TypeCache()
+        Dynamic = type('Dynamic', (), {})
+        _ = cache.add(Dynamic, 1)
+        self.assertEqual(len(cache), 1)
+        del Dynamic
+        gc.collect()
+        self.assertEqual(len(cache), 0)
+
+    def test_does_not_keep_type_alive(self):
+        cache = TypeCache()
+        Dynamic = type('Dynamic', (), {})
+        _ = cache.add(Dynamic, 1)
+        reference = weakref.ref(Dynamic)
+        del Dynamic
+        gc.collect()
+        self.assertIsNone(reference())
+
+
+if __name__ == '__main__':
+    ut.main()
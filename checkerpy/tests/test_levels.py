@@ -0,0 +1,228 @@
+import os
+import logging
+import unittest as ut
+from unittest.mock import patch
+from ..levels import Level, Levels, LEVELS, set_level, get_level, valid
+from ..levels import from_environment
+from ..decorators import Typed, Bounded
+from ..types.one import JustInt
+from ..types.all import AllInt
+from ..validators.one import Limited, JustLen
+from ..validators.all import AllLimited, AllIdentifier
+from ..exceptions import WrongTypeError, LimitError
+
+
+class TestValid(ut.TestCase):
+
+    def test_works_with_levels(self):
+        for level in Level:
+            with self.subTest(level=level):
+                self.assertIs(valid(level), level)
+
+    def test_works_with_values(self):
+        self.assertIs(valid(0), Level.OFF)
+        self.assertIs(valid(3), Level.FULL)
+
+    def test_works_with_names(self):
+        self.assertIs(valid('off'), Level.OFF)
+        self.assertIs(valid(' Boundary '), Level.BOUNDARY)
+        self.assertIs(valid('SAMPLED'), Level.SAMPLED)
+
+    def test_error_on_invalid_level(self):
+        err_msg = ('Validation level must be one of off, boundary,'
+                   ' sampled, full, not foo!')
+        for level in ('foo', 4, None, 1.5):
+            with self.subTest(level=level):
+                with self.assertLogs(level=logging.ERROR):
+                    with self.assertRaises(ValueError) as err:
+                        _ = valid(level)
+                msg = err_msg.replace('foo', str(level))
+                self.assertEqual(str(err.exception), msg)
+
+
+class TestLevels(ut.TestCase):
+
+    def setUp(self):
+        self.levels = Levels(Level.FULL)
+
+    def test_global_level_applies_to_all_modules(self):
+        self.levels.set('sampled')
+        self.assertIs(self.levels.of(), Level.SAMPLED)
+        self.assertIs(self.levels['foo.bar'], Level.SAMPLED)
+
+    def test_prefix_applies_to_package_and_submodules(self):
+        self.levels.set('off', 'foo')
+        self.assertIs(self.levels['foo'], Level.OFF)
+        self.assertIs(self.levels['foo.bar.baz'], Level.OFF)
+        self.assertIs(self.levels['foobar'], Level.FULL)
+        self.assertIs(self.levels.of(), Level.FULL)
+
+    def test_longest_prefix_wins(self):
+        self.levels.set('off', 'foo')
+        self.levels.set('boundary', 'foo.bar')
+        self.assertIs(self.levels['foo.bar.baz'], Level.BOUNDARY)
+        self.assertIs(self.levels['foo.baz'], Level.OFF)
+
+    def test_known_modules_are_updated(self):
+        self.assertIs(self.levels['foo.bar'], Level.FULL)
+        self.levels.set('off', 'foo')
+        self.assertIs(self.levels['foo.bar'], Level.OFF)
+        self.levels.set(None, 'foo')
+        self.assertIs(self.levels['foo.bar'], Level.FULL)
+
+    def test_off_only_if_off_everywhere(self):
+        self.assertFalse(self.levels.off)
+        self.levels.set('off')
+        self.assertTrue(self.levels.off)
+        self.levels.set('full', 'foo')
+        self.assertFalse(self.levels.off)
+        self.levels.set('off', 'foo')
+        self.assertTrue(self.levels.off)
+
+    def test_error_on_invalid_level_leaves_levels_untouched(self):
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ValueError):
+                self.levels.set('foo', 'bar')
+        self.assertIs(self.levels['bar'], Level.FULL)
+
+
+class TestFromEnvironment(ut.TestCase):
+
+    def test_defaults_to_full(self):
+        with patch.dict(os.environ, clear=True):
+            levels = from_environment()
+        self.assertIs(levels.of(), Level.FULL)
+        self.assertFalse(levels.off)
+
+    def test_reads_global_level(self):
+        with patch.dict(os.environ, {'CHECKERPY_LEVEL': 'off'}):
+            levels = from_environment()
+        self.assertIs(levels.of(), Level.OFF)
+        self.assertTrue(levels.off)
+
+    def test_reads_prefix_levels(self):
+        value = 'sampled, foo=off ,foo.bar=boundary'
+        with patch.dict(os.environ, {'CHECKERPY_LEVEL': value}):
+            levels = from_environment()
+        self.assertIs(levels.of(), Level.SAMPLED)
+        self.assertIs(levels['foo.baz'], Level.OFF)
+        self.assertIs(levels['foo.bar'], Level.BOUNDARY)
+
+    def test_error_on_invalid_level(self):
+        with patch.dict(os.environ, {'CHECKERPY_LEVEL': 'foo=bar'}):
+            with self.assertLogs(level=logging.ERROR):
+                with self.assertRaises(ValueError):
+                    _ = from_environment()
+
+
+class LevelsTestCase(ut.TestCase):
+
+    def setUp(self):
+        self.default = get_level()
+
+    def tearDown(self):
+        set_level(None, __name__)
+        set_level(self.default)
+
+
+class TestDecoratedLevels(LevelsTestCase):
+
+    def test_functions_decorated_while_off_are_returned(self):
+        def f(x):
+            return x
+        set_level('off', __name__)
+        self.assertIs(Typed(int)(f), f)
+        self.assertIs(Bounded((0, 1))(f), f)
+
+    def test_functions_decorated_while_off_stay_unchecked(self):
+        set_level('off', __name__)
+
+        @Typed(int)
+        def f(x):
+            return x
+        set_level('full', __name__)
+        self.assertEqual(f('foo'), 'foo')
+
+    def test_checks_can_be_turned_off_after_decoration(self):
+        @Typed(int)
+        def f(x):
+            return x
+        set_level('off', __name__)
+        self.assertEqual(f('foo'), 'foo')
+        set_level('full', __name__)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f('foo')
+
+    def test_level_of_other_package_does_not_apply(self):
+        @Typed(int)
+        def f(x):
+            return x
+        set_level('off', __name__ + 'foo')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f('foo')
+
+    def test_boundary_checks_first_and_last_elements(self):
+        @Bounded([(0, 1)])
+        def f(x):
+            return x
+        set_level('boundary', __name__)
+        self.assertListEqual(f([0, 5, 1]), [0, 5, 1])
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = f([0, 0, 5])
+
+    def test_sampled_checks_sample_of_elements(self):
+        @Typed([int])
+        def f(x):
+            return x
+        set_level('sampled', __name__)
+        inputs = list(range(10_000))
+        inputs[1] = 'foo'
+        self.assertIs(f(inputs), inputs)
+        set_level('full', __name__)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f(inputs)
+
+    def test_boundary_still_checks_arguments(self):
+        @Typed(int, y=(str, ...))
+        def f(x, y):
+            return x, y
+        set_level('boundary', __name__)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f(1.0, y=('a',))
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = f(1, y=('a', 'b', 3))
+
+
+class TestCheckerLevels(LevelsTestCase):
+
+    def test_checkers_skip_checks_if_off_everywhere(self):
+        set_level('off')
+        self.assertTrue(LEVELS.off)
+        self.assertEqual(JustInt('foo'), 'foo')
+        self.assertEqual(Limited(5, lo=0, hi=1), 5)
+        self.assertListEqual(AllInt([1, 'foo']), [1, 'foo'])
+        self.assertListEqual(AllLimited([1, 5], ahi=1), [1, 5])
+        self.assertListEqual(JustLen([1], length=2), [1])
+        self.assertListEqual(JustLen.bind(length=2)([1]), [1])
+        self.assertListEqual(AllIdentifier(['1x']), ['1x'])
+
+    def test_checkers_check_if_on_anywhere(self):
+        set_level('off')
+        set_level('full', __name__)
+        self.assertFalse(LEVELS.off)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = JustInt('foo')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = AllLimited([1, 5], ahi=1)
+
+
+if __name__ == '__main__':
+    ut.main()
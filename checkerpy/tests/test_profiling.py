@@ -0,0 +1,256 @@
+import asyncio
+import logging
+import unittest as ut
+from threading import Thread
+from ..profiling import Registry, Record, Profiled, REGISTRY, profile, stats
+from ..profiling import OTHER
+from ..decorators import Typed, Bounded
+from ..functional.offloaded import Offloaded
+from ..types.one import JustInt
+from ..types.all import AllInt
+from ..exceptions import WrongTypeError, LimitError
+
+
+class TestRecord(ut.TestCase):
+
+    def test_starts_empty(self):
+        self.assertDictEqual(Record().as_dict(), {'calls': 0, 'failures': 0,
+                                                  'total_ns': 0, 'max_ns': 0})
+
+    def test_adds_up(self):
+        record = Record()
+        record.add(3, False)
+        record.add(5, True)
+        record.add(2, False)
+        self.assertDictEqual(record.as_dict(), {'calls': 3, 'failures': 1,
+                                                'total_ns': 10, 'max_ns': 5})
+
+
+class TestRegistry(ut.TestCase):
+
+    def test_starts_disabled(self):
+        self.assertFalse(Registry().enabled)
+
+    def test_has_maxsize(self):
+        self.assertEqual(Registry().maxsize, 1024)
+        self.assertEqual(Registry(3).maxsize, 3)
+
+    def test_enable_and_disable(self):
+        registry = Registry()
+        registry.enable()
+        self.assertTrue(registry.enabled)
+        registry.disable()
+        self.assertFalse(registry.enabled)
+
+    def test_enable_sets_maxsize(self):
+        registry = Registry()
+        registry.enable(5)
+        self.assertEqual(registry.maxsize, 5)
+        registry.enable()
+        self.assertEqual(registry.maxsize, 5)
+
+    def test_record_is_reused(self):
+        registry = Registry()
+        record = registry.record('f', 'x')
+        self.assertIs(registry.record('f', 'x'), record)
+        self.assertIsNot(registry.record('f', 'y'), record)
+
+    def test_memory_is_bounded(self):
+        registry = Registry(3)
+        records = [registry.record('f', str(i)) for i in range(10)]
+        self.assertIs(records[2], records[9])
+        snapshot = registry.snapshot()
+        self.assertEqual(sum(map(len, snapshot.values())), 3)
+        self.assertSetEqual(set(snapshot), {'f', OTHER})
+
+    def test_snapshot(self):
+        registry = Registry()
+        registry.record('f', 'x').add(2, False)
+        registry.record('f', 'y').add(3, True)
+        expected = {'f': {'x': {'calls': 1, 'failures': 0,
+                                'total_ns': 2, 'max_ns': 2},
+                          'y': {'calls': 1, 'failures': 1,
+                                'total_ns': 3, 'max_ns': 3}}}
+        self.assertDictEqual(registry.snapshot(), expected)
+        self.assertDictEqual(registry.snapshot(reset=True), expected)
+        self.assertDictEqual(registry.snapshot(), {})
+
+    def test_watched_tables_are_cleared_on_toggle(self):
+        class Tables(dict):
+            pass
+        registry = Registry()
+        tables = registry.watch(Tables({1: 2}))
+        registry.enable()
+        self.assertDictEqual(tables, {})
+        tables[1] = 2
+        registry.disable()
+        self.assertDictEqual(tables, {})
+
+    def test_watched_tables_are_cleared_on_reset(self):
+        class Tables(dict):
+            pass
+        registry = Registry()
+        tables = registry.watch(Tables({1: 2}))
+        _ = registry.snapshot()
+        self.assertDictEqual(tables, {1: 2})
+        _ = registry.snapshot(reset=True)
+        self.assertDictEqual(tables, {})
+
+    def test_concurrent_adds_are_not_lost(self):
+        record = Registry().record('f', 'x')
+
+        def add():
+            for _ in range(10_000):
+                record.add(1, False)
+        threads = [Thread(target=add) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(record.as_dict()['calls'], 40_000)
+
+
+class TestProfileDecorated(ut.TestCase):
+
+    def setUp(self):
+        profile()
+        _ = stats(reset=True)
+
+    def tearDown(self):
+        profile(False)
+        _ = stats(reset=True)
+
+    def site_of(self, function_name):
+        return f'{self.id()}.<locals>.{function_name}'
+
+    def test_records_calls_per_argument(self):
+        @Typed(int, y=str)
+        def f(x, y):
+            return x, y
+        for _ in range(3):
+            _ = f(1, y='a')
+        snapshot = stats()[self.site_of('f')]
+        self.assertSetEqual(set(snapshot), {'x', 'y'})
+        for argument in ('x', 'y'):
+            with self.subTest(argument=argument):
+                self.assertEqual(snapshot[argument]['calls'], 3)
+                self.assertEqual(snapshot[argument]['failures'], 0)
+                self.assertGreaterEqual(snapshot[argument]['total_ns'],
+                                        snapshot[argument]['max_ns'])
+                self.assertGreater(snapshot[argument]['max_ns'], 0)
+
+    def test_records_failures(self):
+        @Bounded((0, 1))
+        def f(x):
+            return x
+        _ = f(1)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = f(2)
+        snapshot = stats()[self.site_of('f')]['x']
+        self.assertEqual(snapshot['calls'], 2)
+        self.assertEqual(snapshot['failures'], 1)
+
+    def test_calls_after_reset_are_recorded(self):
+        @Typed(int)
+        def f(x):
+            return x
+        _ = f(1)
+        _ = f(2)
+        snapshot = stats(reset=True)
+        self.assertEqual(snapshot[self.site_of('f')]['x']['calls'], 2)
+        _ = f(3)
+        self.assertEqual(stats()[self.site_of('f')]['x']['calls'], 1)
+
+    def test_functions_decorated_before_are_profiled(self):
+        profile(False)
+
+        @Typed(int)
+        def f(x):
+            return x
+        _ = f(1)
+        self.assertDictEqual(stats(), {})
+        profile()
+        _ = f(1)
+        self.assertEqual(stats()[self.site_of('f')]['x']['calls'], 1)
+
+    def test_nothing_is_recorded_when_disabled(self):
+        @Typed(int)
+        def f(x):
+            return x
+        profile(False)
+        _ = f(1)
+        self.assertDictEqual(stats(), {})
+
+    def test_methods_are_recorded_under_qualified_name(self):
+        class Test:
+            @Typed(int)
+            def m(self, x):
+                return x
+        _ = Test().m(1)
+        self.assertIn(self.site_of('Test.m'), stats())
+
+    def test_records_star_args_as_a_whole(self):
+        @Typed(args=int)
+        def f(*args):
+            return args
+        _ = f(1, 2, 3)
+        self.assertEqual(stats()[self.site_of('f')]['args']['calls'], 1)
+
+    def test_records_yielded_items(self):
+        @Typed(yields=int)
+        def f():
+            yield from range(3)
+        _ = list(f())
+        self.assertEqual(stats()[self.site_of('f')]['yields']['calls'], 3)
+
+    def test_records_coroutines_and_offloaded_checks(self):
+        @Typed(Offloaded([int]), y=int)
+        async def f(x, y):
+            return x
+        _ = asyncio.run(f([1], y=2))
+        snapshot = stats()[self.site_of('f')]
+        self.assertEqual(snapshot['x']['calls'], 1)
+        self.assertEqual(snapshot['y']['calls'], 1)
+
+
+class TestProfiled(ut.TestCase):
+
+    def tearDown(self):
+        profile(False)
+        _ = stats(reset=True)
+
+    def test_has_attributes(self):
+        profiled = Profiled(AllInt, 'site')
+        self.assertIs(profiled.checker, AllInt)
+        self.assertEqual(profiled.site, 'site')
+        self.assertEqual(profiled.__name__, 'AllInt')
+
+    def test_site_defaults_to_name_of_checker(self):
+        self.assertEqual(Profiled(JustInt).site, 'JustInt')
+
+    def test_only_checks_when_disabled(self):
+        self.assertEqual(Profiled(JustInt)(1, 'x'), 1)
+        self.assertDictEqual(REGISTRY.snapshot(), {})
+
+    def test_records_calls_and_failures(self):
+        profile()
+        check = Profiled(JustInt, 'site')
+        self.assertEqual(check(1, 'x'), 1)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = check('a', 'x')
+        _ = check(2)
+        snapshot = stats()['site']
+        self.assertEqual(snapshot['x']['calls'], 2)
+        self.assertEqual(snapshot['x']['failures'], 1)
+        self.assertEqual(snapshot['None']['calls'], 1)
+
+    def test_passes_on_keywords(self):
+        profile()
+        check = Profiled(AllInt, 'site')
+        self.assertListEqual(check([1, 2, 3], 'x', sample=2), [1, 2, 3])
+
+
+if __name__ == '__main__':
+    ut.main()
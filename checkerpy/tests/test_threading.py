@@ -0,0 +1,94 @@
+import sys
+import logging
+import unittest as ut
+from threading import Thread, Barrier
+from ..types.one import JustInt
+from ..types.all import AllInt, TypedTuple
+from ..validators.one import Limited, JustLen, OneOf, Contains, Has
+from ..validators.all import AllLimited, AllLen, LimitedTuple
+
+N_THREADS = 8
+N_CALLS = 200
+
+
+class TestConcurrentErrorMessages(ut.TestCase):
+
+    def setUp(self):
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def assertOwnNameInAllMessages(self, check):
+        barrier = Barrier(N_THREADS)
+        wrong = []
+
+        def hammer(thread: int) -> None:
+            name = f'variable{thread}'
+            barrier.wait()
+            for _ in range(N_CALLS):
+                try:
+                    check(name)
+                except Exception as error:
+                    if name not in str(error):
+                        wrong.append(str(error))
+                else:
+                    wrong.append(f'{name} passed!')
+
+        threads = [Thread(target=hammer, args=(i,)) for i in range(N_THREADS)]
+        with self.assertLogs(level=logging.ERROR):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertListEqual(wrong, [])
+
+    def test_just(self):
+        self.assertOwnNameInAllMessages(lambda name: JustInt(1.0, name))
+
+    def test_all(self):
+        self.assertOwnNameInAllMessages(lambda name: AllInt([1.0], name))
+
+    def test_typedtuple(self):
+        def check(name):
+            return TypedTuple((1.0,), name, types=(int,))
+        self.assertOwnNameInAllMessages(check)
+
+    def test_limited(self):
+        self.assertOwnNameInAllMessages(lambda name: Limited(1, name, lo=2))
+
+    def test_justlen(self):
+        def check(name):
+            return JustLen([1], name, length=len(name))
+        self.assertOwnNameInAllMessages(check)
+
+    def test_oneof(self):
+        self.assertOwnNameInAllMessages(lambda name: OneOf(1, name, items=()))
+
+    def test_contains(self):
+        def check(name):
+            return Contains([], name, every=1)
+        self.assertOwnNameInAllMessages(check)
+
+    def test_has(self):
+        self.assertOwnNameInAllMessages(lambda name: Has(1, name, attr='foo'))
+
+    def test_alllimited(self):
+        def check(name):
+            return AllLimited([1], name, alo=2)
+        self.assertOwnNameInAllMessages(check)
+
+    def test_alllen(self):
+        def check(name):
+            return AllLen([[1]], name, alen=len(name))
+        self.assertOwnNameInAllMessages(check)
+
+    def test_limitedtuple(self):
+        def check(name):
+            return LimitedTuple((1,), name, limits=((2, 3),))
+        self.assertOwnNameInAllMessages(check)
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -668,6 +668,108 @@ class TestAllErrorTowTypes(ut.TestCase):
         self.assertEqual(log.output, log_msg)
 
 
+class TestAllSubclasses(ut.TestCase):
+
+    def test_attribute_subclasses_defaults_to_false(self):
+        AllInt = All(int)
+        self.assertFalse(AllInt.subclasses)
+
+    def test_has_attribute_subclasses_set(self):
+        AllInt = All(int, subclasses=True)
+        self.assertTrue(AllInt.subclasses)
+
+    def test_subclass_elements_fail_by_default(self):
+        AllInt = All(int)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = AllInt([1, True])
+
+    def test_subclass_elements_pass_with_subclasses(self):
+        AllInt = All(int, subclasses=True)
+        self.assertListEqual(AllInt([1, True]), [1, True])
+
+    def test_error_on_wrong_element_type_with_subclasses(self):
+        AllInt = All(int, subclasses=True)
+        err_msg = ('Type of element 1 in list test must be'
+                   ' int (or a subclass), not str like a!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = AllInt([1, 'a'], 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+
+class TestAllFastPath(ut.TestCase):
+
+    def test_returns_passing_containers(self):
+        AllInt = All(int)
+        for container in ([1, 2], (1, 2), {1, 2}, frozenset({1, 2}),
+                          deque([1, 2]), {1: 'a'}, OrderedDict({1: 'a'}),
+                          defaultdict(str, {1: 'a'}), {1: 'a'}.keys(),
+                          {'a': 1}.values()):
+            with self.subTest(container=container):
+                self.assertIs(AllInt(container), container)
+
+    def test_returns_passing_dict_items(self):
+        AllTuple = All(tuple)
+        items = {1: 2}.items()
+        self.assertIs(AllTuple(items), items)
+
+    def test_passes_empty_container(self):
+        AllInt = All(int)
+        self.assertListEqual(AllInt([]), [])
+
+    def test_error_reports_first_offender(self):
+        AllInt = All(int)
+        err_msg = ('Type of element 2 in list test must'
+                   ' be int, not float like 3.0!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = AllInt([1, 2, 3.0, 'a'], 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_reports_offending_key_in_dict(self):
+        AllInt = All(int)
+        err_msg = ('Type of key in dict test must'
+                   ' be int, not str like a!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = AllInt({1: 1, 'a': 2}, 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_subclasses_pass_after_fast_path_fails(self):
+        AllInt = All(int, subclasses=True)
+        self.assertListEqual(AllInt([1, True, 2]), [1, True, 2])
+
+
+class TestAllSample(ut.TestCase):
+
+    def test_sample_skips_unsampled_elements(self):
+        AllInt = All(int)
+        inputs = [1, 'a', 2.0, 3]
+        self.assertIs(AllInt(inputs, 'test', sample=2), inputs)
+
+    def test_error_on_sampled_element(self):
+        AllInt = All(int)
+        err_msg = ('Type of element 3 in tuple test must'
+                   ' be int, not float like 3.0!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = AllInt((1, 'a', 2, 3.0), 'test', sample=2, seed=1)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_sets_are_checked_in_full(self):
+        AllInt = All(int)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = AllInt({1, 'a', 2.0, 3}, 'test', sample=2)
+
+    def test_sample_is_passed_through_compositions(self):
+        AllInt = All(int)
+        inputs = [1, 'a', 2.0, 3]
+        self.assertIs(AllInt.JustList(inputs, sample=2), inputs)
+        self.assertIs(AllInt.NonEmpty(inputs, sample=2), inputs)
+
+
 class TestAllMethods(ut.TestCase):
 
     def test_has_iterable_type_checker_attributes(self):
@@ -1,5 +1,8 @@
 import logging
 import unittest as ut
+import gc
+import weakref
+from enum import IntEnum
 from collections import defaultdict, deque, OrderedDict
 from ....functional import CompositionOf
 from ....types.one import Just
@@ -202,6 +205,72 @@ class TestJust(ut.TestCase):
         self.assertEqual(log.output, log_msg)
 
 
+class Color(IntEnum):
+    RED = 1
+
+
+class TestJustSubclasses(ut.TestCase):
+
+    def test_has_attribute_subclasses(self):
+        JustInt = Just(int)
+        self.assertTrue(hasattr(JustInt, 'subclasses'))
+
+    def test_attribute_subclasses_defaults_to_false(self):
+        JustInt = Just(int)
+        self.assertFalse(JustInt.subclasses)
+
+    def test_cannot_set_attribute_subclasses(self):
+        JustInt = Just(int)
+        with self.assertRaises(AttributeError):
+            JustInt.subclasses = True
+
+    def test_subclass_fails_by_default(self):
+        JustInt = Just(int)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = JustInt(Color.RED)
+
+    def test_subclass_passes_with_subclasses(self):
+        JustInt = Just(int, subclasses=True)
+        self.assertIs(JustInt(Color.RED), Color.RED)
+
+    def test_subclass_passes_repeatedly_with_subclasses(self):
+        JustInt = Just(int, subclasses=True)
+        _ = JustInt(Color.RED)
+        self.assertIs(JustInt(Color.RED), Color.RED)
+
+    def test_exact_type_passes_with_subclasses(self):
+        JustInt = Just(int, subclasses=True)
+        self.assertEqual(JustInt(1), 1)
+
+    def test_error_on_wrong_type_with_subclasses(self):
+        JustInt = Just(int, subclasses=True)
+        log_msg = ['ERROR:root:Type of test must be int'
+                   ' (or a subclass), not str like bar!']
+        err_msg = 'Type of test must be int (or a subclass), not str like bar!'
+        with self.assertLogs(level=logging.ERROR) as log:
+            with self.assertRaises(WrongTypeError) as err:
+                _ = JustInt('bar', 'test')
+        self.assertEqual(str(err.exception), err_msg)
+        self.assertEqual(log.output, log_msg)
+
+    def test_error_on_wrong_type_repeatedly_with_subclasses(self):
+        JustInt = Just(int, subclasses=True)
+        with self.assertLogs(level=logging.ERROR):
+            for _ in range(2):
+                with self.assertRaises(WrongTypeError):
+                    _ = JustInt('bar', 'test')
+
+    def test_does_not_keep_dynamic_classes_alive(self):
+        JustInt = Just(int, subclasses=True)
+        Dynamic = type('Dynamic', (int,), {})
+        _ = JustInt(Dynamic(1))
+        reference = weakref.ref(Dynamic)
+        del Dynamic, _
+        gc.collect()
+        self.assertIsNone(reference())
+
+
 class TestJustMethods(ut.TestCase):
 
     def test_has_attribute_o(self):
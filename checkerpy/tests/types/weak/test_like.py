@@ -240,6 +240,15 @@ class TestLike(ut.TestCase):
         self.assertEqual(str(err.exception), err_msg)
         self.assertEqual(log.output, log_msg)
 
+    def test_error_on_attribute_deleted_while_other_added(self):
+        LikeFoo = Like('foo')
+        Dynamic = type('Dynamic', (), {'foo': 1})
+        _ = LikeFoo(Dynamic())
+        del Dynamic.foo
+        Dynamic.bar = 1
+        with self.assertRaises(MissingAttrError):
+            _ = LikeFoo(Dynamic())
+
 
 class TestJustMethods(ut.TestCase):
 
@@ -3,6 +3,7 @@ import unittest as ut
 from collections import deque, defaultdict, OrderedDict
 from ....validators.all import AllHave
 from ....exceptions import MissingAttrError, CallableError, IterError
+from ....exceptions import IdentifierError
 from ....types.one import _REDUCED_ITER
 from ....types.weak import _LIKE_ITERABLES
 from ....functional import CompositionOf
@@ -484,6 +485,58 @@ class TestAllHave(ut.TestCase):
         self.assertEqual(str(err.exception), err_msg)
         self.assertEqual(log.output, log_msg)
 
+    def test_sample_skips_unsampled_elements(self):
+        inputs = [1, 'a', 2]
+        output = AllHave(inputs, 'test', attrs='real', sample=2)
+        self.assertIs(output, inputs)
+
+
+class Point:
+
+    def __init__(self, x):
+        self.x = x
+
+    def __abs__(self):
+        return abs(self.x)
+
+    def __repr__(self):
+        return f'Point({self.x})'
+
+
+class TestAllHaveManyOfSameType(ut.TestCase):
+
+    def test_works_with_type_and_instance_attributes(self):
+        inputs = [Point(i) for i in range(100)]
+        output = AllHave(inputs, attrs=('__abs__', 'x'))
+        self.assertIs(output, inputs)
+
+    def test_works_with_mixed_types(self):
+        inputs = [Point(1), 1.0, Point(2), 2.0]
+        output = AllHave(inputs, attrs='__abs__')
+        self.assertIs(output, inputs)
+
+    def test_error_on_instance_without_attribute(self):
+        err_msg = ('Object Point(2) with index 1 in list [Point(1), '
+                   'Point(2)] of type Point does not have required '
+                   'attribute y!')
+        inputs = [Point(1), Point(2)]
+        inputs[0].y = 1
+        with self.assertRaises(MissingAttrError) as err:
+            _ = AllHave(inputs, attrs=('__abs__', 'y'))
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_attribute_deleted_while_other_added(self):
+        Dynamic = type('Dynamic', (), {'foo': 1})
+        _ = AllHave([Dynamic(), Dynamic()], attrs='foo')
+        del Dynamic.foo
+        Dynamic.bar = 1
+        with self.assertRaises(MissingAttrError):
+            _ = AllHave([Dynamic(), Dynamic()], attrs='foo')
+
+    def test_error_on_invalid_attribute_name(self):
+        with self.assertRaises(IdentifierError):
+            _ = AllHave([Point(1)], attrs='1x')
+
 
 class TestAllHaveMethods(ut.TestCase):
 
@@ -0,0 +1,156 @@
+import logging
+import unittest as ut
+from collections import deque, OrderedDict
+from ....validators.all import AllIdentifier
+from ....exceptions import IdentifierError, IterError, CallableError
+from ....functional import CompositionOf
+from ....functional.namecache import NameCache
+
+
+class TestAllIdentifier(ut.TestCase):
+
+    def test_error_on_unnamed_variable_not_iterable(self):
+        log_msg = ['ERROR:root:Variable 1 with type int does not seem'
+                   ' to be an iterable with elements to inspect!']
+        err_msg = ('Variable 1 with type int does not seem to'
+                   ' be an iterable with elements to inspect!')
+        with self.assertLogs(level=logging.ERROR) as log:
+            with self.assertRaises(IterError) as err:
+                _ = AllIdentifier(1)
+        self.assertEqual(str(err.exception), err_msg)
+        self.assertEqual(log.output, log_msg)
+
+    def test_works_with_sane_containers(self):
+        for inputs in (['foo', 'bar'], ('foo', 'bar'), {'foo', 'bar'},
+                       frozenset({'foo', 'bar'}), deque(['foo', 'bar']),
+                       {'foo': 1, 'bar': 2}, OrderedDict(foo=1, bar=2),
+                       {'foo': 1, 'bar': 2}.keys(), ()):
+            with self.subTest(inputs=inputs):
+                output = AllIdentifier(inputs)
+                self.assertIs(output, inputs)
+
+    def test_works_with_generator(self):
+        inputs = (name for name in ('foo', 'bar'))
+        output = AllIdentifier(inputs)
+        self.assertListEqual(list(output), ['foo', 'bar'])
+
+    def test_works_with_keyword_if_not_strict(self):
+        inputs = ['foo', 'class']
+        output = AllIdentifier(inputs)
+        self.assertIs(output, inputs)
+
+    def test_error_with_unnamed_list(self):
+        log_msg = ['ERROR:root:Value 1x of str 1x with index 1 in list'
+                   " ['foo', '1x', 'bar'] is not a valid identifier!"]
+        err_msg = ("Value 1x of str 1x with index 1 in list ['foo',"
+                   " '1x', 'bar'] is not a valid identifier!")
+        with self.assertLogs(level=logging.ERROR) as log:
+            with self.assertRaises(IdentifierError) as err:
+                _ = AllIdentifier(['foo', '1x', 'bar'])
+        self.assertEqual(str(err.exception), err_msg)
+        self.assertEqual(log.output, log_msg)
+
+    def test_error_with_named_tuple(self):
+        err_msg = ('Value 1x of str 1x with index 2 in tuple'
+                   ' test is not a valid identifier!')
+        with self.assertRaises(IdentifierError) as err:
+            _ = AllIdentifier(('foo', 'bar', '1x'), 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_element_not_str(self):
+        err_msg = ("int 1 with index 1 in list ['foo', 1]"
+                   " is not a valid identifier!")
+        with self.assertRaises(IdentifierError) as err:
+            _ = AllIdentifier(['foo', 1])
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_keyword_if_strict(self):
+        err_msg = ('Value class of str class with index 1 in list'
+                   ' test is a reserved keyword!')
+        with self.assertRaises(IdentifierError) as err:
+            _ = AllIdentifier(['foo', 'class'], 'test', strict=True)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_keyword_in_generator_if_strict(self):
+        inputs = (name for name in ('foo', 'class'))
+        with self.assertRaises(IdentifierError):
+            _ = list(AllIdentifier(inputs, strict=True))
+
+    def test_sample_is_checked(self):
+        inputs = ['foo', '1x', 'bar']
+        output = AllIdentifier(inputs, sample=2)
+        self.assertIs(output, inputs)
+        with self.assertRaises(IdentifierError):
+            _ = AllIdentifier(inputs, sample=3)
+
+
+class TestAllIdentifierCached(ut.TestCase):
+
+    def setUp(self):
+        self.verified = AllIdentifier._verified
+        AllIdentifier._verified = NameCache()
+
+    def tearDown(self):
+        AllIdentifier._verified = self.verified
+
+    def test_nothing_is_cached_by_default(self):
+        _ = AllIdentifier(['foo', 'bar'])
+        self.assertEqual(len(AllIdentifier._verified), 0)
+
+    def test_passing_names_are_cached(self):
+        _ = AllIdentifier(['foo', 'bar', 'foo'], cached=True)
+        self.assertListEqual(list(AllIdentifier._verified), ['foo', 'bar'])
+
+    def test_failing_names_are_not_cached(self):
+        with self.assertRaises(IdentifierError):
+            _ = AllIdentifier(['foo', '1x'], cached=True)
+        self.assertEqual(len(AllIdentifier._verified), 0)
+
+    def test_keywords_are_not_cached(self):
+        _ = AllIdentifier(['foo', 'class'], cached=True)
+        self.assertListEqual(list(AllIdentifier._verified), ['foo'])
+
+    def test_cached_names_are_skipped(self):
+        AllIdentifier._verified.add(['foo'])
+        inputs = ['foo', 'foo']
+        output = AllIdentifier(inputs, cached=True)
+        self.assertIs(output, inputs)
+
+    def test_keyword_is_rejected_if_strict_after_caching(self):
+        _ = AllIdentifier(['foo', 'class'], cached=True)
+        with self.assertRaises(IdentifierError):
+            _ = AllIdentifier(['foo', 'class'], cached=True, strict=True)
+
+
+class TestAllIdentifierMethods(ut.TestCase):
+
+    def test_has_attribute_o(self):
+        self.assertTrue(hasattr(AllIdentifier, 'o'))
+
+    def test_attribute_o_is_callable(self):
+        self.assertTrue(callable(AllIdentifier.o))
+
+    def test_o_returns_composition(self):
+        def f(x):
+            return x
+        composition = AllIdentifier.o(f)
+        self.assertIsInstance(composition, CompositionOf)
+
+    def test_o_raises_error_on_argument_not_callable(self):
+        err_msg = ('foo must be a callable that accepts (i) a value,'
+                   ' (ii) an optional name for that value, and (iii)'
+                   ' any number of keyword arguments!')
+        with self.assertRaises(CallableError) as err:
+            _ = AllIdentifier.o('foo')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_has_attribute_JustList(self):
+        self.assertTrue(hasattr(AllIdentifier, 'JustList'))
+
+    def test_strict_is_passed_through_JustList(self):
+        with self.assertRaises(IdentifierError):
+            _ = AllIdentifier.JustList(['class'], strict=True)
+
+
+if __name__ == '__main__':
+    ut.main()
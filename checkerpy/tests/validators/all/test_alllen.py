@@ -464,6 +464,84 @@ class TestAllLen(ut.TestCase):
         self.assertEqual(str(err.exception), err_msg)
         self.assertEqual(log.output, log_msg)
 
+    def test_sample_skips_unsampled_elements(self):
+        inputs = ['ab', 'abc', 'cd']
+        output = AllLen(inputs, 'test', alen=2, sample=2, seed=3)
+        self.assertIs(output, inputs)
+
+    def test_error_on_sampled_element(self):
+        err_msg = ('Length of str abc with index 2 in'
+                   ' list test must be 2, not 3!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LenError) as err:
+                _ = AllLen(['ab', 'a', 'abc'], 'test', alen=2, sample=2)
+        self.assertEqual(str(err.exception), err_msg)
+
+
+class TestAllLenRanges(ut.TestCase):
+
+    def test_works_with_range(self):
+        inputs = [[1] * n for n in range(1, 100)]
+        output = AllLen(inputs, alen=range(1, 10001))
+        self.assertIs(output, inputs)
+
+    def test_works_with_amin_len_and_amax_len(self):
+        inputs = ('f', 'fo', 'foo')
+        output = AllLen(inputs, amin_len=1, amax_len=3)
+        self.assertIs(output, inputs)
+
+    def test_works_with_many_lengths(self):
+        inputs = ['foo', 'fo']
+        output = AllLen(inputs, alen=tuple(range(2, 10001)))
+        self.assertIs(output, inputs)
+
+    def test_works_with_generator(self):
+        inputs = (word for word in ('foo', 'fo'))
+        output = AllLen(inputs, amin_len=2)
+        self.assertListEqual(list(output), ['foo', 'fo'])
+
+    def test_error_on_element_below_amin_len(self):
+        log_msg = ["ERROR:root:Length of str f with index 2 in list"
+                   " test must be at least 2, not 1!"]
+        err_msg = ("Length of str f with index 2 in list"
+                   " test must be at least 2, not 1!")
+        with self.assertLogs(level=logging.ERROR) as log:
+            with self.assertRaises(LenError) as err:
+                _ = AllLen(['foo', 'fo', 'f', ''], 'test', amin_len=2)
+        self.assertEqual(str(err.exception), err_msg)
+        self.assertEqual(log.output, log_msg)
+
+    def test_error_on_element_above_amax_len(self):
+        err_msg = ("Length of str foo with index 0 in tuple"
+                   " test must be at most 2, not 3!")
+        with self.assertRaises(LenError) as err:
+            _ = AllLen(('foo', 'fo'), 'test', amax_len=2)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_element_without_length(self):
+        with self.assertRaises(LenError):
+            _ = AllLen(['foo', 1], amin_len=2)
+
+    def test_error_on_alen_and_amin_len(self):
+        with self.assertRaises(ValueError):
+            _ = AllLen(['foo'], alen=3, amin_len=2)
+
+    def test_error_on_no_lengths(self):
+        with self.assertRaises(TypeError):
+            _ = AllLen(['foo'])
+
+    def test_error_on_amin_len_above_amax_len(self):
+        err_msg = 'Minimum length 5 must not exceed maximum length 3!'
+        with self.assertRaises(ValueError) as err:
+            _ = AllLen(['foo'], amin_len=5, amax_len=3)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_empty_range(self):
+        err_msg = 'Allowed lengths range(5, 3) are empty!'
+        with self.assertRaises(ValueError) as err:
+            _ = AllLen(['foo'], alen=range(5, 3))
+        self.assertEqual(str(err.exception), err_msg)
+
 
 class TestAllLenMethods(ut.TestCase):
 
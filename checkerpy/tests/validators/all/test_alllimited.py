@@ -3,10 +3,17 @@ import unittest as ut
 from collections import deque, defaultdict, OrderedDict
 from ....validators.all import AllLimited
 from ....exceptions import LimitError, IterError, CallableError
+from ....exceptions import WrongTypeError
 from ....types.one import _REDUCED_ITER, JustStr
 from ....types.weak import _LIKE_ITERABLES
 from ....types.all import _ALL_COMPARABLES
 from ....functional import CompositionOf
+try:
+    import numpy as np
+except ImportError:
+    no_numpy = True
+else:
+    no_numpy = False
 
 
 class TestAllLimited(ut.TestCase):
@@ -550,6 +557,64 @@ class TestAllLimited(ut.TestCase):
         self.assertEqual(str(err.exception), err_msg)
         self.assertEqual(log.output, log_msg)
 
+    def test_sample_skips_unsampled_elements(self):
+        inputs = [1, 7, 5, 9, 2]
+        output = AllLimited(inputs, 'test', ahi=5, sample=3)
+        self.assertIs(output, inputs)
+
+    def test_error_on_sampled_element(self):
+        err_msg = ('Value 9 of list test at index 4 lies outside'
+                   ' the allowed interval (-inf, 5]!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = AllLimited([1, 7, 5, 7, 9], 'test', ahi=5, sample=3)
+        self.assertEqual(str(err.exception), err_msg)
+
+
+@ut.skipIf(no_numpy, 'Could not import numpy!')
+class TestAllLimitedNdarray(ut.TestCase):
+
+    def test_works_with_arrays_inside_limits(self):
+        for dtype in (bool, np.int8, np.uint32, np.float64):
+            inputs = np.ones((2, 3), dtype=dtype)
+            with self.subTest(dtype=dtype):
+                output = AllLimited(inputs, 'test', alo=0, ahi=1)
+                self.assertIs(output, inputs)
+
+    def test_works_with_nan(self):
+        inputs = np.array([0.5, np.nan, 1.0])
+        output = AllLimited(inputs, alo=0.0, ahi=1.0)
+        self.assertIs(output, inputs)
+
+    def test_error_reports_first_element_outside(self):
+        inputs = np.array([0.5, np.nan, 2.0, -1.0])
+        err_msg = ('Value 2.0 of ndarray test at index 2 lies outside'
+                   ' the allowed interval [0, 1]!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = AllLimited(inputs, 'test', alo=0, ahi=1)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_reports_index_into_multidimensional_array(self):
+        inputs = np.zeros((2, 3), dtype=int)
+        inputs[1, 2] = -4
+        err_msg = ('Value -4 of ndarray test at index (1, 2) lies outside'
+                   ' the allowed interval [0, inf)!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = AllLimited(inputs, 'test', alo=0)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_uncomparable_limit(self):
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = AllLimited(np.arange(3), 'test', alo='a')
+
+    def test_arrays_of_other_dtypes_are_checked_by_element(self):
+        inputs = np.array(['b', 'c'])
+        output = AllLimited(inputs, 'test', alo='a', ahi='d')
+        self.assertIs(output, inputs)
+
 
 class TestAllLimitedMethods(ut.TestCase):
 
@@ -186,5 +186,26 @@ class TestJustShape(ut.TestCase):
         self.assertEqual(str(err.exception), err_msg)
 
 
+@ut.skipIf(no_numpy, 'Could not import numpy!')
+class TestJustShapeBind(ut.TestCase):
+
+    def test_bind_validates_shape(self):
+        with self.assertRaises(ShapeError):
+            _ = JustShape.bind(shape='foo')
+        with self.assertRaises(IntError):
+            _ = JustShape.bind(shape=(1, 'foo'))
+
+    def test_bound_checks_shape(self):
+        inp = array([[1, 2, 3], [4, 5, 6]])
+        bound = JustShape.bind(shape=[(2, 2), (..., 3)])
+        assert_array_equal(bound(inp, 'test'), inp)
+        err_msg = ('Shape of array test must be one of'
+                   ' ((2, 2), (Ellipsis, 3)), not (3, 2)!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ShapeError) as err:
+                _ = bound(inp.T, 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+
 if __name__ == '__main__':
     ut.main()
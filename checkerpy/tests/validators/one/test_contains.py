@@ -463,5 +463,76 @@ class TestContainsIterables(ut.TestCase):
         self.assertEqual(log.output, log_msg)
 
 
+class EqualToAll:
+
+    def __eq__(self, other):
+        return True
+
+    def __hash__(self):
+        return 0
+
+
+class TestContainsManyItems(ut.TestCase):
+
+    def setUp(self):
+        self.elements = list(range(1000))
+        self.every = tuple(range(0, 1000, 10))
+
+    def test_works_with_large_iterables(self):
+        for iterable in (self.elements, tuple(self.elements),
+                         deque(self.elements)):
+            with self.subTest(type=type(iterable)):
+                out = Contains(iterable, 'test', every=self.every,
+                               some=(-1, 999))
+                self.assertIs(out, iterable)
+
+    def test_error_lists_missing_items_in_order(self):
+        every = self.every + (2000, -1, 2000)
+        err_msg = 'Items (2000, -1, 2000) are not in list test!'
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError) as err:
+                _ = Contains(self.elements, 'test', every=every)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_one_missing_item(self):
+        every = self.every + (2000,)
+        err_msg = 'Int 2000 is not in list test!'
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError) as err:
+                _ = Contains(self.elements, 'test', every=every)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_none_of_some(self):
+        some = tuple(range(2000, 2010))
+        err_msg = f'None of {some} are in list test!'
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError) as err:
+                _ = Contains(self.elements, 'test', some=some)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_unhashable_elements(self):
+        elements = [[i] for i in range(1000)]
+        every = tuple([i] for i in range(10))
+        self.assertIs(Contains(elements, 'test', every=every), elements)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError):
+                _ = Contains(elements, 'test', every=every + ([2000],))
+
+    def test_unhashable_items(self):
+        elements = self.elements + [[1]]
+        every = self.every + ([1],)
+        self.assertIs(Contains(elements, 'test', every=every), elements)
+        some = tuple([i] for i in range(2, 12))
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError):
+                _ = Contains(elements, 'test', some=some)
+
+    def test_outcome_does_not_depend_on_set(self):
+        elements = self.elements + [EqualToAll()]
+        every = tuple(range(2000, 2010))
+        self.assertIs(Contains(elements, 'test', every=every,
+                               some=every), elements)
+
+
 if __name__ == '__main__':
     ut.main()
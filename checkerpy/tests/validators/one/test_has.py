@@ -377,6 +377,54 @@ class TestHas(ut.TestCase):
         self.assertEqual(log.output, log_msg)
 
 
+class Slotted:
+    __slots__ = 'foo',
+
+
+class TestHasProvidedByType(ut.TestCase):
+
+    def test_works_with_instance_attribute(self):
+        inp = Slotted()
+        inp.foo = 1
+        out = Has(inp, attr=('foo', '__slots__'))
+        self.assertIs(out, inp)
+
+    def test_error_on_unset_slot(self):
+        err_msg = 'Slotted does not have required attribute foo!'
+        _ = Has(Slotted(), attr='__slots__')
+        with self.assertRaises(MissingAttrError) as err:
+            _ = Has(Slotted(), attr=('__slots__', 'foo'))
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_attribute_deleted_from_type(self):
+        err_msg = 'Dynamic does not have required attribute foo!'
+        Dynamic = type('Dynamic', (), {'foo': 1})
+        _ = Has(Dynamic(), attr='foo')
+        del Dynamic.foo
+        with self.assertRaises(MissingAttrError) as err:
+            _ = Has(Dynamic(), attr='foo')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_attribute_deleted_while_other_added(self):
+        err_msg = 'Dynamic does not have required attribute foo!'
+        Dynamic = type('Dynamic', (), {'foo': 1})
+        _ = Has(Dynamic(), attr='foo')
+        del Dynamic.foo
+        Dynamic.bar = 1
+        with self.assertRaises(MissingAttrError) as err:
+            _ = Has(Dynamic(), attr='foo')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_works_with_attribute_added_to_type(self):
+        Dynamic = type('Dynamic', (), {})
+        with self.assertRaises(MissingAttrError):
+            _ = Has(Dynamic(), attr='foo')
+        Dynamic.foo = 1
+        inp = Dynamic()
+        out = Has(inp, attr='foo')
+        self.assertIs(out, inp)
+
+
 class TestHasMethods(ut.TestCase):
 
     def test_has_attribute_o(self):
@@ -259,6 +259,38 @@ class TestIdentifier(ut.TestCase):
         self.assertEqual(log.output, log_msg)
 
 
+class TestIdentifierStrict(ut.TestCase):
+
+    def test_works_with_keyword_if_not_strict(self):
+        out = Identifier('class')
+        self.assertEqual(out, 'class')
+
+    def test_works_with_identifier_if_strict(self):
+        out = Identifier('klass', strict=True)
+        self.assertEqual(out, 'klass')
+
+    def test_error_on_unnamed_keyword_if_strict(self):
+        log_msg = ['ERROR:root:class is a reserved keyword!']
+        err_msg = 'class is a reserved keyword!'
+        with self.assertLogs(level=logging.ERROR) as log:
+            with self.assertRaises(IdentifierError) as err:
+                _ = Identifier('class', strict=True)
+        self.assertEqual(str(err.exception), err_msg)
+        self.assertEqual(log.output, log_msg)
+
+    def test_error_on_named_keyword_if_strict(self):
+        err_msg = 'Value class of str test is a reserved keyword!'
+        with self.assertRaises(IdentifierError) as err:
+            _ = Identifier('class', 'test', strict=True)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_invalid_identifier_if_strict(self):
+        err_msg = '1x is not a valid identifier!'
+        with self.assertRaises(IdentifierError) as err:
+            _ = Identifier('1x', strict=True)
+        self.assertEqual(str(err.exception), err_msg)
+
+
 class TestIdentifierMethods(ut.TestCase):
 
     def test_has_attribute_JustStr(self):
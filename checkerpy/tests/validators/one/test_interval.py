@@ -0,0 +1,218 @@
+import logging
+import unittest as ut
+from collections import deque
+from ....validators.one import Interval
+from ....validators.one.interval import interval_for
+from ....exceptions import WrongTypeError, LimitError, IterError
+from ....functional import CompositionOf
+from ....types.one import JustInt
+try:
+    import numpy as np
+except ImportError:
+    no_numpy = True
+else:
+    no_numpy = False
+
+
+class TestIntervalSpecification(ut.TestCase):
+
+    def test_has_attributes(self):
+        interval = Interval(0, 1, closed='left')
+        self.assertEqual(interval.lo, 0)
+        self.assertEqual(interval.hi, 1)
+        self.assertEqual(interval.closed, 'left')
+
+    def test_defaults(self):
+        interval = Interval()
+        self.assertIs(interval.lo, Ellipsis)
+        self.assertIs(interval.hi, Ellipsis)
+        self.assertEqual(interval.closed, 'both')
+
+    def test_error_on_invalid_closed(self):
+        err_msg = ("Argument closed must be one of 'both', 'left',"
+                   " 'right', or 'neither', not foo!")
+        with self.assertRaises(ValueError) as err:
+            _ = Interval(0, 1, closed='foo')
+        self.assertEqual(str(err.exception), err_msg)
+        with self.assertRaises(ValueError):
+            _ = Interval(0, 1, closed=[])
+
+    def test_attributes_are_read_only(self):
+        interval = Interval(0, 1)
+        with self.assertRaises(AttributeError):
+            interval.lo = 2
+
+    def test_equality_and_hash(self):
+        self.assertEqual(Interval(0, 1), Interval(0, 1))
+        self.assertEqual(hash(Interval(0, 1)), hash(Interval(0, 1)))
+        self.assertNotEqual(Interval(0, 1), Interval(0, 2))
+        self.assertNotEqual(Interval(0, 1), Interval(0, 1, 'left'))
+        self.assertNotEqual(Interval(0, 1), (0, 1))
+        self.assertEqual(len({Interval(0, 1), Interval(0, 1)}), 1)
+
+    def test_has_attribute_o(self):
+        composition = Interval(0, 1).o(JustInt)
+        self.assertIsInstance(composition, CompositionOf)
+        self.assertEqual(composition(1), 1)
+
+
+class TestIntervalCall(ut.TestCase):
+
+    def test_returns_value_inside(self):
+        for closed in ('both', 'left', 'right', 'neither'):
+            with self.subTest(closed=closed):
+                self.assertEqual(Interval(0, 2, closed)(1, 'test'), 1)
+
+    def test_bounds_belong_to_interval_if_closed(self):
+        self.assertEqual(Interval(0, 1)(0), 0)
+        self.assertEqual(Interval(0, 1)(1), 1)
+        self.assertEqual(Interval(0, 1, 'left')(0), 0)
+        self.assertEqual(Interval(0, 1, 'right')(1), 1)
+
+    def test_error_on_open_bounds(self):
+        cases = (('left', 1, 'Value 1 of test lies outside'
+                             ' the allowed interval [0, 1)!'),
+                 ('right', 0, 'Value 0 of test lies outside'
+                              ' the allowed interval (0, 1]!'),
+                 ('neither', 0, 'Value 0 of test lies outside'
+                                ' the allowed interval (0, 1)!'),
+                 ('neither', 1, 'Value 1 of test lies outside'
+                                ' the allowed interval (0, 1)!'))
+        for closed, value, err_msg in cases:
+            with self.subTest(closed=closed, value=value):
+                with self.assertLogs(level=logging.ERROR):
+                    with self.assertRaises(LimitError) as err:
+                        _ = Interval(0, 1, closed)(value, 'test')
+                self.assertEqual(str(err.exception), err_msg)
+
+    def test_missing_bounds_are_never_crossed(self):
+        self.assertEqual(Interval(..., 1, 'neither')(-1e300), -1e300)
+        self.assertEqual(Interval(0, ..., 'neither')(1e300), 1e300)
+        self.assertEqual(Interval()('foo'), 'foo')
+
+    def test_error_on_value_outside(self):
+        err_msg = 'Value 2 lies outside the allowed interval (-inf, 1]!'
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = Interval(..., 1)(2)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_uncomparable_value(self):
+        err_msg = ('Cannot compare type str of foo with'
+                   ' limits of types int and int!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = Interval(0, 1)('foo')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_uncomparable_upper_bound_only(self):
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError):
+                _ = Interval('b', 1)('a')
+
+    def test_nan_is_never_outside(self):
+        nan = float('nan')
+        self.assertIs(Interval(0, 1)(nan), nan)
+
+
+class TestIntervalCheckMany(ut.TestCase):
+
+    def test_returns_containers_inside(self):
+        interval = Interval(0, 10)
+        for value in ([1, 2, 3], (1, 2.5), {1, 2}, frozenset({3}),
+                      deque([4, 5]), {1: 'a'}, {'a': 1}.values(), []):
+            with self.subTest(value=value):
+                self.assertIs(interval.check_many(value, 'test'), value)
+
+    def test_returns_strings_inside(self):
+        interval = Interval('a', 'c', 'left')
+        value = ['a', 'ab', 'b']
+        self.assertIs(interval.check_many(value), value)
+
+    def test_error_names_first_element_outside(self):
+        err_msg = ('Value 11 of list test at index 2 lies'
+                   ' outside the allowed interval [0, 10]!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = Interval(0, 10).check_many([1, 2, 11, -1], 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_open_bound(self):
+        err_msg = ('Value 10 of list test at index 1 lies'
+                   ' outside the allowed interval [0, 10)!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = Interval(0, 10, 'left').check_many([0, 10], 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_uncomparable_element(self):
+        err_msg = ('Cannot compare type str of list test at index 1'
+                   ' with limits of types int and int!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(WrongTypeError) as err:
+                _ = Interval(0, 10).check_many([1, 'a'], 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_nan_does_not_hide_elements_outside(self):
+        nan = float('nan')
+        interval = Interval(0, 1)
+        value = [nan, 0.5, nan]
+        self.assertIs(interval.check_many(value), value)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = interval.check_many([nan, 0.5, -1.0])
+
+    def test_unordered_elements_are_checked_one_by_one(self):
+        interval = Interval((0,), (2,))
+        value = [(1,), (1, 5)]
+        self.assertIs(interval.check_many(value), value)
+
+    def test_iterators_are_checked_lazily(self):
+        checked = Interval(0, 1).check_many(iter([0, 1, 2]), 'test')
+        self.assertEqual(next(checked), 0)
+        self.assertEqual(next(checked), 1)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = next(checked)
+
+    def test_sample(self):
+        value = [0, 5, 1]
+        self.assertIs(Interval(0, 1).check_many(value, sample=2), value)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError):
+                _ = Interval(0, 1).check_many(value, sample=3)
+
+    def test_error_on_non_iterable(self):
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(IterError):
+                _ = Interval(0, 1).check_many(1, 'test')
+
+    @ut.skipIf(no_numpy, 'Could not import numpy!')
+    def test_numpy_arrays(self):
+        array = np.array([[0.0, 0.5], [0.9, 1.0]])
+        self.assertIs(Interval(0, 1).check_many(array), array)
+        err_msg = ('Value 1.0 of ndarray test at index (1, 1) lies'
+                   ' outside the allowed interval [0, 1)!')
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(LimitError) as err:
+                _ = Interval(0, 1, 'left').check_many(array, 'test')
+        self.assertEqual(str(err.exception), err_msg)
+
+
+class TestIntervalFor(ut.TestCase):
+
+    def test_same_bounds_share_interval(self):
+        self.assertIs(interval_for(0, 1), interval_for(0, 1))
+
+    def test_bounds_of_different_types_do_not(self):
+        self.assertIsNot(interval_for(0, 1), interval_for(0.0, 1.0))
+        self.assertIsInstance(interval_for(0.0, 1.0).lo, float)
+
+    def test_unhashable_bounds(self):
+        interval = interval_for([0], [1])
+        self.assertListEqual(interval.lo, [0])
+        self.assertEqual(interval.closed, 'both')
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -1,3 +1,4 @@
+import sys
 import logging
 import unittest as ut
 from collections import deque, defaultdict, OrderedDict
@@ -103,6 +104,118 @@ class TestJustLenSpcification(ut.TestCase):
         self.assertEqual(str(err.exception), err_msg)
 
 
+class TestJustLenRanges(ut.TestCase):
+
+    def test_works_with_length_in_range(self):
+        inp = [1, 2]
+        out = JustLen(inp, length=range(1, 10001))
+        self.assertIs(out, inp)
+
+    def test_works_with_min_len(self):
+        out = JustLen('foo', min_len=3)
+        self.assertEqual(out, 'foo')
+
+    def test_works_with_max_len(self):
+        out = JustLen('foo', max_len=3)
+        self.assertEqual(out, 'foo')
+
+    def test_works_with_min_len_and_max_len(self):
+        out = JustLen('foo', min_len='2', max_len=4.0)
+        self.assertEqual(out, 'foo')
+
+    def test_error_on_length_not_in_range(self):
+        log_msg = ['ERROR:root:Length of str foo must'
+                   ' be between 4 and 9, not 3!']
+        err_msg = 'Length of str foo must be between 4 and 9, not 3!'
+        with self.assertLogs(level=logging.ERROR) as log:
+            with self.assertRaises(LenError) as err:
+                _ = JustLen('foo', length=range(4, 10))
+        self.assertEqual(str(err.exception), err_msg)
+        self.assertEqual(log.output, log_msg)
+
+    def test_error_on_length_not_in_range_with_step(self):
+        err_msg = ('Length of str foo must be one of'
+                   ' range(0, 10, 2), not 3!')
+        with self.assertRaises(LenError) as err:
+            _ = JustLen('foo', length=range(0, 10, 2))
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_length_below_min_len(self):
+        err_msg = 'Length of list test must be at least 4, not 3!'
+        with self.assertRaises(LenError) as err:
+            _ = JustLen([1, 2, 3], 'test', min_len=4)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_length_above_max_len(self):
+        err_msg = 'Length of list test must be at most 2, not 3!'
+        with self.assertRaises(LenError) as err:
+            _ = JustLen([1, 2, 3], 'test', max_len=2)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_length_outside_min_len_and_max_len(self):
+        err_msg = 'Length of list test must be between 4 and 6, not 3!'
+        with self.assertRaises(LenError) as err:
+            _ = JustLen([1, 2, 3], 'test', min_len=4, max_len=6)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_length_not_equal_to_min_len_and_max_len(self):
+        err_msg = 'Length of list test must be 4, not 3!'
+        with self.assertRaises(LenError) as err:
+            _ = JustLen([1, 2, 3], 'test', min_len=4, max_len=4)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_min_len_not_convertible_to_int(self):
+        err_msg = ('Could not convert given length foo'
+                   ' with type str to required type int!')
+        with self.assertRaises(IntError) as err:
+            _ = JustLen([1, 2, 3], min_len='foo')
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_no_lengths(self):
+        with self.assertRaises(TypeError):
+            _ = JustLen([1, 2, 3])
+
+    def test_error_on_length_and_max_len(self):
+        err_msg = ('Specify either length or min_len'
+                   ' and/or max_len, but not both!')
+        with self.assertRaises(ValueError) as err:
+            _ = JustLen([1, 2, 3], length=3, max_len=4)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_min_len_above_max_len(self):
+        err_msg = 'Minimum length 5 must not exceed maximum length 3!'
+        with self.assertRaises(ValueError) as err:
+            _ = JustLen([1, 2, 3], min_len=5, max_len=3)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_negative_max_len(self):
+        err_msg = 'Maximum length -1 must not be negative!'
+        with self.assertRaises(ValueError) as err:
+            _ = JustLen([1, 2, 3], max_len=-1)
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_error_on_empty_range(self):
+        err_msg = 'Allowed lengths range(0, 0) are empty!'
+        with self.assertRaises(ValueError) as err:
+            _ = JustLen([1, 2, 3], length=range(0))
+        self.assertEqual(str(err.exception), err_msg)
+
+    def test_bind_raises_error_on_min_len_above_max_len(self):
+        with self.assertRaises(ValueError):
+            _ = JustLen.bind(min_len=5, max_len=3)
+
+    def test_bind_keeps_only_given_spec(self):
+        bound = JustLen.bind(min_len=2)
+        self.assertDictEqual(dict(bound.spec), {'min_len': 2})
+        self.assertTupleEqual(bound.normalized, (range(2, sys.maxsize),))
+
+    def test_bind_to_range(self):
+        bound = JustLen.bind(length=range(2, 4))
+        self.assertListEqual(bound([1, 2, 3]), [1, 2, 3])
+        with self.assertRaises(LenError):
+            _ = bound([1, 2, 3, 4])
+
+
 class TestJustLen(ut.TestCase):
 
     def test_error_on_invalid_unnamed_argument(self):
@@ -424,5 +424,63 @@ class TestOneOfMethods(ut.TestCase):
         self.assertEqual(str(err.exception), err_msg)
 
 
+class EqualToAll:
+
+    def __eq__(self, other):
+        return True
+
+    def __hash__(self):
+        return 0
+
+
+class TestOneOfIndex(ut.TestCase):
+
+    def setUp(self):
+        self.items = tuple(range(1000))
+
+    def test_finds_value_in_many_items(self):
+        self.assertEqual(OneOf(999, 'test', items=self.items), 999)
+        self.assertEqual(OneOf(999.0, 'test', items=self.items), 999.0)
+        self.assertIs(OneOf(True, 'test', items=self.items), True)
+
+    def test_error_on_value_not_in_many_items(self):
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError):
+                _ = OneOf(1000, 'test', items=self.items)
+
+    def test_unhashable_value_is_looked_for_one_by_one(self):
+        items = self.items + ([1],)
+        self.assertListEqual(OneOf([1], 'test', items=items), [1])
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError):
+                _ = OneOf([2], 'test', items=items)
+
+    def test_outcome_does_not_depend_on_index(self):
+        value = EqualToAll()
+        self.assertIs(OneOf(value, 'test', items=self.items), value)
+
+    def test_unhashable_items_are_scanned(self):
+        items = tuple([i] for i in range(100))
+        self.assertListEqual(OneOf([99], 'test', items=items), [99])
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError):
+                _ = OneOf([100], 'test', items=items)
+
+    def test_lists_are_not_indexed_between_calls(self):
+        items = list(range(100))
+        self.assertEqual(OneOf(99, 'test', items=items), 99)
+        items.remove(99)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError):
+                _ = OneOf(99, 'test', items=items)
+
+    def test_bound_lists_are_indexed(self):
+        bound = OneOf.bind(items=list(range(1000)))
+        self.assertEqual(bound(999, 'test'), 999)
+        with self.assertLogs(level=logging.ERROR):
+            with self.assertRaises(ItemError):
+                _ = bound(1000, 'test')
+
+
 if __name__ == '__main__':
     ut.main()
@@ -1,17 +1,27 @@
-import logging as log
 from typing import Union, Tuple, Iterable, Any
 from .docstring import DOC_HEADER, DOC_BODY
 from ..one import _REDUCED_ITER, Just
 from ...validators.one import NonEmpty, JustLen
-from ...functional import CompositionOf
+from ...functional.lazy import LazyComposition
+from ...functional.context import Context, Deferred
+from ...functional.iteration import check_all, CONTAINERS
 from ...functional.mixins import CompositionMixin
-from ...exceptions import IterError
+from ...levels import LEVELS
 
 TypesT = Union[type, Iterable[type]]
-EnumeratedT = Tuple[Tuple[int, Any], ...]
 
 
-class All(CompositionMixin):
+class Registrar(type):
+    """Sets lazy compositions of instances and iterable checkers as attr's."""
+    def __init__(cls, class_name: str, bases, attributes: dict) -> None:
+        super().__init__(class_name, bases, attributes)
+        for iterable in _REDUCED_ITER:
+            setattr(cls, iterable.__name__, LazyComposition(iterable, True))
+        setattr(cls, 'NonEmpty', LazyComposition(NonEmpty, True))
+        setattr(cls, 'JustLen', LazyComposition(JustLen, True))
+
+
+class All(CompositionMixin, metaclass=Registrar):
     """Class for easily defining type-checkers for all elements of an iterable.
 
     Parameters
@@ -21,6 +31,9 @@ class All(CompositionMixin):
     identifier : str, optional
         A valid python identifier as name of the type checker object.
         Defaults to 'All'.
+    subclasses : bool, optional
+        Whether elements that are instances of subclasses of the `types` to
+        check for should pass as well. Defaults to False.
 
     Raises
     ------
@@ -40,63 +53,59 @@ class All(CompositionMixin):
 
     """
 
-    def __init__(self, *types: TypesT, identifier: str = 'All') -> None:
-        self.__just = Just(*types)
+    def __init__(self, *types: TypesT, identifier: str = 'All',
+                 subclasses: bool = False) -> None:
+        self.__just = Just(*types, subclasses=subclasses)
         self.__types = self.__just.types
+        self.__allowed = frozenset(self.__types)
+        self.__subclasses = self.__just.subclasses
         self.__name__ = self.__identified(identifier)
         self.__doc__ = self.__doc_string()
-        for iterable in _REDUCED_ITER:
-            setattr(self, iterable.__name__, CompositionOf(self, iterable))
-        setattr(self, 'NonEmpty', CompositionOf(self, NonEmpty))
-        setattr(self, 'JustLen', CompositionOf(self, JustLen))
 
     @property
     def types(self) -> Tuple[type, ...]:
         return self.__types
 
-    def __call__(self, iterable: Any, name=None, **kwargs):
-        self.__name = str(name) if name is not None else ''
-        self.__string = self.__name or str(iterable)
-        self.__itertype = type(iterable).__name__
-        for index, value in self.__enumerate(iterable):
-            _ = self.__just(value, name=self.__name_from(index))
-        return iterable
-
-    def __enumerate(self, iterable: Any) -> EnumeratedT:
-        try:
-            if hasattr(iterable, 'index') and hasattr(iterable, 'count'):
-                enumerated = tuple(enumerate(iterable))
-            else:
-                indices = (-1 for _ in range(len(iterable)))
-                enumerated = tuple(zip(indices, iterable))
-        except TypeError as error:
-            message = self.__not_an_iterable_message()
-            log.error(message)
-            raise IterError(message) from error
-        return enumerated
-
-    def __not_an_iterable_message(self) -> str:
-        return (f'Variable {self.__string} with type {self.__itertype} does'
-                ' not seem to be an iterable with elements to inspect!')
-
-    def __name_from(self, index: int) -> str:
-        dicts = f'dict {self.__string}' if self.__name else self.__string
-        named = (f'{self.__itertype} {self.__name}'
-                 if self.__name else self.__string)
-        if self.__itertype == 'dict':
-            return f'key in dict {self.__string}'
-        elif self.__itertype in ('dict_keys', 'odict_keys'):
+    @property
+    def subclasses(self) -> bool:
+        return self.__subclasses
+
+    def __call__(self, iterable: Any, name=None, *, sample: int = None,
+                 seed=None, **kwargs):
+        if LEVELS.off:
+            return iterable
+        if sample is None and type(iterable) in CONTAINERS:
+            if self.__allowed.issuperset(map(type, iterable)):
+                return iterable
+        context = Context(iterable, name)
+        return check_all(context, self.__check, sample=sample, seed=seed,
+                         accept=self.__accepts)
+
+    def __accepts(self, elements: Iterable) -> bool:
+        return self.__allowed.issuperset(map(type, elements))
+
+    def __check(self, context: Context, index: int, value: Any) -> Any:
+        element_name = Deferred(self.__name_from, context, index)
+        return self.__just(value, name=element_name)
+
+    def __name_from(self, context: Context, index: int) -> str:
+        string, itertype = context.string, context.type_name
+        dicts = f'dict {string}' if context.name else string
+        named = f'{itertype} {context.name}' if context.name else string
+        if itertype == 'dict':
+            return f'key in dict {string}'
+        elif itertype in ('dict_keys', 'odict_keys'):
             return f'key in {dicts}'
-        elif self.__itertype in ('dict_values', 'odict_values'):
+        elif itertype in ('dict_values', 'odict_values'):
             return f'value in {dicts}'
-        elif self.__itertype in ('OrderedDict', 'defaultdict'):
+        elif itertype in ('OrderedDict', 'defaultdict'):
             return f'key in {named}'
-        elif self.__itertype == 'frozenset':
+        elif itertype == 'frozenset':
             return f'element in {named}'
-        elif self.__itertype == 'deque':
+        elif itertype == 'deque':
             return f'element{self.__string_for(index)} in {named}'
         return (f'element{self.__string_for(index)} in'
-                f' {self.__itertype} {self.__string}')
+                f' {itertype} {string}')
 
     @staticmethod
     def __string_for(index: int) -> str:
@@ -7,6 +7,14 @@ DOC_BODY = ('\n\n'
             'name : str, optional\n'
             '    Name of the variable to type-check the elements of.\n'
             '    Defaults to None.\n'
+            'sample : int, optional\n'
+            '    Maximum number of elements to check in sequences, always\n'
+            '    including the first and the last. Defaults to None, which\n'
+            '    checks all elements.\n'
+            'seed : optional\n'
+            '    Seed for choosing a `sample` of elements at random.\n'
+            '    Defaults to None, which spaces them evenly across the\n'
+            '    sequence.\n'
             '\n'
             'Returns\n'
             '-------\n'
@@ -17,6 +25,8 @@ DOC_BODY = ('\n\n'
             '----------\n'
             'types : tuple(type)\n'
             '    The type(s) to check for.\n'
+            'subclasses : bool\n'
+            '    Whether subclasses of `types` pass as well.\n'
             '\n'
             'Methods\n'
             '-------\n'
@@ -44,6 +54,8 @@ DOC_BODY = ('\n\n'
             'WrongTypeError\n'
             '    If the type of any element of `iterable` is not among the\n'
             '    allowed types.\n'
+            'ValueError\n'
+            '    If the `sample` size is not an integer larger than 1.\n'
             '\n'
             'See also\n'
             '--------\n'
@@ -1,6 +1,8 @@
-from ...functional import CompositionOf
+from ...functional.lazy import LazyComposition
+from ...functional.context import Context, Deferred
 from ...functional.mixins import CompositionClassMixin
 from ...validators.one import JustLen, NonEmpty
+from ...levels import LEVELS
 from ..one import JustDicts, Just
 from ..all import All
 
@@ -9,8 +11,8 @@ class Registrar(type):
     """Sets compositions of class with JustLen and NonEmpty as attributes."""
     def __init__(cls, class_name: str, bases, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
-        setattr(cls, 'JustLen', CompositionOf(cls, JustLen))
-        setattr(cls, 'NonEmpty', CompositionOf(cls, NonEmpty))
+        setattr(cls, 'JustLen', LazyComposition(JustLen))
+        setattr(cls, 'NonEmpty', LazyComposition(NonEmpty))
 
 
 class TypedDict(CompositionClassMixin, metaclass=Registrar):
@@ -62,8 +64,9 @@ class TypedDict(CompositionClassMixin, metaclass=Registrar):
     """
 
     def __new__(cls, mapping, name=None, *, keys=(), values=(), **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls.__string = cls.__name or str(mapping)
+        if LEVELS.off:
+            return mapping
+        context = Context(mapping, name)
         mapping = JustDicts(mapping, name=name)
         if keys and keys is not ...:
             AllKeys = All(keys, identifier='AllKeys')
@@ -71,6 +74,10 @@ class TypedDict(CompositionClassMixin, metaclass=Registrar):
         if values and values is not ...:
             JustValues = Just(values, identifier='JustValues')
             for key, value in mapping.items():
-                value_name = f'entry {key} in dict {cls.__string}'
+                value_name = Deferred(cls.__entry_name_from, context, key)
                 _ = JustValues(value, name=value_name)
         return mapping
+
+    @staticmethod
+    def __entry_name_from(context: Context, key) -> str:
+        return f'entry {key} in dict {context.string}'
@@ -2,6 +2,8 @@ from typing import Tuple, Union, Any, Sequence
 from collections import deque, defaultdict, OrderedDict
 from ...validators.one import JustLen
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context, Deferred
+from ...levels import LEVELS
 from ..one import Just
 
 dict_keys = type({}.keys())
@@ -65,16 +67,22 @@ class TypedTuple(CompositionClassMixin):
     """
 
     def __new__(cls, value: tuple, name=None, *, types=(), **kwargs) -> tuple:
-        cls.__name = str(name) if name is not None else ''
-        cls.__string = cls.__name or str(value)
+        if LEVELS.off:
+            return value
+        context = Context(value, name)
         types, length = cls.__valid(types)
         value = JustLen.JustTuple(value, name=name, length=length)
         for index, element in enumerate(value):
             if not cls.__is_or_contains_ellipsis(types[index]):
-                element_name = f'element {index} in tuple {cls.__string}'
+                element_name = Deferred(cls.__element_name_from,
+                                        context, index)
                 _ = Just(types[index])(element, name=element_name)
         return value
 
+    @staticmethod
+    def __element_name_from(context: Context, index: int) -> str:
+        return f'element {index} in tuple {context.string}'
+
     @classmethod
     def __valid(cls, types: Sequence[TypesT]) -> Tuple[TypesT, int]:
         if type(types) not in (tuple, list, deque):
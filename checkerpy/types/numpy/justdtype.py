@@ -2,9 +2,11 @@ import logging as log
 from typing import Tuple, Union, Iterable, Sequence, Any
 from collections import defaultdict, deque, OrderedDict
 from numpy import dtype
-from ...functional import CompositionOf
+from ...functional.lazy import LazyComposition
 from ...functional.mixins import CompositionMixin
+from ...functional.context import Context
 from ...exceptions import WrongTypeError, DtypeError
+from ...levels import LEVELS
 from .docstring import DOC_HEADER, DOC_BODY
 from .justndarray import JustNdarray
 
@@ -22,7 +24,14 @@ NAMED_TYPES = (frozenset, slice, range,
 TypesT = Union[type, Iterable[type]]
 
 
-class JustDtype(CompositionMixin):
+class Registrar(type):
+    """Sets lazy composition of instances and ndarray checker as attribute."""
+    def __init__(cls, class_name: str, bases, attributes: dict) -> None:
+        super().__init__(class_name, bases, attributes)
+        setattr(cls, 'JustNdarray', LazyComposition(JustNdarray, True))
+
+
+class JustDtype(CompositionMixin, metaclass=Registrar):
     """Class for easily defining dtype-checker objects for numpy arrays.
 
     Parameters
@@ -52,39 +61,41 @@ class JustDtype(CompositionMixin):
     """
 
     def __init__(self, *types: TypesT, identifier: str = 'JustD') -> None:
-        self.__name = None
         self.__dtypes = self.__registered(types)
         self.__name__ = self.__identified(identifier)
         self.__doc__ = self.__doc_string()
-        setattr(self, 'JustNdarray', CompositionOf(self, JustNdarray))
 
     @property
     def dtypes(self) -> Tuple[dtype, ...]:
         return self.__dtypes
 
     def __call__(self, value: Any, name: str = None, **kwargs):
-        self.__name = str(name) if name is not None else ''
+        if LEVELS.off:
+            return value
         try:
             value_dtype = value.dtype
         except AttributeError as error:
-            message = self.__has_no_dtype_message_for(value)
+            message = self.__has_no_dtype_message_for(Context(value, name))
             log.error(message)
             raise DtypeError(message) from error
         if value_dtype not in self.__dtypes:
-            message = self.__error_message_for(value, value_dtype.name)
+            context = Context(value, name)
+            message = self.__error_message_for(context, value_dtype.name)
             log.error(message)
             raise WrongTypeError(message)
         return value
 
-    def __has_no_dtype_message_for(self, value: Any) -> str:
-        if isinstance(value, NAMED_TYPES) and not self.__name:
-            variable = str(value)
+    @staticmethod
+    def __has_no_dtype_message_for(context: Context) -> str:
+        if isinstance(context.value, NAMED_TYPES) and not context.name:
+            variable = context.string
         else:
-            variable = f'{type(value).__name__} {self.__name or value}'
+            variable = f'{context.type_name} {context.string}'
         return f'{variable} has no attribute dtype!'
 
-    def __error_message_for(self, value: Any, value_type: str) -> str:
-        name = ' of '+self.__name if self.__name else ''
+    def __error_message_for(self, context: Context, value_type: str) -> str:
+        value = context.value
+        name = ' of '+context.name if context.name else ''
         dtypes = tuple(dtype_.name for dtype_ in self.__dtypes)
         of_type = dtypes[0] if len(dtypes) == 1 else f'one of {dtypes}'
         return f'Dtype{name} must be {of_type}, not {value_type} like {value}!'
@@ -17,6 +17,8 @@ DOC_BODY = ('\n\n'
             '----------\n'
             'types : tuple(type)\n'
             '    The type(s) to check for.\n'
+            'subclasses : bool\n'
+            '    Whether subclasses of `types` pass as well.\n'
             '\n'
             'Methods\n'
             '-------\n'
@@ -2,7 +2,10 @@ import logging as log
 from typing import Tuple, Union, Sequence, Iterable, Any
 from collections import defaultdict, deque, OrderedDict
 from ...functional.mixins import CompositionMixin
+from ...functional.context import Context
+from ...functional.typecache import TypeCache
 from ...exceptions import WrongTypeError
+from ...levels import LEVELS
 from .docstring import DOC_HEADER, DOC_BODY
 
 dict_keys = type({}.keys())
@@ -29,6 +32,9 @@ class Just(CompositionMixin):
     identifier : str, optional
         A valid python identifier as name of the type-checker object.
         Defaults to 'Just'.
+    subclasses : bool, optional
+        Whether instances of subclasses of the `types` to check for should
+        pass as well. Defaults to False.
 
     Raises
     ------
@@ -44,9 +50,12 @@ class Just(CompositionMixin):
 
     """
 
-    def __init__(self, *types: TypesT, identifier: str = 'Just') -> None:
-        self.__name = None
+    def __init__(self, *types: TypesT, identifier: str = 'Just',
+                 subclasses: bool = False) -> None:
         self.__types = self.__registered(types)
+        self.__allowed = frozenset(self.__types)
+        self.__subclasses = bool(subclasses)
+        self.__verdicts = TypeCache()
         self.__name__ = self.__identified(identifier)
         self.__doc__ = self.__doc_string()
 
@@ -54,23 +63,39 @@ class Just(CompositionMixin):
     def types(self) -> Tuple[type, ...]:
         return self.__types
 
+    @property
+    def subclasses(self) -> bool:
+        return self.__subclasses
+
     def __call__(self, value: Any, name: str = None, **kwargs):
-        self.__name = str(name) if name is not None else ''
-        if type(value) not in self.__types:
-            message = self.__error_message_for(value)
-            log.error(message)
-            raise WrongTypeError(message)
-        return value
-
-    def __error_message_for(self, value: Any) -> str:
+        type_of_value = type(value)
+        if type_of_value in self.__allowed or LEVELS.off:
+            return value
+        if self.__subclasses:
+            verdict = self.__verdicts.get(id(type_of_value))
+            if verdict is None:
+                verdict = self.__verdict_for(type_of_value)
+            if verdict:
+                return value
+        message = self.__error_message_for(Context(value, name))
+        log.error(message)
+        raise WrongTypeError(message)
+
+    def __verdict_for(self, type_of_value: type) -> bool:
+        verdict = issubclass(type_of_value, self.__types)
+        return self.__verdicts.add(type_of_value, verdict)
+
+    def __error_message_for(self, context: Context) -> str:
+        value = context.value
         if isinstance(value, NAMED_TYPES):
-            value_type = type(value).__name__
+            value_type = context.type_name
         else:
-            value_type = type(value).__name__ + f' like {value}'
-        name = ' of '+self.__name if self.__name else ''
+            value_type = context.type_name + f' like {value}'
+        name = ' of '+context.name if context.name else ''
         types = tuple(type_.__name__ for type_ in self.__types)
         of_type = types[0] if len(types) == 1 else f'one of {types}'
-        return f'Type{name} must be {of_type}, not {value_type}!'
+        subclass = ' (or a subclass)' if self.__subclasses else ''
+        return f'Type{name} must be {of_type}{subclass}, not {value_type}!'
 
     @staticmethod
     def __identified(identifier: str) -> str:
@@ -1,6 +1,7 @@
 from typing import Any, Tuple, Union, Iterable
 from ...functional.mixins import CompositionClassMixin
 from ...validators.one.has import Has
+from ...levels import LEVELS
 from .docstring import DOC_HEADER, DOC_BODY
 
 Attributes = Union[str, Iterable[str]]
@@ -30,6 +31,7 @@ class Like(CompositionClassMixin):
 
     def __init__(self, *attrs: Attributes, identifier: str = 'Like') -> None:
         self.__attrs = self.__registered(attrs)
+        self.__has = Has.bind(attr=self.__attrs)
         self.__name__ = self.__identified(identifier)
         self.__doc__ = self.__doc_string()
 
@@ -38,7 +40,9 @@ class Like(CompositionClassMixin):
         return self.__attrs
 
     def __call__(self, value: Any, name: str = None, **kwargs):
-        return Has(value, name=name, attr=self.__attrs)
+        if LEVELS.off:
+            return value
+        return self.__has(value, name)
 
     def __registered(self, attrs: Any) -> Tuple[str]:
         if not attrs:
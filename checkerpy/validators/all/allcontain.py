@@ -1,4 +1,6 @@
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context, Deferred
+from ...functional.iteration import check_all
 from ..one import Contains
 from .registrars import AllIterableRegistrar, DICT_PARTS
 
@@ -9,26 +11,28 @@ class AllContain(CompositionClassMixin, metaclass=AllIterableRegistrar):
     """
 
     def __new__(cls, iterable, name=None, *, each=(), asome=(), **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls._string = cls.__name or str(iterable)
-        cls._itertype = type(iterable).__name__
-        for index, value in cls._enumerate(iterable):
-            value_name = cls.__name_from(index)
-            _ = Contains(value, name=value_name, every=each, some=asome)
-        return iterable
+        context = Context(iterable, name)
+        return check_all(context, cls.__contain, each, asome)
 
     @classmethod
-    def __name_from(cls, index: int) -> str:
-        named = f'{cls._itertype} {cls.__name}' if cls.__name else cls._string
-        if cls._itertype == 'dict':
-            return f'in keys to dict {cls._string}'
-        elif cls._itertype in DICT_PARTS+('frozenset',):
+    def __contain(cls, context: Context, index: int, value, each, asome):
+        value_name = Deferred(cls.__name_from, context, index)
+        return Contains(value, name=value_name, every=each, some=asome)
+
+    @classmethod
+    def __name_from(cls, context: Context, index: int) -> str:
+        name, string = context.name, context.string
+        itertype = context.type_name
+        named = f'{itertype} {name}' if name else string
+        if itertype == 'dict':
+            return f'in keys to dict {string}'
+        elif itertype in DICT_PARTS+('frozenset',):
             return f'in {named}'
-        elif cls._itertype in ('OrderedDict', 'defaultdict'):
+        elif itertype in ('OrderedDict', 'defaultdict'):
             return f'in keys to {named}'
-        elif cls._itertype == 'deque':
+        elif itertype == 'deque':
             return f'{cls.__string_for(index)} in {named}'
-        return f'{cls.__string_for(index)} in {cls._itertype} {cls._string}'
+        return f'{cls.__string_for(index)} in {itertype} {string}'
 
     @staticmethod
     def __string_for(index: int) -> str:
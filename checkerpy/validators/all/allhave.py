@@ -1,5 +1,9 @@
-from typing import Any
+from typing import Any, Dict, Tuple
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context, Deferred
+from ...functional.iteration import check_all
+from ...functional.bound import Bound
+from ...levels import LEVELS
 from ..one import Has
 from .registrars import IterableRegistrar, DICT_PARTS
 
@@ -17,6 +21,12 @@ class AllHave(CompositionClassMixin, metaclass=IterableRegistrar):
     attrs : str, tuple(str), optional
         String or tuple of strings with the name(s) of the
         attributes to check for. Defaults to '__new__'.
+    sample : int, optional
+        Maximum number of elements to check in sequences, always including
+        the first and the last. Defaults to None, which checks all elements.
+    seed : optional
+        Seed for choosing a `sample` of elements at random. Defaults to None,
+        which spaces them evenly across the sequence.
 
     Returns
     -------
@@ -33,6 +43,10 @@ class AllHave(CompositionClassMixin, metaclass=IterableRegistrar):
 
     Notes
     -----
+    Which of the attributes to check for are provided by the type of the
+    elements to all of its instances is looked up only once per distinct
+    type of elements. Only the rest of them is looked for on every element.
+
     For convenience, type checkers for built-in iterables and an emptiness
     checker for `iterable` are attached as methods as well. If the optional
     argument `attrs` is specified in calls to these methods, it is passed
@@ -46,6 +60,8 @@ class AllHave(CompositionClassMixin, metaclass=IterableRegistrar):
     MissingAttrError
         If one of the elements in the iterable does not have (all of)
         the specified attribute(s).
+    ValueError
+        If the `sample` size is not an integer larger than 1.
 
     See Also
     --------
@@ -53,31 +69,47 @@ class AllHave(CompositionClassMixin, metaclass=IterableRegistrar):
 
     """
 
-    def __new__(cls, iterable, name: str = None, *, attrs='__new__', **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls._string = cls.__name or str(iterable)
-        cls._itertype = type(iterable).__name__
-        for index, value in cls._enumerate(iterable):
-            value_name = cls.__name_from(index, value)
-            _ = Has(value, name=value_name, attr=attrs)
-        return iterable
+    def __new__(cls, iterable, name: str = None, *, attrs='__new__',
+                sample: int = None, seed=None, **kwargs):
+        if LEVELS.off:
+            return iterable
+        has = Has.bind(attr=attrs)
+        context = Context(iterable, name)
+        return check_all(context, cls.__has, has, {},
+                         sample=sample, seed=seed)
+
+    @classmethod
+    def __has(cls, context: Context, index: int, value: Any,
+              has: Bound, unverified: Dict[type, Tuple[str, ...]]) -> Any:
+        type_of_value = type(value)
+        attrs = unverified.get(type_of_value)
+        if attrs is None:
+            attrs = Has._provided.unverified(type_of_value, *has.normalized)
+            unverified[type_of_value] = attrs
+        for attr in attrs:
+            if not hasattr(value, attr):
+                value_name = Deferred(cls.__name_from, context, index, value)
+                return has(value, value_name)
+        return value
 
     @classmethod
-    def __name_from(cls, index: int, value: Any) -> str:
-        named = f'{cls._itertype} {cls.__name}' if cls.__name else cls._string
-        if cls._itertype == 'dict':
-            return f'{value} in keys to dict {cls._string}'
-        elif cls._itertype in DICT_PARTS:
+    def __name_from(cls, context: Context, index: int, value: Any) -> str:
+        name, string = context.name, context.string
+        itertype = context.type_name
+        named = f'{itertype} {name}' if name else string
+        if itertype == 'dict':
+            return f'{value} in keys to dict {string}'
+        elif itertype in DICT_PARTS:
             return f'{value} in {named}'
-        elif cls._itertype in ('OrderedDict', 'defaultdict'):
+        elif itertype in ('OrderedDict', 'defaultdict'):
             return f'{value} in keys to {named}'
-        elif cls._itertype == 'frozenset':
+        elif itertype == 'frozenset':
             value = set(value) if type(value) is frozenset else value
             return f'{value} in {named}'
-        elif cls._itertype == 'deque':
+        elif itertype == 'deque':
             return f'{value}{cls.__string_for(index)} in {named}'
         return (f'{value}{cls.__string_for(index)} '
-                f'in {cls._itertype} {cls._string}')
+                f'in {itertype} {string}')
 
     @staticmethod
     def __string_for(index: int) -> str:
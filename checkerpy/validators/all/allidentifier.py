@@ -1,39 +1,131 @@
-from typing import Any
+from typing import Any, Iterable
+from keyword import iskeyword, kwlist
+from itertools import filterfalse
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context, Deferred
+from ...functional.iteration import check_all, CONTAINERS
+from ...functional.namecache import NameCache
+from ...levels import LEVELS
 from ..one import Identifier
 from .registrars import IterableRegistrar, DICT_PARTS
 
+KEYWORDS = frozenset(kwlist)
+
 
 class AllIdentifier(CompositionClassMixin, metaclass=IterableRegistrar):
-    """
+    """Checks if all elements of an iterable are valid python identifiers.
+
+    Parameters
+    ----------
+    iterable
+        The iterable for which to check if its elements are identifiers.
+    name : str, optional
+        The name of the variable to check the elements of. Defaults to None.
+    strict : bool, optional
+        Whether to reject python keywords as well, which are identifiers but
+        cannot be used as names of variables or attributes. Defaults to False.
+    cached : bool, optional
+        Whether to skip names that passed before and to remember those that
+        pass now in a bounded cache shared by all calls. Defaults to False.
+    sample : int, optional
+        Maximum number of elements to check in sequences, always including
+        the first and the last. Defaults to None, which checks all elements.
+    seed : optional
+        Seed for choosing a `sample` of elements at random. Defaults to None,
+        which spaces them evenly across the sequence.
+
+    Returns
+    -------
+    iterable
+        The `iterable` passed in.
+
+    Methods
+    -------
+    o(callable) : CompositionOf
+        Daisy-chains the identifier checker to another `callable`, returning
+        the functional composition of both. If `strict` or `cached` is
+        specified when calling the composition, it is passed through to the
+        identifier checker.
+
+    Notes
+    -----
+    For convenience, type checkers for built-in iterables and an emptiness
+    checker for `iterable` are attached as methods as well. If `strict` or
+    `cached` is specified in calls to these methods, it is passed through to
+    the identifier checker.
+
+    Elements of built-in containers are all checked at once, in a single
+    pass at C level. Only if that fails, they are checked one by one to find
+    the first element that is not an identifier.
+
+    Raises
+    ------
+    IterError
+        If the variable passed to the identifier checker is not an iterable.
+    IdentifierError
+        If any element of `iterable` is either not a string or not a valid
+        identifier or, in `strict` mode, a keyword.
+    ValueError
+        If the `sample` size is not an integer larger than 1.
+
+    See Also
+    --------
+    Identifier, CompositionOf
 
     """
 
-    def __new__(cls, iterable, name: str = None, *, attrs='__new__', **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls._string = cls.__name or str(iterable)
-        cls._itertype = type(iterable).__name__
-        for index, value in cls._enumerate(iterable):
-            value_name = cls.__name_from(index, value)
-            _ = Identifier(value, name=value_name)
-        return iterable
+    _verified = NameCache()
+
+    def __new__(cls, iterable, name: str = None, *, strict: bool = False,
+                cached: bool = False, sample: int = None, seed=None,
+                **kwargs):
+        if LEVELS.off:
+            return iterable
+        if sample is None and type(iterable) in CONTAINERS:
+            if cls.__accepts(iterable, strict, cached):
+                return iterable
+        return check_all(Context(iterable, name), cls.__identifier, strict,
+                         sample=sample, seed=seed)
+
+    @classmethod
+    def __accepts(cls, names: Iterable, strict: bool, cached: bool) -> bool:
+        if cached and cls._verified.knows(names):
+            return True
+        try:
+            if not all(map(str.isidentifier, names)):
+                return False
+        except TypeError:
+            return False
+        if strict and not KEYWORDS.isdisjoint(names):
+            return False
+        if cached:
+            cls._verified.add(filterfalse(iskeyword, names))
+        return True
+
+    @classmethod
+    def __identifier(cls, context: Context, index: int, value: Any,
+                     strict: bool) -> Any:
+        value_name = Deferred(cls.__name_from, context, index, value)
+        return Identifier(value, name=value_name, strict=strict)
 
     @classmethod
-    def __name_from(cls, index: int, value: Any) -> str:
-        named = f'{cls._itertype} {cls.__name}' if cls.__name else cls._string
-        if cls._itertype == 'dict':
-            return f'{value} in keys to dict {cls._string}'
-        elif cls._itertype in DICT_PARTS:
+    def __name_from(cls, context: Context, index: int, value: Any) -> str:
+        name, string = context.name, context.string
+        itertype = context.type_name
+        named = f'{itertype} {name}' if name else string
+        if itertype == 'dict':
+            return f'{value} in keys to dict {string}'
+        elif itertype in DICT_PARTS:
             return f'{value} in {named}'
-        elif cls._itertype in ('OrderedDict', 'defaultdict'):
+        elif itertype in ('OrderedDict', 'defaultdict'):
             return f'{value} in keys to {named}'
-        elif cls._itertype == 'frozenset':
+        elif itertype == 'frozenset':
             value = set(value) if type(value) is frozenset else value
             return f'{value} in {named}'
-        elif cls._itertype == 'deque':
+        elif itertype == 'deque':
             return f'{value}{cls.__string_for(index)} in {named}'
         return (f'{value}{cls.__string_for(index)} '
-                f'in {cls._itertype} {cls._string}')
+                f'in {itertype} {string}')
 
     @staticmethod
     def __string_for(index: int) -> str:
@@ -1,8 +1,14 @@
-from typing import Any
+from typing import Any, Iterable, Union
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context, Deferred
+from ...functional.iteration import check_all, CONTAINERS
+from ...functional.bound import Bound
+from ...levels import LEVELS
 from ..one import JustLen
 from .registrars import AllIterableRegistrar
 
+Lengths = Union[frozenset, range]
+
 
 class AllLen(CompositionClassMixin, metaclass=AllIterableRegistrar):
     """Checks if all elements of an iterable have one of the specified lengths.
@@ -14,8 +20,22 @@ class AllLen(CompositionClassMixin, metaclass=AllIterableRegistrar):
     name : str, optional
         The name of the variable to check the length of the elements of.
         Defaults to None.
-    alen : int, tuple(int)
+    alen : int, tuple(int), range, optional
         One or more lengths that all elements of `iterable` should have.
+        Defaults to None, in which case `amin_len` and/or `amax_len` must be
+        given instead.
+    amin_len : int, optional
+        Minimum length that all elements of `iterable` should have.
+        Defaults to None.
+    amax_len : int, optional
+        Maximum length that all elements of `iterable` should have.
+        Defaults to None.
+    sample : int, optional
+        Maximum number of elements to check in sequences, always including
+        the first and the last. Defaults to None, which checks all elements.
+    seed : optional
+        Seed for choosing a `sample` of elements at random. Defaults to None,
+        which spaces them evenly across the sequence.
 
     Returns
     -------
@@ -37,15 +57,29 @@ class AllLen(CompositionClassMixin, metaclass=AllIterableRegistrar):
     argument `alen` is specified in calls to these methods, it is passed
     through to the length checker.
 
+    Allowed lengths are validated only once per call and checked in constant
+    time, no matter how many lengths are allowed, by hashing them or, if
+    given as a range or as `amin_len` and/or `amax_len`, by arithmetic. The
+    lengths of all elements of built-in containers are collected at once, in
+    a single pass at C level, such that only distinct lengths are checked.
+    Only if that fails, elements are checked one by one to find the first
+    element that does not have an allowed length.
+
     Raises
     ------
     IntError
         If the specified length(s) cannot be converted to required type int.
+    TypeError
+        If neither `alen` nor `amin_len` or `amax_len` are specified.
     IterError
         If the variable passed to the length checker is not an iterable.
     LenError
         If the length of any element of `iterable` can either not be determined
         or is not among the allowed lengths.
+    ValueError
+        If the `sample` size is not an integer larger than 1, if `alen` is
+        specified together with `amin_len` and/or `amax_len`, if `alen` is
+        an empty range, or if `amin_len` exceeds `amax_len`.
 
     See Also
     --------
@@ -53,36 +87,64 @@ class AllLen(CompositionClassMixin, metaclass=AllIterableRegistrar):
 
     """
 
-    def __new__(cls, iterable, name: str = None, *, alen: int, **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls._string = cls.__name or str(iterable)
-        cls._itertype = type(iterable).__name__
-        for index, value in cls._enumerate(iterable):
-            value_name = cls.__name_from(index, value)
-            _ = JustLen(value, name=value_name, length=alen)
-        return iterable
+    def __new__(cls, iterable, name: str = None, *, alen=None,
+                amin_len: int = None, amax_len: int = None,
+                sample: int = None, seed=None, **kwargs):
+        if LEVELS.off:
+            return iterable
+        just_len = JustLen.bind(length=alen, min_len=amin_len,
+                                max_len=amax_len)
+        lengths, = just_len.normalized
+        if type(lengths) is not range:
+            lengths = frozenset(lengths)
+        if sample is None and type(iterable) in CONTAINERS:
+            if cls.__accepts(iterable, lengths):
+                return iterable
+        context = Context(iterable, name)
+        return check_all(context, cls.__just_len, just_len, lengths,
+                         sample=sample, seed=seed)
+
+    @staticmethod
+    def __accepts(iterable: Iterable, lengths: Lengths) -> bool:
+        try:
+            return all(map(lengths.__contains__, set(map(len, iterable))))
+        except TypeError:
+            return False
+
+    @classmethod
+    def __just_len(cls, context: Context, index: int, value,
+                   just_len: Bound, lengths: Lengths):
+        try:
+            if len(value) in lengths:
+                return value
+        except TypeError:
+            pass
+        value_name = Deferred(cls.__name_from, context, index, value)
+        return just_len(value, value_name)
 
     @classmethod
-    def __name_from(cls, index: int, value: Any) -> str:
-        dicts = f'dict {cls._string}' if cls.__name else cls._string
-        named = f'{cls._itertype} {cls.__name}' if cls.__name else cls._string
-        if cls._itertype == 'dict':
-            return f'key {value} in dict {cls._string}'
-        elif cls._itertype in ('dict_keys', 'odict_keys'):
+    def __name_from(cls, context: Context, index: int, value: Any) -> str:
+        name, string = context.name, context.string
+        itertype = context.type_name
+        dicts = f'dict {string}' if name else string
+        named = f'{itertype} {name}' if name else string
+        if itertype == 'dict':
+            return f'key {value} in dict {string}'
+        elif itertype in ('dict_keys', 'odict_keys'):
             return f'key {value} in {dicts}'
-        elif cls._itertype in ('dict_values', 'odict_values'):
+        elif itertype in ('dict_values', 'odict_values'):
             return f'value {value} in {dicts}'
-        elif cls._itertype in ('dict_items', 'odict_items'):
+        elif itertype in ('dict_items', 'odict_items'):
             return f'item {value} in {dicts}'
-        elif cls._itertype in ('OrderedDict', 'defaultdict'):
+        elif itertype in ('OrderedDict', 'defaultdict'):
             return f'key {value} in {named}'
-        elif cls._itertype == 'frozenset':
+        elif itertype == 'frozenset':
             value = set(value) if type(value) is frozenset else value
             return f'{value} in {named}'
-        elif cls._itertype == 'deque':
+        elif itertype == 'deque':
             return f'{value}{cls.__string_for(index)} in {named}'
         return (f'{value}{cls.__string_for(index)} '
-                f'in {cls._itertype} {cls._string}')
+                f'in {itertype} {string}')
 
     @staticmethod
     def __string_for(index: int) -> str:
@@ -1,5 +1,6 @@
 from ...functional.mixins import CompositionClassMixin
-from ..one import Limited
+from ...levels import LEVELS
+from ..one.interval import interval_for
 from .registrars import AllComparableRegistrar
 
 
@@ -16,6 +17,12 @@ class AllLimited(CompositionClassMixin, metaclass=AllComparableRegistrar):
         Lower bound for all elements of `iterable`. Defaults to Ellipsis.
     ahi : optional
         Upper bound for all elements of `iterable`. Defaults to Ellipsis.
+    sample : int, optional
+        Maximum number of elements to check in sequences, always including
+        the first and the last. Defaults to None, which checks all elements.
+    seed : optional
+        Seed for choosing a `sample` of elements at random. Defaults to None,
+        which spaces them evenly across the sequence.
 
     Returns
     -------
@@ -37,6 +44,13 @@ class AllLimited(CompositionClassMixin, metaclass=AllComparableRegistrar):
     `alo` and/or `ahi` is specified in calls to these methods, it (or they)
     are passed through to the limits checker.
 
+    Numpy arrays of booleans or numbers (of any shape) are checked against
+    numeric limits all at once, with a single reduction, and always in full.
+    Built-in containers of numbers, strings, or bytes are reduced with `min`
+    and/or `max` before elements are compared to limits one by one, which
+    is then only needed to find the first element that lies outside. NaNs
+    never lie outside limits, just as they do not for `Limited`.
+
     Raises
     ------
     IterError
@@ -46,44 +60,18 @@ class AllLimited(CompositionClassMixin, metaclass=AllComparableRegistrar):
     LimitError
         If any of the elements of `iterable` lie on the wrong side or outside
         the respective limit(s).
+    ValueError
+        If the `sample` size is not an integer larger than 1.
 
     See Also
     --------
-    Limited, CompositionOf
+    Limited, Interval, CompositionOf
 
     """
 
-    def __new__(cls, iterable, name=None, *, alo=..., ahi=..., **kwargs):
-        cls._name = str(name) if name is not None else ''
-        cls._string = cls._name or str(iterable)
-        cls._itertype = type(iterable).__name__
-        for index, value in cls._enumerate(iterable):
-            value_name = cls.__name_from(index)
-            _ = Limited(value, name=value_name, lo=alo, hi=ahi)
-        return iterable
-
-    @classmethod
-    def __name_from(cls, index: int) -> str:
-        named = f'{cls._itertype} {cls._name}' if cls._name else cls._string
-        if cls._itertype == 'dict':
-            return f'key in dict {cls._string}'
-        elif cls._itertype in ('dict_keys', 'odict_keys'):
-            return f'key in dict {cls._string}' if cls._name else cls._string
-        elif cls._itertype in ('dict_values', 'odict_values'):
-            return f'dict value in {cls._string}' if cls._name else cls._string
-        elif cls._itertype in ('dict_items', 'odict_items'):
-            return f'item in dict {cls._string}' if cls._name else cls._string
-        elif cls._itertype in ('OrderedDict', 'defaultdict'):
-            return f'key in {named}'
-        elif cls._itertype == 'frozenset':
-            return f'element in {named}'
-        elif cls._itertype == 'deque':
-            return f'{named} at index {index}'
-        prefix, postfix = cls.__fixes_for(index)
-        return f'{prefix}{cls._itertype} {cls._string}{postfix}'
-
-    @staticmethod
-    def __fixes_for(index: int) -> (str, str):
-        prefix = '' if index >= 0 else 'element in '
-        postfix = f' at index {index}' if index >= 0 else ''
-        return prefix, postfix
+    def __new__(cls, iterable, name=None, *, alo=..., ahi=...,
+                sample: int = None, seed=None, **kwargs):
+        if LEVELS.off:
+            return iterable
+        interval = interval_for(alo, ahi)
+        return interval.check_many(iterable, name, sample=sample, seed=seed)
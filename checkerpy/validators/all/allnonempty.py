@@ -1,4 +1,6 @@
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context, Deferred
+from ...functional.iteration import check_all
 from ..one import NonEmpty
 from .registrars import AllIterableRegistrar
 
@@ -45,30 +47,32 @@ class AllNonEmpty(CompositionClassMixin, metaclass=AllIterableRegistrar):
     """
 
     def __new__(cls, iterable, name: str = None, **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls._string = cls.__name or str(iterable)
-        cls._itertype = type(iterable).__name__
-        for index, value in cls._enumerate(iterable):
-            _ = NonEmpty(value, name=cls.__name_from(index))
-        return iterable
+        return check_all(Context(iterable, name), cls.__non_empty)
 
     @classmethod
-    def __name_from(cls, index: int) -> str:
-        dicts = f'dict {cls._string}' if cls.__name else cls._string
-        named = f'{cls._itertype} {cls.__name}' if cls.__name else cls._string
-        if cls._itertype == 'dict':
-            return f'key in dict {cls._string}'
-        if cls._itertype in ('dict_keys', 'odict_keys'):
+    def __non_empty(cls, context: Context, index: int, value):
+        value_name = Deferred(cls.__name_from, context, index)
+        return NonEmpty(value, name=value_name)
+
+    @classmethod
+    def __name_from(cls, context: Context, index: int) -> str:
+        name, string = context.name, context.string
+        itertype = context.type_name
+        dicts = f'dict {string}' if name else string
+        named = f'{itertype} {name}' if name else string
+        if itertype == 'dict':
+            return f'key in dict {string}'
+        if itertype in ('dict_keys', 'odict_keys'):
             return f'key in {dicts}'
-        elif cls._itertype in ('dict_values', 'odict_values'):
+        elif itertype in ('dict_values', 'odict_values'):
             return f'value in {dicts}'
-        elif cls._itertype in ('OrderedDict', 'defaultdict'):
+        elif itertype in ('OrderedDict', 'defaultdict'):
             return f'key in {named}'
-        elif cls._itertype == 'frozenset':
+        elif itertype == 'frozenset':
             return f'{cls.__string_for(index)}in {named}'
-        elif cls._itertype == 'deque':
+        elif itertype == 'deque':
             return f'{cls.__string_for(index)}in {named}'
-        return f'{cls.__string_for(index)}in {cls._itertype} {cls._string}'
+        return f'{cls.__string_for(index)}in {itertype} {string}'
 
     @staticmethod
     def __string_for(index: int) -> str:
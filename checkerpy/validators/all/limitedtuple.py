@@ -2,7 +2,11 @@ from typing import Tuple, Any, Sequence
 from collections import deque
 from .registrars import CustomRegistrar, NAMED_TYPES
 from ...functional.mixins import CompositionClassMixin
-from ...validators.one import JustLen, Limited
+from ...functional.context import Context, Deferred
+from ...functional.bound import Bound
+from ...types.one import JustTuple
+from ...validators.one import JustLen, Interval
+from ...levels import LEVELS
 
 Limits = Sequence[Tuple[Any, Any]]
 
@@ -29,6 +33,9 @@ class LimitedTuple(CompositionClassMixin, metaclass=CustomRegistrar):
 
     Methods
     -------
+    bind(limits) : Bound
+        Validates the specified limits once and returns a callable that only
+        checks the tuple passed to it.
     o(callable) : CompositionOf
         Daisy-chains the tuple length and value checker to another `callable`,
         returning the functional composition of both. The argument `limits` is
@@ -62,18 +69,57 @@ class LimitedTuple(CompositionClassMixin, metaclass=CustomRegistrar):
     """
 
     def __new__(cls, value: tuple, name=None, *, limits=(), **kwargs) -> tuple:
-        cls.__name = str(name) if name is not None else ''
-        cls.__string = cls.__name or str(value)
-        limits, length = cls.__valid(limits)
-        value = JustLen.JustTuple(value, name=name, length=length)
+        if LEVELS.off:
+            return value
+        intervals, length = cls.__valid(limits)
+        return cls.__check(value, name, intervals,
+                           JustLen.bind(length=length))
+
+    @classmethod
+    def bind(cls, *, limits=()) -> Bound:
+        """Validates limits once, returning a checker for just the tuple.
+
+        Parameters
+        ----------
+        limits : tuple(tuple(lo, hi))
+            Tuple of the length to check for containing 2-tuples of limits
+            (lo and hi) for each element.
+
+        Returns
+        -------
+        Bound
+            Callable that checks the length and the element values of a
+            tuple, with an optional name, against the limits bound to it.
+
+        Raises
+        ------
+        TypeError
+            If `limits` is not a tuple or any of its elements are not tuples.
+        ValueError
+            If one or more of the tuples specifying limits are not of
+            length 2.
+
+        """
+        intervals, length = cls.__valid(limits)
+        return Bound(cls, cls.__check, {'limits': limits}, intervals,
+                     JustLen.bind(length=length))
+
+    @classmethod
+    def __check(cls, value: tuple, name, intervals: Tuple[Interval, ...],
+                just_len: Bound) -> tuple:
+        context = Context(value, name)
+        value = just_len(JustTuple(value, name=name), name)
         for index, element in enumerate(value):
-            element_name = f'element {index} in tuple {cls.__string}'
-            lo, hi = limits[index]
-            _ = Limited(element, name=element_name, lo=lo, hi=hi)
+            element_name = Deferred(cls.__element_name_from, context, index)
+            _ = intervals[index](element, element_name)
         return value
 
+    @staticmethod
+    def __element_name_from(context: Context, index: int) -> str:
+        return f'element {index} in tuple {context.string}'
+
     @classmethod
-    def __valid(cls, limits: Limits) -> Tuple[Limits, int]:
+    def __valid(cls, limits: Limits) -> Tuple[Tuple[Interval, ...], int]:
         if type(limits) not in (tuple, list, deque):
             message = f'Type of limits {cls.__is_wrong(limits)}!'
             raise TypeError(message)
@@ -89,7 +135,7 @@ class LimitedTuple(CompositionClassMixin, metaclass=CustomRegistrar):
                 message = ('There must be exactly 2 limits (lo and hi) for'
                            f' argument {index}, not {length_of_limit}!')
                 raise ValueError(message)
-        return tuple(limits), len(limits)
+        return tuple(Interval(*limit) for limit in limits), len(limits)
 
     @staticmethod
     def __is_wrong(limits: Limits) -> str:
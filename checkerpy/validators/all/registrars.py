@@ -1,11 +1,9 @@
-import logging as log
-from typing import Tuple, Any
+from typing import Tuple
 from collections import deque, defaultdict, OrderedDict
 from ...types.one import _REDUCED_ITER, JustStr
 from ...types.all import _ALL_ITERABLES, _ALL_COMPARABLES
 from ...types.weak import _LIKE_ITERABLES
-from ...functional import CompositionOf
-from ...exceptions import IterError
+from ...functional.lazy import LazyComposition
 from ..one import NonEmpty, JustLen
 
 dict_keys = type({}.keys())
@@ -21,7 +19,6 @@ NAMED_TYPES = (frozenset, slice, range,
 DICT_PARTS = ('dict_keys', 'dict_values', 'dict_items',
               'odict_items', 'odict_keys', 'odict_values')
 Types = Tuple[type, ...]
-EnumeratedT = Tuple[Tuple[int, Any], ...]
 
 
 class IterableRegistrar(type):
@@ -29,28 +26,11 @@ class IterableRegistrar(type):
     def __init__(cls, class_name: str, bases: Types, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
         for iterable in _REDUCED_ITER:
-            setattr(cls, iterable.__name__, CompositionOf(cls, iterable))
+            setattr(cls, iterable.__name__, LazyComposition(iterable))
         for iterable in _LIKE_ITERABLES:
-            setattr(cls, iterable.__name__, CompositionOf(cls, iterable))
-        setattr(cls, 'NonEmpty', CompositionOf(cls, NonEmpty))
-        setattr(cls, 'JustLen', CompositionOf(cls, JustLen))
-
-    def _not_an_iterable_message(cls) -> str:
-        return (f'Variable {cls._string} with type {cls._itertype} does'
-                ' not seem to be an iterable with elements to inspect!')
-
-    def _enumerate(cls, iterable: Any) -> EnumeratedT:
-        try:
-            if hasattr(iterable, 'index') and hasattr(iterable, 'count'):
-                enumerated = tuple(enumerate(iterable))
-            else:
-                indices = (-1 for _ in range(len(iterable)))
-                enumerated = tuple(zip(indices, iterable))
-        except TypeError as error:
-            message = cls._not_an_iterable_message()
-            log.error(message)
-            raise IterError(message) from error
-        return enumerated
+            setattr(cls, iterable.__name__, LazyComposition(iterable))
+        setattr(cls, 'NonEmpty', LazyComposition(NonEmpty))
+        setattr(cls, 'JustLen', LazyComposition(JustLen))
 
 
 class AllIterableRegistrar(IterableRegistrar):
@@ -58,16 +38,16 @@ class AllIterableRegistrar(IterableRegistrar):
     def __init__(cls, class_name: str, bases: Types, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
         for iterable in _ALL_ITERABLES:
-            setattr(cls, iterable.__name__, CompositionOf(cls, iterable))
+            setattr(cls, iterable.__name__, LazyComposition(iterable))
 
 
 class AllComparableRegistrar(IterableRegistrar):
     """Set compositions of class and all-comparable type checkers as attr's."""
     def __init__(cls, class_name: str, bases: Types, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
-        setattr(cls, 'JustStr', CompositionOf(cls, JustStr))
+        setattr(cls, 'JustStr', LazyComposition(JustStr))
         for comparable in _ALL_COMPARABLES:
-            setattr(cls, comparable.__name__, CompositionOf(cls, comparable))
+            setattr(cls, comparable.__name__, LazyComposition(comparable))
 
 
 class CustomRegistrar(type):
@@ -75,5 +55,5 @@ class CustomRegistrar(type):
     def __init__(cls, class_name: str, bases: Types, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
         for comparable in _ALL_COMPARABLES:
-            setattr(cls, comparable.__name__, CompositionOf(cls, comparable))
+            setattr(cls, comparable.__name__, LazyComposition(comparable))
         delattr(cls, 'TypedDict')
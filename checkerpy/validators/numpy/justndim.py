@@ -3,7 +3,9 @@ from typing import Any
 from numpy import ndarray
 from .registrar import Registrar, NAMED_TYPES
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
 from ...exceptions import IntError, NdimError
+from ...levels import LEVELS
 
 
 class JustNdim(CompositionClassMixin, metaclass=Registrar):
@@ -54,17 +56,19 @@ class JustNdim(CompositionClassMixin, metaclass=Registrar):
     """
 
     def __new__(cls, array: ndarray, name: str = None, *, ndim=1, **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls.__string = name or str(array)
-        cls.__ndims = cls.__valid(ndim)
+        if LEVELS.off:
+            return array
+        ndims = cls.__valid(ndim)
         try:
             array_ndim = array.ndim
         except AttributeError as error:
-            message = cls.__has_no_ndim_message_for(array)
+            context = Context(array, name)
+            message = cls.__has_no_ndim_message_for(context)
             log.error(message)
             raise NdimError(message) from error
-        if array_ndim not in cls.__ndims:
-            message = cls.__error_message_for(array_ndim)
+        if array_ndim not in ndims:
+            context = Context(array, name)
+            message = cls.__error_message_for(context, array_ndim, ndims)
             log.error(message)
             raise NdimError(message)
         return array
@@ -95,20 +99,20 @@ class JustNdim(CompositionClassMixin, metaclass=Registrar):
         return (f'Could not convert given ndim {ndim}'
                 f'{with_type} to required type int!')
 
-    @classmethod
-    def __has_no_ndim_message_for(cls, array: Any) -> str:
-        if isinstance(array, NAMED_TYPES) and not cls.__name:
+    @staticmethod
+    def __has_no_ndim_message_for(context: Context) -> str:
+        if isinstance(context.value, NAMED_TYPES) and not context.name:
             type_of = ''
         else:
-            type_of = type(array).__name__ + ' '
+            type_of = context.type_name + ' '
         return (f'Cannot determine the number of dimensions of {type_of}'
-                f'{cls.__string} because it has no attribute ndim!')
+                f'{context.string} because it has no attribute ndim!')
 
-    @classmethod
-    def __error_message_for(cls, ndim: int) -> str:
-        if len(cls.__ndims) == 1:
-            of_ndims = cls.__ndims[0]
+    @staticmethod
+    def __error_message_for(context: Context, ndim: int, ndims) -> str:
+        if len(ndims) == 1:
+            of_ndims = ndims[0]
         else:
-            of_ndims = f'one of {cls.__ndims}'
-        return (f'The number of dimensions of array {cls.__string}'
+            of_ndims = f'one of {ndims}'
+        return (f'The number of dimensions of array {context.string}'
                 f' must be {of_ndims}, not {ndim}!')
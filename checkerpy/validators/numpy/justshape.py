@@ -4,7 +4,10 @@ from collections import deque
 from numpy import ndarray
 from .registrar import Registrar
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
+from ...functional.bound import Bound
 from ...exceptions import ShapeError, IntError
+from ...levels import LEVELS
 
 Shape = Union[tuple, list, deque]
 
@@ -28,6 +31,9 @@ class JustShape(CompositionClassMixin, metaclass=Registrar):
 
     Methods
     -------
+    bind(shape) : Bound
+        Validates the specified shape(s) once and returns a callable that only
+        checks the array passed to it.
     o(callable) : CompositionOf
         Daisy-chains the shape checker to another `callable`, returning the
         functional composition of both. If the optional argument `shape` is
@@ -67,22 +73,56 @@ class JustShape(CompositionClassMixin, metaclass=Registrar):
     """
 
     def __new__(cls, array: ndarray, name=None, *, shape=(...,), **kwargs):
-        name = str(name) if name is not None else ''
-        cls.__string = name or str(array)
-        cls.__shapes = cls.__validated(shape)
-        ndims = [len(shape) for shape in cls.__shapes]
+        if LEVELS.off:
+            return array
+        shapes = cls.__validated(shape)
+        return cls.__check(array, name, shapes, cls.__ndims_of(shapes))
+
+    @classmethod
+    def bind(cls, *, shape=(...,)) -> Bound:
+        """Validates shapes once, returning a checker for just the array.
+
+        Parameters
+        ----------
+        shape : tuple(int), list(tuple(int)), optional
+            The allowed shape(s) that arrays can have. Defaults to (...,)
+
+        Returns
+        -------
+        Bound
+            Callable that checks the shape of an array, with an optional
+            name, against the shape(s) bound to it.
+
+        Raises
+        ------
+        IntError
+            If the specified shape(s) cannot be converted to tuple(s) of
+            integers.
+        ShapeError
+            If the `shape` argument is not a tuple or list.
+
+        """
+        shapes = cls.__validated(shape)
+        return Bound(cls, cls.__check, {'shape': shape}, shapes,
+                     cls.__ndims_of(shapes))
+
+    @classmethod
+    def __check(cls, array: ndarray, name, shapes: tuple,
+                ndims: tuple) -> ndarray:
         try:
             array_shape = array.shape
         except AttributeError as error:
-            message = cls.__has_no_shape_message_for(array)
+            message = cls.__has_no_shape_message_for(Context(array, name))
             log.error(message)
             raise ShapeError(message) from error
         array_ndim = len(array_shape)
         ok_indices = [i for i, ndim in enumerate(ndims) if ndim == array_ndim]
-        possible_shapes = [cls.__shapes[index] for index in ok_indices]
+        possible_shapes = [shapes[index] for index in ok_indices]
         has_permitted_shape = cls.__compare(array_shape, possible_shapes)
         if not has_permitted_shape:
-            message = cls.__wrong_shape_message_for(array_shape)
+            context = Context(array, name)
+            message = cls.__wrong_shape_message_for(context, array_shape,
+                                                    shapes)
             log.error(message)
             raise ShapeError(message)
         return array
@@ -99,6 +139,10 @@ class JustShape(CompositionClassMixin, metaclass=Registrar):
             shapes = map(cls.__type_converted, shapes)
         return tuple(shapes)
 
+    @staticmethod
+    def __ndims_of(shapes: tuple) -> tuple:
+        return tuple(len(shape) for shape in shapes)
+
     @classmethod
     def __type_converted(cls, shape: Shape) -> tuple:
         list_shape = list(shape)
@@ -133,17 +177,17 @@ class JustShape(CompositionClassMixin, metaclass=Registrar):
         return ('Shape argument must be either a single tuple or a list of'
                 f' tuples of integers, not {type_of_value} like {value}!')
 
-    @classmethod
-    def __has_no_shape_message_for(cls, variable: Any) -> str:
-        variable_type = type(variable).__name__
-        return (f'Cannot determine shape of variable {cls.__string} with '
+    @staticmethod
+    def __has_no_shape_message_for(context: Context) -> str:
+        variable_type = context.type_name
+        return (f'Cannot determine shape of variable {context.string} with '
                 f'type {variable_type} because it has no attribute shape!')
 
-    @classmethod
-    def __wrong_shape_message_for(cls, array_shape: tuple) -> str:
-        if len(cls.__shapes) == 1:
-            of_shape = cls.__shapes[0]
+    @staticmethod
+    def __wrong_shape_message_for(context: Context, shape, shapes) -> str:
+        if len(shapes) == 1:
+            of_shape = shapes[0]
         else:
-            of_shape = f'one of {cls.__shapes}'
-        return (f'Shape of array {cls.__string} must'
-                f' be {of_shape}, not {array_shape}!')
+            of_shape = f'one of {shapes}'
+        return (f'Shape of array {context.string} must'
+                f' be {of_shape}, not {shape}!')
@@ -3,7 +3,9 @@ from typing import Any
 from numpy import ndarray
 from .registrar import Registrar, NAMED_TYPES
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
 from ...exceptions import IntError, SizeError
+from ...levels import LEVELS
 
 
 class JustSize(CompositionClassMixin, metaclass=Registrar):
@@ -54,17 +56,19 @@ class JustSize(CompositionClassMixin, metaclass=Registrar):
     """
 
     def __new__(cls, array: ndarray, name: str = None, *, size=1, **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls.__string = name or str(array)
-        cls.__sizes = cls.__valid(size)
+        if LEVELS.off:
+            return array
+        sizes = cls.__valid(size)
         try:
             array_size = array.size
         except AttributeError as error:
-            message = cls.__has_no_size_message_for(array)
+            context = Context(array, name)
+            message = cls.__has_no_size_message_for(context)
             log.error(message)
             raise SizeError(message) from error
-        if array_size not in cls.__sizes:
-            message = cls.__error_message_for(array_size)
+        if array_size not in sizes:
+            context = Context(array, name)
+            message = cls.__error_message_for(context, array_size, sizes)
             log.error(message)
             raise SizeError(message)
         return array
@@ -95,20 +99,20 @@ class JustSize(CompositionClassMixin, metaclass=Registrar):
         return (f'Could not convert given size {size}'
                 f'{with_type} to required type int!')
 
-    @classmethod
-    def __has_no_size_message_for(cls, array: Any) -> str:
-        if isinstance(array, NAMED_TYPES) and not cls.__name:
+    @staticmethod
+    def __has_no_size_message_for(context: Context) -> str:
+        if isinstance(context.value, NAMED_TYPES) and not context.name:
             type_of = ''
         else:
-            type_of = type(array).__name__ + ' '
+            type_of = context.type_name + ' '
         return (f'Cannot determine the number of elements in {type_of}'
-                f'{cls.__string} because it has no attribute size!')
+                f'{context.string} because it has no attribute size!')
 
-    @classmethod
-    def __error_message_for(cls, size: int) -> str:
-        if len(cls.__sizes) == 1:
-            of_sizes = cls.__sizes[0]
+    @staticmethod
+    def __error_message_for(context: Context, size: int, sizes) -> str:
+        if len(sizes) == 1:
+            of_sizes = sizes[0]
         else:
-            of_sizes = f'one of {cls.__sizes}'
-        return (f'The number of elements in array {cls.__string}'
+            of_sizes = f'one of {sizes}'
+        return (f'The number of elements in array {context.string}'
                 f' must be {of_sizes}, not {size}!')
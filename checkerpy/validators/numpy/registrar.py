@@ -1,6 +1,6 @@
 from typing import Tuple
 from collections import defaultdict, deque, OrderedDict
-from ...functional import CompositionOf
+from ...functional.lazy import LazyComposition
 from ...types.numpy import _NUMPY_TYPES
 
 dict_keys = type({}.keys())
@@ -22,4 +22,4 @@ class Registrar(type):
     def __init__(cls, class_name: str, bases: Types, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
         for np_type in _NUMPY_TYPES:
-            setattr(cls, np_type.__name__, CompositionOf(cls, np_type))
+            setattr(cls, np_type.__name__, LazyComposition(np_type))
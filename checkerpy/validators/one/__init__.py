@@ -1,4 +1,5 @@
 from .nonempty import NonEmpty
+from .interval import Interval
 from .limited import Limited
 from .justlen import JustLen
 from .oneof import OneOf
@@ -7,6 +8,6 @@ from .identifier import Identifier
 from .contains import Contains
 from .has import Has
 
-__all__ = ['NonEmpty', 'Limited', 'JustLen', 'OneOf', 'JustCall',
-           'Identifier', 'Contains', 'Has']
+__all__ = ['NonEmpty', 'Interval', 'Limited', 'JustLen', 'OneOf',
+           'JustCall', 'Identifier', 'Contains', 'Has']
 
@@ -1,10 +1,18 @@
 import logging as log
-from typing import Collection, Tuple, Union
+from collections import deque
+from typing import Collection, Optional, Tuple, Union
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
+from ...functional.bound import Bound
 from ...exceptions import ItemError, IterError
+from ...levels import LEVELS
 from .registrars import ContainerRegistrar, NAMED_TYPES
 
 ItemsT = Union[Collection, Tuple[str, ...]]
+Found = Tuple[tuple, bool]
+SCANNED = (list, tuple, deque)
+LARGE = 64
+MANY = 8
 
 
 class Contains(CompositionClassMixin, metaclass=ContainerRegistrar):
@@ -30,6 +38,9 @@ class Contains(CompositionClassMixin, metaclass=ContainerRegistrar):
 
     Methods
     -------
+    bind(every, some) : Bound
+        Validates the specified item(s) once and returns a callable that only
+        checks the iterable passed to it.
     o(callable) : CompositionOf
         Daisy-chains the value checker to another `callable`, returning the
         functional composition of both. If any of the optional arguments
@@ -38,6 +49,12 @@ class Contains(CompositionClassMixin, metaclass=ContainerRegistrar):
 
     Notes
     -----
+    Lists, tuples, and deques of many hashable elements are converted into a
+    temporary set when checking for several items, such that each item is
+    looked up in constant time instead of by scanning all elements. Items
+    not found in the set are looked for one by one to confirm that they are
+    indeed missing, such that the outcome does not depend on the conversion.
+
     For convenience, type checkers for built-in containers are attached as
     methods as well. If any of the optional arguments `every` and `some` are
     specified in calls to these methods, it (or they) are passed through to
@@ -57,28 +74,77 @@ class Contains(CompositionClassMixin, metaclass=ContainerRegistrar):
     """
 
     def __new__(cls, iterable, name=None, *, every=(), some=(), **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls.__string = cls.__string_for(iterable)
-        cls.__every = cls.__valid(every)
-        cls.__some = cls.__valid(some)
-        try:
-            all_in = all(item in iterable for item in cls.__every)
-            any_in = any(item in iterable for item in cls.__some)
-        except TypeError:
-            message = cls.__not_an_iterable_message()
-            log.error(message)
-            raise IterError(message)
-        if cls.__every and not all_in:
-            missing = tuple(filter(lambda x: x not in iterable, cls.__every))
-            message = cls.__some_missing_message_for(missing)
+        if LEVELS.off:
+            return iterable
+        every, some = cls.__valid(every), cls.__valid(some)
+        return cls.__check(iterable, name, every, some)
+
+    @classmethod
+    def bind(cls, *, every=(), some=()) -> Bound:
+        """Validates items once, returning a checker for just the iterable.
+
+        Parameters
+        ----------
+        every : tuple(object), optional
+            The item(s) that must (all) be contained in iterables.
+            Defaults to and empty tuple.
+        some : tuple(object), optional
+            The item(s) of which at least one must be contained in iterables.
+            Defaults to and empty tuple.
+
+        Returns
+        -------
+        Bound
+            Callable that checks if an iterable, with an optional name,
+            contains the items bound to it.
+
+        """
+        spec = {'every': every, 'some': some}
+        return Bound(cls, cls.__check, spec, cls.__valid(every),
+                     cls.__valid(some))
+
+    @classmethod
+    def __check(cls, iterable, name, every: ItemsT, some: ItemsT):
+        context = Context(iterable, name)
+        found = cls.__hashed(iterable, every, some)
+        if found is None:
+            try:
+                missing = tuple(filter(lambda x: x not in iterable, every))
+                any_in = any(item in iterable for item in some)
+            except TypeError:
+                message = cls.__not_an_iterable_message_for(context)
+                log.error(message)
+                raise IterError(message)
+        else:
+            missing, any_in = found
+        if missing:
+            message = cls.__some_missing_message_for(context, missing)
             log.error(message)
             raise ItemError(message)
-        if cls.__some and not any_in:
-            message = cls.__all_missing_message()
+        if some and not any_in:
+            message = cls.__all_missing_message_for(context, some)
             log.error(message)
             raise ItemError(message)
         return iterable
 
+    @staticmethod
+    def __hashed(iterable, every: ItemsT, some: ItemsT) -> Optional[Found]:
+        if type(iterable) not in SCANNED or len(iterable) < LARGE:
+            return None
+        if len(every) + len(some) < MANY:
+            return None
+        try:
+            present = set(iterable)
+            missing = tuple(item for item in every if item not in present)
+            any_in = not present.isdisjoint(some)
+        except TypeError:
+            return None
+        if missing:
+            missing = tuple(filter(lambda x: x not in iterable, missing))
+        if some and not any_in:
+            any_in = any(item in iterable for item in some)
+        return missing, any_in
+
     @classmethod
     def __valid(cls, items: ItemsT) -> ItemsT:
         if isinstance(items, str):
@@ -90,31 +156,31 @@ class Contains(CompositionClassMixin, metaclass=ContainerRegistrar):
         return items,
 
     @classmethod
-    def __not_an_iterable_message(cls) -> str:
-        return (f'{cls.__string.capitalize()} does not seem to '
+    def __not_an_iterable_message_for(cls, context: Context) -> str:
+        return (f'{cls.__string_for(context).capitalize()} does not seem to '
                 'be an iterable whose content could be checked!')
 
     @classmethod
-    def __some_missing_message_for(cls, missing: tuple) -> str:
+    def __some_missing_message_for(cls, context: Context, missing) -> str:
         only_one = len(missing) == 1
         type_of_first = type(missing[0]).__name__.capitalize()
         prefix = type_of_first if only_one else 'Items'
         items = missing[0] if only_one else missing
         verb = 'is' if only_one else 'are'
-        return f'{prefix} {items} {verb} not in {cls.__string}!'
+        return f'{prefix} {items} {verb} not in {cls.__string_for(context)}!'
 
     @classmethod
-    def __all_missing_message(cls) -> str:
-        only_one = len(cls.__some) == 1
-        type_of_first = type(cls.__some[0]).__name__.capitalize()
+    def __all_missing_message_for(cls, context: Context, some) -> str:
+        only_one = len(some) == 1
+        type_of_first = type(some[0]).__name__.capitalize()
         prefix = type_of_first if only_one else 'None of'
-        items = cls.__some[0] if only_one else cls.__some
+        items = some[0] if only_one else some
         verb = 'is not' if only_one else 'are'
-        return f'{prefix} {items} {verb} in {cls.__string}!'
-
-    @classmethod
-    def __string_for(cls, iterable) -> str:
-        type_name = type(iterable).__name__
-        if isinstance(iterable, NAMED_TYPES):
-            return type_name+' '+cls.__name if cls.__name else str(iterable)
-        return type_name + ' ' + (cls.__name or str(iterable))
+        return f'{prefix} {items} {verb} in {cls.__string_for(context)}!'
+
+    @staticmethod
+    def __string_for(context: Context) -> str:
+        type_name = context.type_name
+        if isinstance(context.value, NAMED_TYPES) and not context.name:
+            return context.string
+        return type_name + ' ' + context.string
@@ -1,7 +1,11 @@
 import logging as log
 from typing import Any, Tuple
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
+from ...functional.bound import Bound
+from ...functional.attrcache import AttrCache
 from ...exceptions import MissingAttrError, IdentifierError
+from ...levels import LEVELS
 
 
 class Has(CompositionClassMixin):
@@ -25,6 +29,9 @@ class Has(CompositionClassMixin):
 
     Methods
     -------
+    bind(attr) : Bound
+        Validates the specified attribute name(s) once and returns a callable
+        that only checks the object passed to it.
     o(callable) : CompositionOf
         Daisy-chains the attribute checker to another `callable`, returning
         the functional composition of both. If the optional argument `attr` is
@@ -39,18 +46,57 @@ class Has(CompositionClassMixin):
     MissingAttrError
         If `obj` does not have (all of) the specified attribute(s).
 
+    Notes
+    -----
+    Which of the attributes to check for are provided by the type of `obj`
+    to all of its instances is looked up only once per type and kept in a
+    small cache. Only the rest of them is looked for on `obj` itself. If the
+    type is mutated, what it provides is looked up again.
+
     See Also
     --------
     CompositionOf
 
     """
 
+    _provided = AttrCache()
+
     def __new__(cls, obj, name: str = None, *, attr='__new__', **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls.__attrs = cls.__valid(attr)
-        for attr in cls.__attrs:
+        if LEVELS.off:
+            return obj
+        return cls.__check(obj, name, cls.__valid(attr))
+
+    @classmethod
+    def bind(cls, *, attr='__new__') -> Bound:
+        """Validates attribute names once, returning a checker for the object.
+
+        Parameters
+        ----------
+        attr : str, tuple(str), optional
+            String or tuple of strings with the name(s) of the attributes to
+            check for. Defaults to '__new__'.
+
+        Returns
+        -------
+        Bound
+            Callable that checks if an object, with an optional name, has
+            (all of) the attribute(s) bound to it.
+
+        Raises
+        ------
+        IdentifierError
+            If (one of) the attribute name(s) to check for is not a valid
+            python identifier.
+
+        """
+        return Bound(cls, cls.__check, {'attr': attr}, cls.__valid(attr))
+
+    @classmethod
+    def __check(cls, obj, name, attrs: Tuple[str]):
+        for attr in cls._provided.unverified(type(obj), attrs):
             if not hasattr(obj, attr):
-                message = (f'{cls.__string_for(obj)} does not'
+                string_for = cls.__string_for(Context(obj, name))
+                message = (f'{string_for} does not'
                            f' have required attribute {attr}!')
                 log.error(message)
                 raise MissingAttrError(message)
@@ -76,9 +122,8 @@ class Has(CompositionClassMixin):
         message = f'Attribute name {attr} is not a valid identifier!'
         raise IdentifierError(message)
 
-    @classmethod
-    def __string_for(cls, obj) -> str:
-        type_name = type(obj).__name__
-        if cls.__name:
-            return f'Object {cls.__name} of type {type_name}'
-        return type_name
+    @staticmethod
+    def __string_for(context: Context) -> str:
+        if context.name:
+            return f'Object {context.name} of type {context.type_name}'
+        return context.type_name
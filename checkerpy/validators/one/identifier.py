@@ -1,6 +1,9 @@
 import logging as log
+from keyword import iskeyword
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
 from ...exceptions import IdentifierError
+from ...levels import LEVELS
 from .registrars import StrRegistrar, NAMED_TYPES
 
 
@@ -14,6 +17,9 @@ class Identifier(CompositionClassMixin, metaclass=StrRegistrar):
     name : str, optional
         The name of the variable to check for being an identifier.
         Defaults to None.
+    strict : bool, optional
+        Whether to reject python keywords as well, which are identifiers but
+        cannot be used as names of variables or attributes. Defaults to False.
 
     Returns
     -------
@@ -32,7 +38,8 @@ class Identifier(CompositionClassMixin, metaclass=StrRegistrar):
     Raises
     ------
     IdentifierError
-        If `string` is either not a string or not a valid identifier.
+        If `string` is either not a string or not a valid identifier or,
+        in `strict` mode, a keyword.
 
     See Also
     --------
@@ -40,26 +47,34 @@ class Identifier(CompositionClassMixin, metaclass=StrRegistrar):
 
     """
 
-    def __new__(cls, string: str, name: str = None, **kwargs) -> str:
-        cls.__name = str(name) if name is not None else ''
-        cls.__string = cls.__string_for(string)
+    def __new__(cls, string: str, name: str = None, *,
+                strict: bool = False, **kwargs) -> str:
+        if LEVELS.off:
+            return string
         try:
             string_is_identifier = string.isidentifier()
         except AttributeError:
             string_is_identifier = False
         if not string_is_identifier:
-            message = f'{cls.__string} is not a valid identifier!'
+            string_for = cls.__string_for(Context(string, name))
+            message = f'{string_for} is not a valid identifier!'
+            log.error(message)
+            raise IdentifierError(message)
+        if strict and iskeyword(string):
+            string_for = cls.__string_for(Context(string, name))
+            message = f'{string_for} is a reserved keyword!'
             log.error(message)
             raise IdentifierError(message)
         return string
 
-    @classmethod
-    def __string_for(cls, string: str) -> str:
+    @staticmethod
+    def __string_for(context: Context) -> str:
+        string = context.value
         if isinstance(string, str):
-            with_value = f'Value {string} of str {cls.__name}'
-            return with_value if cls.__name else string
+            with_value = f'Value {string} of str {context.name}'
+            return with_value if context.name else string
         if isinstance(string, NAMED_TYPES):
-            type_of = f'{type(string).__name__} ' if cls.__name else ''
+            type_of = f'{context.type_name} ' if context.name else ''
         else:
-            type_of = f'{type(string).__name__} '
-        return type_of + (cls.__name or str(string))
+            type_of = f'{context.type_name} '
+        return type_of + context.string
@@ -0,0 +1,301 @@
+import logging as log
+from functools import lru_cache
+from operator import lt, le, gt, ge, is_
+from typing import Iterable, Any
+from ...functional.mixins import CompositionMixin
+from ...functional.context import Context, Deferred
+from ...functional.iteration import check_all, CONTAINERS
+from ...functional.arrays import numeric_array, vectorizable
+from ...functional.arrays import first_outside, position_of
+from ...exceptions import LimitError, WrongTypeError
+from ...levels import LEVELS
+from .registrars import NAMED_TYPES
+
+COMPARISONS = {'both': (lt, gt), 'left': (lt, ge),
+               'right': (le, gt), 'neither': (le, ge)}
+ORDERED = frozenset({bool, int, float, str, bytes})
+NOWHERE = object()
+
+
+class Interval(CompositionMixin):
+    """Checks if values lie inside an interval with given bounds.
+
+    Bounds are normalized only once, when the interval is created, such that
+    checking a value merely compares it to them. Many values can be checked
+    against the same interval at once with `check_many`. Intervals are
+    immutable and hashable (if their bounds are) and compare equal if their
+    bounds and the kind of closure are equal.
+
+    Parameters
+    ----------
+    lo : optional
+        Lower bound of the interval. Defaults to Ellipsis, i.e., none.
+    hi : optional
+        Upper bound of the interval. Defaults to Ellipsis, i.e., none.
+    closed : str, optional
+        Which bound(s) belong to the interval. One of 'both', 'left', 'right',
+        or 'neither'. Defaults to 'both'.
+
+    Returns
+    -------
+    Interval
+        Callable that checks if a value, with an optional name, lies inside
+        the interval and returns it if it does.
+
+    Methods
+    -------
+    check_many(iterable, name, sample, seed)
+        Checks if all elements of an iterable lie inside the interval.
+    o(callable) : CompositionOf
+        Daisy-chains the interval to another `callable`, returning the
+        functional composition of both.
+
+    Raises
+    ------
+    ValueError
+        If `closed` is not one of 'both', 'left', 'right', or 'neither'.
+
+    Examples
+    --------
+    >>> unit = Interval(0, 1, closed='left')
+    >>> unit(0.5, 'x')
+    0.5
+    >>> unit.check_many([0, 0.25, 0.5], 'xs')
+    [0, 0.25, 0.5]
+
+    See Also
+    --------
+    Limited, AllLimited
+
+    """
+
+    def __init__(self, lo: Any = ..., hi: Any = ...,
+                 closed: str = 'both') -> None:
+        try:
+            below, above = COMPARISONS[closed]
+        except (KeyError, TypeError) as error:
+            message = ("Argument closed must be one of 'both', 'left',"
+                       f" 'right', or 'neither', not {closed}!")
+            raise ValueError(message) from error
+        self.__lo = lo
+        self.__hi = hi
+        self.__closed = closed
+        self.__below = below
+        self.__above = above
+        # A missing bound is never crossed, because no value is NOWHERE.
+        unbounded = is_, NOWHERE
+        self.__lower = unbounded if lo is Ellipsis else (below, lo)
+        self.__upper = unbounded if hi is Ellipsis else (above, hi)
+
+    @property
+    def lo(self) -> Any:
+        return self.__lo
+
+    @property
+    def hi(self) -> Any:
+        return self.__hi
+
+    @property
+    def closed(self) -> str:
+        return self.__closed
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.__key() == other.__key()
+
+    def __hash__(self) -> int:
+        return hash(self.__key())
+
+    def __call__(self, value: Any, name: str = None, **kwargs) -> Any:
+        if LEVELS.off:
+            return value
+        below, lo = self.__lower
+        above, hi = self.__upper
+        try:
+            too_small = below(value, lo)
+            too_large = above(value, hi)
+        except TypeError as error:
+            message = self.__uncomparable_message_for(Context(value, name))
+            log.error(message)
+            raise WrongTypeError(message) from error
+        if too_small or too_large:
+            message = self.__outside_message_for(Context(value, name))
+            log.error(message)
+            raise LimitError(message)
+        return value
+
+    def check_many(self, iterable: Iterable, name: str = None, *,
+                   sample: int = None, seed: Any = None, **kwargs) -> Any:
+        """Checks if all elements of an iterable lie inside the interval.
+
+        Numpy arrays of booleans or numbers (of any shape) are compared to
+        numeric bounds all at once, with a single reduction. Built-in
+        containers of numbers, strings, or bytes are reduced with `min`
+        and/or `max` instead of comparing every element to the bounds. Only
+        if that is inconclusive or reveals an element outside the interval,
+        elements are checked one by one, stopping at the first that fails.
+        Just like for single values, NaNs never lie outside.
+
+        Parameters
+        ----------
+        iterable
+            The iterable to check the elements of.
+        name : str, optional
+            The name of the variable to check the elements of.
+            Defaults to None.
+        sample : int, optional
+            Maximum number of elements to check in sequences, always
+            including the first and the last. Defaults to None, which
+            checks all elements.
+        seed : optional
+            Seed for choosing a `sample` of elements at random. Defaults to
+            None, which spaces them evenly across the sequence.
+
+        Returns
+        -------
+        iterable
+            The `iterable` passed in or, if that is an iterator, an iterator
+            that yields its elements after checking each of them.
+
+        Raises
+        ------
+        IterError
+            If `iterable` is not, in fact, an iterable.
+        WrongTypeError
+            If an element cannot be compared to the bounds.
+        LimitError
+            If an element lies outside the interval.
+        ValueError
+            If the `sample` size is not an integer larger than 1.
+
+        """
+        if LEVELS.off:
+            return iterable
+        lo, hi = self.__lo, self.__hi
+        array = numeric_array(iterable)
+        if array is not None and vectorizable(lo) and vectorizable(hi):
+            index = first_outside(array, lo, hi, self.__below, self.__above)
+            if index is not None:
+                context = Context(iterable, name)
+                position = position_of(array, index)
+                _ = self.__check(context, position, array.flat[index])
+            return iterable
+        if sample is None and type(iterable) in CONTAINERS:
+            if self.__accepts(iterable):
+                return iterable
+        context = Context(iterable, name)
+        return check_all(context, self.__check, sample=sample, seed=seed,
+                         accept=self.__accepts)
+
+    def __key(self) -> tuple:
+        return self.__lo, self.__hi, self.__closed
+
+    def __accepts(self, elements: Iterable) -> bool:
+        if type(elements) not in CONTAINERS:
+            elements = tuple(elements)
+        if not elements:
+            return True
+        if not ORDERED.issuperset(map(type, elements)):
+            return False
+        try:
+            if self.__lo is not Ellipsis:
+                lowest = min(elements)
+                if lowest != lowest or self.__below(lowest, self.__lo):
+                    return False
+            if self.__hi is not Ellipsis:
+                highest = max(elements)
+                if highest != highest or self.__above(highest, self.__hi):
+                    return False
+        except TypeError:
+            return False
+        return True
+
+    def __check(self, context: Context, index, value: Any) -> Any:
+        return self(value, Deferred(self.__name_from, context, index))
+
+    def __uncomparable_message_for(self, context: Context) -> str:
+        lo_type = type(self.__lo).__name__
+        hi_type = type(self.__hi).__name__
+        if isinstance(context.value, NAMED_TYPES) and not context.name:
+            type_of = ''
+        else:
+            type_of = f'type {context.type_name} of '
+        return (f'Cannot compare {type_of}{context.string}'
+                f' with limits of types {lo_type} and {hi_type}!')
+
+    def __outside_message_for(self, context: Context) -> str:
+        lo, hi = self.__lo, self.__hi
+        lo_open = self.__below is le
+        hi_open = self.__above is ge
+        if lo in (float('-inf'), Ellipsis):
+            left = '(-inf'
+        else:
+            left = f'({lo}' if lo_open else f'[{lo}'
+        if hi in (float('+inf'), Ellipsis):
+            right = 'inf)'
+        else:
+            right = f'{hi})' if hi_open else f'{hi}]'
+        value_name = ' of '+context.name if context.name else ''
+        return (f'Value {context.value}{value_name} lies outside the'
+                f' allowed interval {left}, {right}!')
+
+    @classmethod
+    def __name_from(cls, context: Context, index) -> str:
+        name, string = context.name, context.string
+        itertype = context.type_name
+        named = f'{itertype} {name}' if name else string
+        if itertype == 'dict':
+            return f'key in dict {string}'
+        elif itertype in ('dict_keys', 'odict_keys'):
+            return f'key in dict {string}' if name else string
+        elif itertype in ('dict_values', 'odict_values'):
+            return f'dict value in {string}' if name else string
+        elif itertype in ('dict_items', 'odict_items'):
+            return f'item in dict {string}' if name else string
+        elif itertype in ('OrderedDict', 'defaultdict'):
+            return f'key in {named}'
+        elif itertype == 'frozenset':
+            return f'element in {named}'
+        elif itertype == 'deque':
+            return f'{named} at index {index}'
+        prefix, postfix = cls.__fixes_for(index)
+        return f'{prefix}{itertype} {string}{postfix}'
+
+    @staticmethod
+    def __fixes_for(index) -> (str, str):
+        if type(index) is tuple:
+            return '', f' at index {index}'
+        prefix = '' if index >= 0 else 'element in '
+        postfix = f' at index {index}' if index >= 0 else ''
+        return prefix, postfix
+
+
+_cached_interval = lru_cache(maxsize=1024, typed=True)(Interval)
+
+
+def interval_for(lo: Any, hi: Any) -> Interval:
+    """Closed interval with the given bounds, shared between calls.
+
+    Intervals are cached by their bounds and the types thereof, such that
+    bounds that merely compare equal, like 0 and 0.0, do not share an
+    interval that would report bounds of the wrong type. Unhashable bounds
+    get a new interval every time.
+
+    Parameters
+    ----------
+    lo
+        Lower bound of the interval or Ellipsis if there is none.
+    hi
+        Upper bound of the interval or Ellipsis if there is none.
+
+    Returns
+    -------
+    Interval
+        Interval including both bounds.
+
+    """
+    try:
+        return _cached_interval(lo, hi)
+    except TypeError:
+        return Interval(lo, hi)
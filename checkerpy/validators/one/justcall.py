@@ -1,7 +1,9 @@
 import logging as log
 from typing import Callable
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
 from ...exceptions import CallableError
+from ...levels import LEVELS
 from .registrars import NAMED_TYPES
 
 
@@ -38,23 +40,19 @@ class JustCall(CompositionClassMixin):
     """
 
     def __new__(cls, callbl: Callable, name: str = None, **kwargs) -> Callable:
-        if name is not None:
-            cls.__name = str(name)
-        elif hasattr(callbl, '__name__'):
-            cls.__name = callbl.__name__
-        else:
-            cls.__name = ''
-        cls.__string = cls.__name or str(callbl)
+        if LEVELS.off:
+            return callbl
         if not callable(callbl):
-            message = cls.__not_callable_message_for(callbl)
+            if name is None:
+                name = getattr(callbl, '__name__', None)
+            message = cls.__not_callable_message_for(Context(callbl, name))
             log.error(message)
             raise CallableError(message)
         return callbl
 
-    @classmethod
-    def __not_callable_message_for(cls, callbl: Callable) -> str:
-        if isinstance(callbl, NAMED_TYPES):
-            of_type = f' of type {type(callbl).__name__}' if cls.__name else ''
-        else:
-            of_type = f' of type {type(callbl).__name__}'
-        return f'Object {cls.__string}{of_type} is not callable!'
+    @staticmethod
+    def __not_callable_message_for(context: Context) -> str:
+        of_type = f' of type {context.type_name}'
+        if isinstance(context.value, NAMED_TYPES) and not context.name:
+            of_type = ''
+        return f'Object {context.string}{of_type} is not callable!'
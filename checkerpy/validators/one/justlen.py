@@ -1,9 +1,15 @@
 import logging as log
-from typing import Any, Sized
+from sys import maxsize
+from typing import Any, Sized, Union
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
+from ...functional.bound import Bound
 from ...exceptions import LenError, IntError
+from ...levels import LEVELS
 from .registrars import SizedRegistrar, NAMED_TYPES
 
+Lengths = Union[tuple, range]
+
 
 class JustLen(CompositionClassMixin, metaclass=SizedRegistrar):
     """Checks if the length of an iterable is one of the specified lengths.
@@ -14,8 +20,13 @@ class JustLen(CompositionClassMixin, metaclass=SizedRegistrar):
         The iterable to check the length of.
     name : str, optional
         The name of the variable to check the length of. Defaults to None.
-    length : int, tuple(int)
-        One or more lengths that `iterable` should have.
+    length : int, tuple(int), range, optional
+        One or more lengths that `iterable` should have. Defaults to None,
+        in which case `min_len` and/or `max_len` must be given instead.
+    min_len : int, optional
+        Minimum length that `iterable` should have. Defaults to None.
+    max_len : int, optional
+        Maximum length that `iterable` should have. Defaults to None.
 
     Returns
     -------
@@ -24,6 +35,9 @@ class JustLen(CompositionClassMixin, metaclass=SizedRegistrar):
 
     Methods
     -------
+    bind(length, min_len, max_len) : Bound
+        Validates the specified length(s) once and returns a callable that
+        only checks the length of the iterable passed to it.
     o(callable) : CompositionOf
         Daisy-chains the length checker to another `callable`, returning the
         functional composition of both. If the optional argument `length` is
@@ -36,6 +50,9 @@ class JustLen(CompositionClassMixin, metaclass=SizedRegistrar):
     methods as well. If the optional argument `length` is specified in calls
     to these methods, it is passed through to the length checker.
 
+    Lengths given as a range or as `min_len` and/or `max_len` are checked in
+    constant time, no matter how many lengths are allowed.
+
     Raises
     ------
     LenError
@@ -43,6 +60,11 @@ class JustLen(CompositionClassMixin, metaclass=SizedRegistrar):
         of `iterable` is not among the allowed lengths.
     IntError
         If the specified length(s) cannot be converted to required type int.
+    TypeError
+        If neither `length` nor `min_len` or `max_len` are specified.
+    ValueError
+        If `length` is specified together with `min_len` and/or `max_len`,
+        if `length` is an empty range, or if `min_len` exceeds `max_len`.
 
     See Also
     --------
@@ -50,24 +72,87 @@ class JustLen(CompositionClassMixin, metaclass=SizedRegistrar):
 
     """
 
-    def __new__(cls, iterable: Sized, name=None, *, length, **kwargs) -> Sized:
-        cls.__name = str(name) if name is not None else ''
-        cls.__string = cls.__name or str(iterable)
-        cls.__lengths = cls.__valid(length)
+    def __new__(cls, iterable: Sized, name=None, *, length=None,
+                min_len: int = None, max_len: int = None, **kwargs) -> Sized:
+        if LEVELS.off:
+            return iterable
+        lengths = cls.__valid(length, min_len, max_len)
+        return cls.__check(iterable, name, lengths)
+
+    @classmethod
+    def bind(cls, *, length=None, min_len: int = None,
+             max_len: int = None) -> Bound:
+        """Validates lengths once, returning a checker for just the value.
+
+        Parameters
+        ----------
+        length : int, tuple(int), range, optional
+            One or more lengths that iterables should have. Defaults to None,
+            in which case `min_len` and/or `max_len` must be given instead.
+        min_len : int, optional
+            Minimum length that iterables should have. Defaults to None.
+        max_len : int, optional
+            Maximum length that iterables should have. Defaults to None.
+
+        Returns
+        -------
+        Bound
+            Callable that checks the length of an iterable, with an optional
+            name, against the lengths bound to it.
+
+        Raises
+        ------
+        IntError
+            If the specified length(s) cannot be converted to type int.
+        TypeError
+            If neither `length` nor `min_len` or `max_len` are specified.
+        ValueError
+            If `length` is specified together with `min_len` and/or
+            `max_len`, if `length` is an empty range, or if `min_len`
+            exceeds `max_len`.
+
+        """
+        spec = {'length': length, 'min_len': min_len, 'max_len': max_len}
+        spec = {key: value for key, value in spec.items() if value is not None}
+        lengths = cls.__valid(length, min_len, max_len)
+        return Bound(cls, cls.__check, spec, lengths)
+
+    @classmethod
+    def __check(cls, iterable: Sized, name, lengths: Lengths) -> Sized:
         try:
             length_of_iterable = len(iterable)
         except TypeError as error:
-            message = cls.__has_no_length_message_for(iterable)
+            message = cls.__has_no_length_message_for(Context(iterable, name))
             log.error(message)
             raise LenError(message) from error
-        if length_of_iterable not in cls.__lengths:
-            message = cls.__wrong_length_message_for(iterable)
+        if length_of_iterable not in lengths:
+            context = Context(iterable, name)
+            message = cls.__wrong_length_message_for(context, lengths)
             log.error(message)
             raise LenError(message)
         return iterable
 
     @classmethod
-    def __valid(cls, lengths: Any) -> tuple:
+    def __valid(cls, lengths: Any, min_len: Any, max_len: Any) -> Lengths:
+        if min_len is not None or max_len is not None:
+            if lengths is not None:
+                raise ValueError('Specify either length or min_len and/or'
+                                 ' max_len, but not both!')
+            lo = 0 if min_len is None else cls.__converted(min_len)
+            hi = maxsize - 1 if max_len is None else cls.__converted(max_len)
+            if hi < 0:
+                raise ValueError(f'Maximum length {hi} must not be negative!')
+            if lo > hi:
+                raise ValueError(f'Minimum length {lo} must not'
+                                 f' exceed maximum length {hi}!')
+            return range(max(lo, 0), hi + 1)
+        if lengths is None:
+            raise TypeError('Specify either length or min_len and/or'
+                            ' max_len to check the length against!')
+        if type(lengths) is range:
+            if not lengths:
+                raise ValueError(f'Allowed lengths {lengths} are empty!')
+            return lengths
         try:
             converted = tuple(map(cls.__converted, lengths))
         except TypeError:
@@ -93,23 +178,36 @@ class JustLen(CompositionClassMixin, metaclass=SizedRegistrar):
                 f'{with_type} to required type int!')
 
     @classmethod
-    def __has_no_length_message_for(cls, value: Any) -> str:
-        type_name = cls.__type_name_of(value)
-        return f'Length of {type_name}{cls.__string} cannot be determined!'
+    def __has_no_length_message_for(cls, context: Context) -> str:
+        type_name = cls.__type_name_of(context)
+        return f'Length of {type_name}{context.string} cannot be determined!'
 
     @classmethod
-    def __wrong_length_message_for(cls, iterable: Sized) -> str:
-        if len(cls.__lengths) == 1:
-            of_length = cls.__lengths[0]
+    def __wrong_length_message_for(cls, context: Context, lengths) -> str:
+        if type(lengths) is range and lengths.step == 1:
+            of_length = cls.__range_string_for(lengths)
+        elif len(lengths) == 1:
+            of_length = lengths[0]
         else:
-            of_length = f'one of {cls.__lengths}'
-        actual_length = len(iterable)
-        type_name = cls.__type_name_of(iterable)
-        return (f'Length of {type_name}{cls.__string} must'
+            of_length = f'one of {lengths}'
+        actual_length = len(context.value)
+        type_name = cls.__type_name_of(context)
+        return (f'Length of {type_name}{context.string} must'
                 f' be {of_length}, not {actual_length}!')
 
-    @classmethod
-    def __type_name_of(cls, iterable: Sized) -> str:
-        if isinstance(iterable, NAMED_TYPES) and not cls.__name:
+    @staticmethod
+    def __range_string_for(lengths: range) -> str:
+        lo, hi = lengths.start, lengths.stop - 1
+        if hi == lo:
+            return f'{lo}'
+        if lengths.stop >= maxsize:
+            return f'at least {lo}'
+        if lo <= 0:
+            return f'at most {hi}'
+        return f'between {lo} and {hi}'
+
+    @staticmethod
+    def __type_name_of(context: Context) -> str:
+        if isinstance(context.value, NAMED_TYPES) and not context.name:
             return ''
-        return type(iterable).__name__ + ' '
+        return context.type_name + ' '
@@ -1,12 +1,10 @@
-import logging as log
 from ...functional.mixins import CompositionClassMixin
-from ...functional import CompositionOf
+from ...functional.lazy import LazyComposition
 from ...types.one import _COMPARABLES
 from ...types.weak import _LIKE_COMPARABLES
-from ...exceptions import LimitError, WrongTypeError
 from .nonempty import NonEmpty
 from .justlen import JustLen
-from .registrars import NAMED_TYPES
+from .interval import interval_for
 
 
 class ComparableRegistrar(type):
@@ -14,11 +12,11 @@ class ComparableRegistrar(type):
     def __init__(cls, class_name: str, bases, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
         for comparable in _COMPARABLES:
-            setattr(cls, comparable.__name__, CompositionOf(cls, comparable))
+            setattr(cls, comparable.__name__, LazyComposition(comparable))
         for comparable in _LIKE_COMPARABLES:
-            setattr(cls, comparable.__name__, CompositionOf(cls, comparable))
-        setattr(cls, 'NonEmpty', CompositionOf(cls, NonEmpty))
-        setattr(cls, 'JustLen', CompositionOf(cls, JustLen))
+            setattr(cls, comparable.__name__, LazyComposition(comparable))
+        setattr(cls, 'NonEmpty', LazyComposition(NonEmpty))
+        setattr(cls, 'JustLen', LazyComposition(JustLen))
 
 
 class Limited(CompositionClassMixin, metaclass=ComparableRegistrar):
@@ -63,41 +61,9 @@ class Limited(CompositionClassMixin, metaclass=ComparableRegistrar):
 
     See Also
     --------
-    CompositionOf
+    Interval, CompositionOf
 
     """
 
     def __new__(cls, value, name: str = None, *, lo=..., hi=..., **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        try:
-            value_too_small = False if lo is Ellipsis else value < lo
-            value_too_large = False if hi is Ellipsis else value > hi
-        except TypeError as error:
-            message = cls.__uncomparable_type_message_for(value, lo, hi)
-            log.error(message)
-            raise WrongTypeError(message) from error
-        if value_too_small or value_too_large:
-            message = cls.__value_out_of_bounds_message_for(value, lo, hi)
-            log.error(message)
-            raise LimitError(message)
-        return value
-
-    @classmethod
-    def __uncomparable_type_message_for(cls, value, lo, hi) -> str:
-        lo_type = type(lo).__name__
-        hi_type = type(hi).__name__
-        value_name = cls.__name or str(value)
-        if isinstance(value, NAMED_TYPES) and not cls.__name:
-            type_of = ''
-        else:
-            type_of = f'type {type(value).__name__} of '
-        return (f'Cannot compare {type_of}{value_name}'
-                f' with limits of types {lo_type} and {hi_type}!')
-
-    @classmethod
-    def __value_out_of_bounds_message_for(cls, value, lo, hi) -> str:
-        left = '(-inf' if lo in (float('-inf'), Ellipsis) else f'[{lo}'
-        right = 'inf)' if hi in (float('+inf'), Ellipsis) else f'{hi}]'
-        value_name = ' of '+cls.__name if cls.__name else ''
-        return (f'Value {value}{value_name} lies outside the'
-                f' allowed interval {left}, {right}!')
+        return interval_for(lo, hi)(value, name)
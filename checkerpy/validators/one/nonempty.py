@@ -1,7 +1,9 @@
 import logging as log
 from typing import Sized
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
 from ...exceptions import EmptyError
+from ...levels import LEVELS
 from .registrars import SizedRegistrar
 
 
@@ -44,27 +46,29 @@ class NonEmpty(CompositionClassMixin, metaclass=SizedRegistrar):
     """
 
     def __new__(cls, iterable: Sized, name: str = None, **kwargs) -> Sized:
-        cls.__name = str(name) if name is not None else ''
+        if LEVELS.off:
+            return iterable
         try:
             length_of_sizable = len(iterable)
         except TypeError as error:
-            message = cls.__cannot_be_empty_message_for(iterable)
+            context = Context(iterable, name)
+            message = cls.__cannot_be_empty_message_for(context)
             log.error(message)
             raise EmptyError(message) from error
         if length_of_sizable == 0:
-            message = cls.__is_empty_message_for(iterable)
+            message = cls.__is_empty_message_for(Context(iterable, name))
             log.error(message)
             raise EmptyError(message)
         return iterable
 
-    @classmethod
-    def __cannot_be_empty_message_for(cls, variable) -> str:
-        var_name = (cls.__name or str(variable)) + ' with '
-        type_name = type(variable).__name__
+    @staticmethod
+    def __cannot_be_empty_message_for(context: Context) -> str:
+        var_name = context.string + ' with '
+        type_name = context.type_name
         return f'Emptiness of {var_name}type {type_name} cannot be determined!'
 
-    @classmethod
-    def __is_empty_message_for(cls, iterable: Sized) -> str:
-        iter_name = ' '+cls.__name if cls.__name else ''
-        type_name = type(iterable).__name__
+    @staticmethod
+    def __is_empty_message_for(context: Context) -> str:
+        iter_name = ' '+context.name if context.name else ''
+        type_name = context.type_name
         return type_name.capitalize() + iter_name + ' must not be empty!'
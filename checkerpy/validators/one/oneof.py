@@ -1,7 +1,10 @@
 import logging as log
-from typing import Any
 from ...functional.mixins import CompositionClassMixin
+from ...functional.context import Context
+from ...functional.bound import Bound
+from ...functional.indexcache import IndexCache, Index, index_of
 from ...exceptions import ItemError
+from ...levels import LEVELS
 from .registrars import NAMED_TYPES
 
 
@@ -25,6 +28,9 @@ class OneOf(CompositionClassMixin):
 
     Methods
     -------
+    bind(items) : Bound
+        Binds the specified item(s) once and returns a callable that only
+        checks the value passed to it.
     o(callable) : CompositionOf
         Daisy-chains the value checker to another `callable`, returning the
         functional composition of both.
@@ -37,6 +43,12 @@ class OneOf(CompositionClassMixin):
 
     Notes
     -----
+    Membership in tuples of many hashable items is decided with a hash index
+    that is built once per tuple and kept in a small cache, such that it
+    takes constant rather than linear time. Values not found in the index
+    are looked for in `items` one by one, just as for all other kinds of
+    `items`, such that the outcome never depends on the index.
+
     If `value` is an iterable that is to be checked for equality with just
     a single `item` that is also an iterable, the latter must be enclosed in
     a tuple of length one.
@@ -50,56 +62,97 @@ class OneOf(CompositionClassMixin):
 
     """
 
+    _indices = IndexCache()
+
     def __new__(cls, value, name: str = None, *, items=(), **kwargs):
-        cls.__name = str(name) if name is not None else ''
-        cls.__string = cls.__name or str(value)
-        cls.__items = items
+        if LEVELS.off:
+            return value
+        return cls.__check(value, name, items, cls._indices.index(items))
+
+    @classmethod
+    def bind(cls, *, items=()) -> Bound:
+        """Binds items once, returning a checker for just the value.
+
+        Parameters
+        ----------
+        items : object, tuple(object), optional
+            The item(s) for which to check if values are one of them.
+            Defaults to and empty tuple.
+
+        Returns
+        -------
+        Bound
+            Callable that checks if a value, with an optional name, is one
+            of the items bound to it.
+
+        Notes
+        -----
+        Tuples or lists of many hashable items are indexed when binding.
+        Should you change a list of items afterwards, bind it again.
+
+        """
+        return Bound(cls, cls.__check, {'items': items}, items,
+                     index_of(items))
+
+    @classmethod
+    def __check(cls, value, name, items, index: Index):
+        if index is not None:
+            try:
+                if value in index:
+                    return value
+            except TypeError:
+                pass
         try:
             value_not_in_items = value not in items
         except TypeError as error:
-            message = cls.__cant_determine_membership_message_for(value)
+            context = Context(value, name)
+            message = cls.__cant_determine_membership_message_for(context,
+                                                                  items)
             log.error(message)
             raise ItemError(message) from error
         if value_not_in_items:
-            message = cls.__not_in_items_message_for(value)
+            context = Context(value, name)
+            message = cls.__not_in_items_message_for(context, items)
             log.error(message)
             raise ItemError(message)
         return value
 
     @classmethod
-    def __cant_determine_membership_message_for(cls, value: Any) -> str:
-        return (f'Cannot determine if {cls.__type_of(value)}'
-                f'{cls.__string} is {cls.__one_of_items()}!')
+    def __cant_determine_membership_message_for(cls, context: Context,
+                                                items) -> str:
+        return (f'Cannot determine if {cls.__type_of(context)}'
+                f'{context.string} is {cls.__one_of(items)}!')
 
     @classmethod
-    def __not_in_items_message_for(cls, value: Any) -> str:
-        return f'{cls.__value_of(value)} is not {cls.__one_of_items()}!'
+    def __not_in_items_message_for(cls, context: Context, items) -> str:
+        return f'{cls.__value_of(context)} is not {cls.__one_of(items)}!'
 
-    @classmethod
-    def __one_of_items(cls) -> str:
+    @staticmethod
+    def __one_of(items) -> str:
         try:
-            number_of_items = len(cls.__items)
+            number_of_items = len(items)
         except TypeError:
             number_of_items = ...
         if number_of_items == 1:
             try:
-                items_string = cls.__items[0]
+                items_string = items[0]
             except (TypeError, IndexError, KeyError):
-                items_string = f'one of {cls.__items}'
-        elif isinstance(cls.__items, str):
-            items_string = f'in str {cls.__items}'
+                items_string = f'one of {items}'
+        elif isinstance(items, str):
+            items_string = f'in str {items}'
         else:
-            items_string = f'one of {cls.__items}'
+            items_string = f'one of {items}'
         return items_string
 
-    @classmethod
-    def __type_of(cls, value: Any) -> str:
-        if isinstance(value, NAMED_TYPES) and not cls.__name:
+    @staticmethod
+    def __type_of(context: Context) -> str:
+        if isinstance(context.value, NAMED_TYPES) and not context.name:
             return ''
-        return f'{type(value).__name__ } '
+        return f'{context.type_name} '
 
     @classmethod
-    def __value_of(cls, value: Any) -> str:
-        if not isinstance(value, NAMED_TYPES) and cls.__name:
-            return f'Value {value} of {cls.__type_of(value)}{cls.__string}'
-        return f'{cls.__type_of(value)}{cls.__string}'
+    def __value_of(cls, context: Context) -> str:
+        type_of = cls.__type_of(context)
+        if not isinstance(context.value, NAMED_TYPES) and context.name:
+            return f'Value {context.value} of {type_of}{context.string}'
+        return f'{type_of}{context.string}'
@@ -2,7 +2,7 @@ from typing import Tuple
 from collections import defaultdict, deque, OrderedDict
 from ...types.one import JustStr, _ITERABLES
 from ...types.weak import LikeSized, LikeContainer, _LIKE_ITERABLES
-from ...functional import CompositionOf
+from ...functional.lazy import LazyComposition
 
 dict_keys = type({}.keys())
 odict_keys = type(OrderedDict({}).keys())
@@ -23,27 +23,27 @@ class IterableRegistrar(type):
     def __init__(cls, class_name: str, bases: Types, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
         for iterable in _ITERABLES:
-            setattr(cls, iterable.__name__, CompositionOf(cls, iterable))
+            setattr(cls, iterable.__name__, LazyComposition(iterable))
         for iterable in _LIKE_ITERABLES:
-            setattr(cls, iterable.__name__, CompositionOf(cls, iterable))
+            setattr(cls, iterable.__name__, LazyComposition(iterable))
 
 
 class SizedRegistrar(IterableRegistrar):
     """Sets composition of class and LikeSized checker as attribute"""
     def __init__(cls, class_name: str, bases: Types, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
-        setattr(cls, 'LikeSized', CompositionOf(cls, LikeSized))
+        setattr(cls, 'LikeSized', LazyComposition(LikeSized))
 
 
 class ContainerRegistrar(IterableRegistrar):
     """Sets compositions of class and container-like checkers as attributes"""
     def __init__(cls, class_name: str, bases: Types, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
-        setattr(cls, 'LikeContainer', CompositionOf(cls, LikeContainer))
+        setattr(cls, 'LikeContainer', LazyComposition(LikeContainer))
 
 
 class StrRegistrar(type):
     """Sets composition of class and JustStr as attribute."""
     def __init__(cls, class_name: str, bases: Types, attributes: dict) -> None:
         super().__init__(class_name, bases, attributes)
-        setattr(cls, 'JustStr', CompositionOf(cls, JustStr))
+        setattr(cls, 'JustStr', LazyComposition(JustStr))